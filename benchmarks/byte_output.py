@@ -0,0 +1,90 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Decode time of many hashes, account ids and signatures with the hex, bytes and memoryview byte output of
+# the decode context, and of the hex output followed by the conversion back to bytes for storage.
+# Also measures Bytes values with and without the UTF-8 attempt.
+#
+# Usage: python benchmarks/byte_output.py [number_of_values]
+
+import sys
+import time
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from scalecodec.base import ScaleDecoder, ScaleBytes, DecodeContext
+
+
+def timed(func, repeat=5):
+    # Best of <repeat> runs
+    times = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def measure(name, type_string, data, value_count, context, convert=None):
+    decoder_plan = ScaleDecoder.get_decoder_plan(type_string)
+
+    def decode():
+        values = decoder_plan.decode(ScaleBytes(data, context=context)).value
+        if convert:
+            [convert(value) for value in values]
+
+    decode_time = timed(decode)
+
+    print('{:<32}{:8.1f} ms  {:6.2f} us/value'.format(name, decode_time * 1000, decode_time / value_count * 1e6))
+
+
+def main(value_count):
+    count_prefix = ScaleDecoder.get_decoder_plan('Compact<u32>').decoder_class(None).encode(value_count).data
+
+    print('Values: {}'.format(value_count))
+
+    for type_string, size in (('AccountId', 32), ('H512', 64), ('Signature', 64), ('(AccountId, u32)', 36)):
+        data = bytes(count_prefix) + bytes(range(256)) * (value_count * size // 256 + 1)
+        vec_type = 'Vec<{}>'.format(type_string)
+
+        for byte_output in ('hex', 'bytes', 'memoryview'):
+            measure(
+                '{} {}'.format(type_string, byte_output), vec_type, data, value_count,
+                DecodeContext(values_only=True, byte_output=byte_output)
+            )
+
+        if size == 32:
+            measure(
+                '{} hex to bytes'.format(type_string), vec_type, data, value_count, DecodeContext(values_only=True),
+                lambda value: bytes.fromhex(value[2:])
+            )
+
+    # Binary payloads of 63 bytes that are not valid UTF-8
+    data = bytes(count_prefix) + (b'\xfc' + bytes(range(192, 255))) * value_count
+
+    for byte_output in ('hex', 'bytes'):
+        for decode_utf8 in (True, False):
+            measure(
+                'Bytes {} utf8={}'.format(byte_output, decode_utf8), 'Vec<Bytes>', data, value_count,
+                DecodeContext(values_only=True, byte_output=byte_output, decode_utf8=decode_utf8)
+            )
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,85 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Uses of the static size analysis of types: analysis of all registered types, vectors of integers that are
+# unpacked at once in values only mode (compared with decoding the same elements one by one), skipping fixed size values without
+# decoding them and encoding fixed size structs.
+#
+# Usage: python benchmarks/fixed_size.py [number_of_elements]
+
+import sys
+import time
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from scalecodec.base import ScaleDecoder, ScaleBytes, RuntimeConfiguration, DecodeContext
+from scalecodec.types import CompactU32
+
+
+def timed(func, count=1):
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) / count
+
+
+def main(element_count):
+    runtime_config = RuntimeConfiguration()
+
+    runtime_config.clear_decoder_plans()
+    analysis_time = timed(runtime_config.get_type_sizes)
+    type_sizes = runtime_config.get_type_sizes()
+
+    print('Type analysis:        {:.1f} ms ({} types, {} fixed size)'.format(
+        analysis_time * 1000, len(type_sizes), len([size for size in type_sizes.values() if size is not None])
+    ))
+
+    vec_data = CompactU32(ScaleBytes(bytearray())).encode(element_count).data + bytearray(element_count * 8)
+    vec_plan = ScaleDecoder.get_decoder_plan('Vec<u64>')
+    element_plan = ScaleDecoder.get_decoder_plan('u64')
+
+    def per_element():
+        data = ScaleBytes(vec_data)
+        count = ScaleDecoder.get_decoder_plan('Compact<u32>').decode(data).value
+        return [element_plan.decode(data).value for _ in range(count)]
+
+    # Without element decoder objects, otherwise Vec.elements is filled per element
+    values_only = DecodeContext(values_only=True)
+    assert per_element() == vec_plan.decode(ScaleBytes(vec_data, context=values_only)).value
+
+    print('Vec<u64> ({} elements)'.format(element_count))
+    print('  per element:        {:.2f} ms'.format(timed(per_element, 10) * 1000))
+    print('  unpacked:           {:.2f} ms'.format(timed(lambda: vec_plan.decode(ScaleBytes(vec_data, context=values_only)), 10) * 1000))
+
+    struct_plan = ScaleDecoder.get_decoder_plan('VestingSchedule')
+    struct_data = bytearray(40)
+
+    print('VestingSchedule')
+    decode_time = timed(lambda: struct_plan.decode(ScaleBytes(struct_data)), 10000)
+    skip_time = timed(lambda: struct_plan.skip(ScaleBytes(struct_data)), 10000)
+
+    print('  decode:             {:.2f} us'.format(decode_time * 1e6))
+    print('  skip:               {:.2f} us'.format(skip_time * 1e6))
+
+    value = {'offset': 1, 'perBlock': 2, 'startingBlock': 3}
+    print('  encode:             {:.2f} us'.format(
+        timed(lambda: struct_plan.get_decoder(ScaleBytes(bytearray())).encode(value), 10000) * 1e6
+    ))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,65 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Startup time of a short lived worker: a fresh interpreter that imports scalecodec and initializes the type
+# registry, with the chain specific type packs loaded lazily (default) or all of them up front.
+# The time of an interpreter that only starts is subtracted.
+#
+# Usage: python benchmarks/import_time.py [number_of_runs]
+
+import statistics
+import subprocess
+import sys
+import time
+from os import path
+
+root_path = path.dirname(path.dirname(path.abspath(__file__)))
+
+scenarios = (
+    ('Interpreter only', 'pass'),
+    ('Lazy type packs', 'import scalecodec\nfrom scalecodec.base import RuntimeConfiguration\nRuntimeConfiguration()'),
+    ('All type packs', 'import scalecodec\nfrom scalecodec.base import RuntimeConfiguration\n'
+                       'from scalecodec.type_packs import type_packs\n'
+                       'for pack_name in type_packs: RuntimeConfiguration().load_type_pack(pack_name)'),
+)
+
+
+def run(code, runs):
+    timings = []
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=root_path, check=True)
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings)
+
+
+def main(runs):
+    baseline = None
+
+    for name, code in scenarios:
+        timing = run(code, runs)
+
+        if baseline is None:
+            baseline = timing
+            print('{:<20}{:.1f} ms'.format(name + ':', timing * 1000))
+        else:
+            print('{:<20}{:.1f} ms (+{:.1f} ms)'.format(name + ':', timing * 1000, (timing - baseline) * 1000))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
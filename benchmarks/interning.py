@@ -0,0 +1,80 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Memory retained by the decoded events of many blocks kept in memory (e.g. for a batch write), with and
+# without an intern table for account ids. The events of every block are the events of the fixture, so the
+# same accounts recur like hot accounts on a chain.
+#
+# Usage: python benchmarks/interning.py [number_of_blocks]
+
+import gc
+import sys
+import time
+import tracemalloc
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from scalecodec.base import ScaleBytes, DecodeContext, InternTable
+from scalecodec.block import EventsDecoder
+from scalecodec.metadata import MetadataDecoder
+from test.fixtures import metadata_v4_hex, events_hex
+
+
+def measure(name, metadata_decoder, events_data, block_count, context):
+    # Warm up type registry and decoder plans
+    EventsDecoder(ScaleBytes(events_data, context=context), metadata=metadata_decoder).decode()
+    gc.collect()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    blocks = [
+        EventsDecoder(ScaleBytes(events_data, context=context), metadata=metadata_decoder).decode()
+        for _ in range(block_count)
+    ]
+
+    decode_time = time.perf_counter() - start
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print('{:<20}retained {:8.1f} KiB  {:7.1f} ms'.format(name, retained / 1024, decode_time * 1000))
+
+    return blocks
+
+
+def main(block_count):
+    metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v4_hex))
+    metadata_decoder.decode()
+
+    events_data = bytes.fromhex(events_hex[2:])
+    event_count = len(EventsDecoder(ScaleBytes(events_data), metadata=metadata_decoder).decode())
+
+    print('Blocks: {}, events: {}'.format(block_count, block_count * event_count))
+
+    measure('Not interned', metadata_decoder, events_data, block_count, DecodeContext(values_only=True))
+
+    intern_table = InternTable()
+    measure(
+        'Intern table', metadata_decoder, events_data, block_count,
+        DecodeContext(values_only=True, intern_table=intern_table)
+    )
+    print('Intern table size:  {}'.format(len(intern_table)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
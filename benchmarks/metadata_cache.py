@@ -0,0 +1,65 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Compares a cold metadata decode with loading the same runtime from the MetadataCache
+#
+# Usage: python benchmarks/metadata_cache.py [metadata_file]
+
+import shutil
+import sys
+import tempfile
+import timeit
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from scalecodec.base import ScaleBytes
+from scalecodec.cache import MetadataCache
+from scalecodec.metadata import MetadataDecoder
+from test.fixtures import metadata_v4_hex
+
+
+def main(metadata_hex, number=20):
+    directory = tempfile.mkdtemp()
+
+    try:
+        cache = MetadataCache(directory)
+        metadata_hash = MetadataCache.get_metadata_hash(metadata_hex)
+        cache.get(metadata_hex)
+
+        def cold_decode():
+            MetadataDecoder(ScaleBytes(metadata_hex)).decode()
+
+        def cache_load():
+            cache.load(metadata_hash)
+
+        cold_time = min(timeit.repeat(cold_decode, number=number, repeat=3)) / number
+        cache_time = min(timeit.repeat(cache_load, number=number, repeat=3)) / number
+
+        print('Metadata size:  {} bytes'.format(int(len(metadata_hex) / 2) - 1))
+        print('Cold decode:    {:.2f} ms'.format(cold_time * 1000))
+        print('Cache load:     {:.2f} ms'.format(cache_time * 1000))
+        print('Speedup:        {:.1f}x'.format(cold_time / cache_time))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        with open(sys.argv[1]) as metadata_file:
+            main(metadata_file.read().strip())
+    else:
+        main(metadata_v4_hex)
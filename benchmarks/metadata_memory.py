@@ -0,0 +1,83 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Measures the memory retained by one decoded runtime (MetadataDecoder), the peak during decoding and the
+# decode time, with and without skipping the docs
+#
+# Usage: python benchmarks/metadata_memory.py [metadata_file]
+
+import gc
+import sys
+import timeit
+import tracemalloc
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from scalecodec.base import ScaleBytes, DecodeContext
+from scalecodec.metadata import MetadataDecoder
+from test.fixtures import metadata_v4_hex
+
+
+def measure(metadata_hex, context, number=20):
+
+    def decode():
+        metadata_decoder = MetadataDecoder(ScaleBytes(metadata_hex, context=context))
+        metadata_decoder.decode()
+        return metadata_decoder
+
+    # Warm up type registry and decoder plans, so only the runtime itself is measured
+    decode()
+    gc.collect()
+
+    tracemalloc.start()
+
+    metadata_decoder = decode()
+    gc.collect()
+
+    retained, peak = tracemalloc.get_traced_memory()
+
+    metadata_value = metadata_decoder.value
+    with_value, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    decode_time = min(timeit.repeat(decode, number=number, repeat=3)) / number
+
+    print('Runtime retained:   {:.1f} KiB'.format(retained / 1024))
+    print('Decode peak:        {:.1f} KiB'.format(peak / 1024))
+    print('Value dict view:    {:.1f} KiB'.format((with_value - retained) / 1024))
+    print('Decode time:        {:.2f} ms'.format(decode_time * 1000))
+
+    return metadata_decoder, metadata_value
+
+
+def main(metadata_hex):
+    print('Metadata size:      {} bytes'.format(int(len(metadata_hex) / 2) - 1))
+
+    print('\nWith docs')
+    measure(metadata_hex, DecodeContext())
+
+    print('\nWithout docs')
+    measure(metadata_hex, DecodeContext(skip_docs=True))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        with open(sys.argv[1]) as metadata_file:
+            main(metadata_file.read().strip())
+    else:
+        main(metadata_v4_hex)
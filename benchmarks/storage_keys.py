@@ -0,0 +1,59 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Storage key generation throughput for a batch of accounts (map entry) and plain entries
+#
+# Usage: python benchmarks/storage_keys.py [number_of_accounts]
+
+import sys
+import time
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from scalecodec import hashing
+from scalecodec.base import ScaleBytes
+from scalecodec.metadata import MetadataDecoder
+from test.fixtures import metadata_v4_hex
+
+
+def main(account_count):
+    metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v4_hex))
+    metadata_decoder.decode()
+
+    account_ids = ['0x{:064x}'.format(n) for n in range(account_count)]
+
+    print('xxhash backend:     {}'.format('xxhash' if hashing.xxhash else 'pure Python'))
+
+    for module_name, entry_name in (('Balances', 'FreeBalance'), ('System', 'AccountNonce')):
+        start = time.perf_counter()
+        metadata_decoder.get_storage_keys(module_name, entry_name, account_ids)
+        duration = time.perf_counter() - start
+
+        print('{}.{}: {} keys in {:.1f} ms ({:.0f} keys/s)'.format(
+            module_name, entry_name, account_count, duration * 1000, account_count / duration
+        ))
+
+    start = time.perf_counter()
+    for _ in range(account_count):
+        hashing.twox_128(b'Balances TotalIssuance')
+    duration = time.perf_counter() - start
+
+    print('twox_128 (no cached prefix): {:.0f} hashes/s'.format(account_count / duration))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,62 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Decoding of Struct values: decoder objects per field (Struct.process) compared with the generated
+# straight-line decode function of the decoder plan, as used for extrinsic and event arguments.
+#
+# Usage: python benchmarks/struct_decode.py [number_of_decodes]
+
+import sys
+import time
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from scalecodec.base import ScaleDecoder, ScaleBytes
+
+scenarios = (
+    ('Integers', '(u32, u64, u8, u16)', '01000000' + '02' * 8 + '03' + '0400'),
+    ('Mixed', '(u32, Compact<Balance>, Vec<u8>, bool, H256, AccountId, BlockNumber)',
+     '01000000' + '0b00407a10f35a' + '0c616263' + '01' + '11' * 32 + '22' * 32 + '05' + '00' * 7),
+    ('Nested', '(AccountId, (Compact<u32>, u64), Option<u8>)', '33' * 32 + '08' + '01' * 8 + '0105'),
+)
+
+
+def timed(func, data, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        func(ScaleBytes(data))
+    return (time.perf_counter() - start) / count
+
+
+def main(count):
+    for name, type_string, data in scenarios:
+        decoder_plan = ScaleDecoder.get_decoder_plan(type_string)
+        value_decoder = decoder_plan.get_value_decoder()
+        data = bytearray.fromhex(data)
+
+        assert value_decoder(ScaleBytes(data)) == decoder_plan.decode(ScaleBytes(data)).value
+
+        object_time = timed(decoder_plan.decode, data, count)
+        generated_time = timed(value_decoder, data, count)
+
+        print('{:<10}decoder objects: {:6.1f} us  generated: {:5.1f} us  ({:.1f}x)'.format(
+            name, object_time * 1e6, generated_time * 1e6, object_time / generated_time
+        ))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,153 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Startup time of loading a large type registry: the Joystream and Robonomics type packs are exported
+# to the JSON registry format and repeated under other names until the registry has the requested size.
+# Compares update_type_registry() (a class per definition) with load_type_registry() (decoder plans).
+# Also measures type lookups over many runtime upgrades with a registry of spec version ranges.
+#
+# Usage: python benchmarks/type_registry.py [number_of_entries] [number_of_ranges]
+
+import inspect
+import json
+import os
+import sys
+import tempfile
+import time
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from scalecodec import types
+from scalecodec.type_packs import joystream, robonomics
+from scalecodec.base import RuntimeConfiguration, ScaleDecoder, ScaleBytes
+
+
+def export_chain_types():
+    # Definitions of the classes of the Joystream and Robonomics type packs, in source order
+    classes = []
+
+    for module in (joystream, robonomics):
+        module_classes = [
+            cls for cls in vars(module).values() if inspect.isclass(cls) and cls.__module__ == module.__name__
+        ]
+        classes += sorted(module_classes, key=lambda cls: inspect.getsourcelines(cls)[1])
+
+    definitions = {}
+
+    for cls in classes:
+        if issubclass(cls, types.Struct):
+            definitions[cls.__name__] = {'type': 'struct', 'type_mapping': [list(item) for item in cls.type_mapping]}
+        elif issubclass(cls, types.Enum) and cls.type_mapping:
+            definitions[cls.__name__] = {'type': 'enum', 'type_mapping': [list(item) for item in cls.type_mapping]}
+        elif issubclass(cls, types.Enum):
+            definitions[cls.__name__] = {'type': 'enum', 'value_list': list(cls.value_list)}
+        else:
+            definitions[cls.__name__] = cls.__bases__[0].__name__
+
+    return definitions
+
+
+def build_registry(entry_count):
+    chain_types = export_chain_types()
+
+    type_definitions = {}
+    copy_index = 0
+
+    while len(type_definitions) < entry_count:
+        for type_string, definition in chain_types.items():
+            type_definitions['{}{}'.format(type_string, copy_index)] = definition
+        copy_index += 1
+
+    return {'types': type_definitions}
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main(entry_count):
+    runtime_config = RuntimeConfiguration()
+    type_registry = build_registry(entry_count)
+
+    registry_file = tempfile.NamedTemporaryFile('w', suffix='.json', delete=False)
+    json.dump(type_registry, registry_file)
+    registry_file.close()
+
+    print('Registry entries:     {}'.format(len(type_registry['types'])))
+
+    default_registry = dict(runtime_config.type_registry['default'])
+
+    update_time = timed(runtime_config.update_type_registry, {'default': type_registry['types']})
+    runtime_config.set_type_registry('default', dict(default_registry))
+
+    load_time = timed(runtime_config.load_type_registry, type_registry)
+    runtime_config.set_type_registry('default', dict(default_registry))
+
+    load_file_time = timed(runtime_config.load_type_registry_file, registry_file.name)
+
+    # First decode after loading, the plans are already compiled
+    decode_time = timed(
+        lambda: ScaleDecoder.get_decoder_plan('BlockAndTime0').decode(ScaleBytes('0x' + '01' * 16))
+    )
+
+    runtime_config.set_type_registry('default', default_registry)
+    os.unlink(registry_file.name)
+
+    print('update_type_registry: {:.1f} ms'.format(update_time * 1000))
+    print('load_type_registry:   {:.1f} ms'.format(load_time * 1000))
+    print('  from file:          {:.1f} ms'.format(load_file_time * 1000))
+    print('First decode:         {:.3f} ms'.format(decode_time * 1000))
+
+
+def range_lookups(range_count, lookups_per_version=100):
+    runtime_config = RuntimeConfiguration()
+
+    # Every range overrides the Balance type of 10 spec versions, the last one has no upper bound
+    versioning = [
+        {'spec_version_range': [n * 10, n * 10 + 9], 'types': {'Balance': ['u64', 'u128'][n % 2]}}
+        for n in range(range_count - 1)
+    ]
+    versioning.append({'spec_version_range': [(range_count - 1) * 10, None], 'types': {'Balance': 'u128'}})
+
+    load_time = timed(runtime_config.load_type_registry, {'versioning': versioning})
+
+    spec_versions = range(0, range_count * 10)
+
+    def lookups():
+        for spec_version in spec_versions:
+            for _ in range(lookups_per_version):
+                runtime_config.get_decoder_class('Balance', spec_version)
+
+    first_time = timed(lookups)
+    memoized_time = timed(lookups)
+
+    runtime_config.clear_type_registry_ranges()
+
+    lookup_count = len(spec_versions) * lookups_per_version
+
+    print('Spec version ranges:  {} ({} spec versions)'.format(range_count, len(spec_versions)))
+    print('Load ranges:          {:.1f} ms'.format(load_time * 1000))
+    print('Lookup (first pass):  {:.2f} us'.format(first_time / lookup_count * 1e6))
+    print('Lookup (memoized):    {:.2f} us'.format(memoized_time / lookup_count * 1e6))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
+    print()
+    range_lookups(int(sys.argv[2]) if len(sys.argv) > 2 else 500)
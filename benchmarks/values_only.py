@@ -0,0 +1,85 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Peak memory and time of decoding a large storage vector and a large event list, with the element decoder
+# objects retained (default) or discarded as soon as their values are extracted (values only)
+#
+# Usage: python benchmarks/values_only.py [number_of_elements]
+
+import gc
+import sys
+import time
+import tracemalloc
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from scalecodec.base import ScaleDecoder, ScaleBytes, DecodeContext
+from scalecodec.block import EventsDecoder
+from scalecodec.metadata import MetadataDecoder
+from scalecodec.types import CompactU32
+from test.fixtures import metadata_v4_hex, events_hex
+
+
+def measure(name, decode):
+    for context in (DecodeContext(), DecodeContext(values_only=True)):
+        # Warm up type registry and decoder plans
+        decode(context)
+        gc.collect()
+
+        tracemalloc.start()
+        start = time.perf_counter()
+
+        decode(context)
+
+        decode_time = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print('{:<40}peak {:8.1f} KiB  {:7.1f} ms'.format(
+            '{} ({})'.format(name, 'values only' if context.values_only else 'default'), peak / 1024, decode_time * 1000
+        ))
+
+
+def main(element_count):
+    vector_data = CompactU32(ScaleBytes(bytearray())).encode(element_count).data + bytearray(48 * element_count)
+
+    measure(
+        'Vec<(AccountId, Balance)>',
+        lambda context: ScaleDecoder.get_decoder_plan('Vec<(AccountId, Balance)>').decode(
+            ScaleBytes(vector_data, context=context)
+        ).value
+    )
+
+    metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v4_hex))
+    metadata_decoder.decode()
+
+    # The event records of the fixture repeated until the list has about the requested number of events
+    events_data = ScaleBytes(events_hex)
+    event_count = CompactU32(events_data).process()
+    records = events_data.get_remaining_bytes()
+    repeat = max(1, element_count // event_count)
+
+    event_list_data = CompactU32(ScaleBytes(bytearray())).encode(event_count * repeat).data + records * repeat
+
+    measure(
+        'Events ({})'.format(event_count * repeat),
+        lambda context: EventsDecoder(ScaleBytes(event_list_data, context=context), metadata=metadata_decoder).decode()
+    )
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -18,4 +18,26 @@
 
 # TODO temp import all to make sure types classes are registered with RuntimeConfiguration.
 # TODO implemented type mapping registry per spec version id (/runtime)
+import sys
+from importlib import import_module
+
 from .types import *
+from .type_packs import type_packs
+
+
+def __getattr__(name):
+    # Classes of the chain specific type packs are imported on first access, e.g. from scalecodec import Order
+    for pack_name, type_strings in type_packs.items():
+        if name in type_strings:
+            return getattr(import_module('scalecodec.type_packs.{}'.format(pack_name)), name)
+
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ is not supported, import the type packs right away
+    for _pack_name in type_packs:
+        globals().update({
+            name: value for name, value in vars(import_module('scalecodec.type_packs.{}'.format(_pack_name))).items()
+            if name in type_packs[_pack_name]
+        })
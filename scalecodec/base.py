@@ -18,8 +18,12 @@
 
 import re
 from abc import ABC, abstractmethod
+from bisect import bisect_right
+from importlib import import_module
 
-from scalecodec.exceptions import RemainingScaleBytesNotEmptyException, InvalidScaleTypeValueException
+from scalecodec.exceptions import RemainingScaleBytesNotEmptyException, InvalidScaleTypeValueException, \
+    DecodeLimitExceededException
+from scalecodec.type_packs import type_packs
 
 
 class Singleton(type):
@@ -34,25 +38,153 @@ class Singleton(type):
 class RuntimeConfiguration(metaclass=Singleton):
 
     type_registry = {}
+    decoder_plans = {}
+    # Incremented when the decoder plans are invalidated, so plans kept elsewhere can be checked
+    decoder_plans_generation = 0
     active_spec_version_id = 'default'
 
+    # Type mappings that apply to a range of spec versions, as (spec_version_from, spec_version_to, type_mapping)
+    type_registry_ranges = []
+    # Sorted spec versions at which the set of applying ranges changes, and per boundary the type mappings
+    # of the ranges that apply from that version on (highest priority first)
+    type_registry_range_boundaries = []
+    type_registry_range_segments = []
+    # Resolved registry per spec version: range type mappings overridden by the exact spec version mapping
+    spec_version_views = {}
+    # Variant decoder plans of Enum type mappings by (spec_version_id, id(type_mapping)), see Enum
+    variant_decoders = {}
+    # Type strings (lowercase) of type packs that are not loaded yet, with the name of their type pack
+    lazy_types = {}
+
     @classmethod
     def all_subclasses(cls, class_):
         return set(class_.__subclasses__()).union(
             [s for c in class_.__subclasses__() for s in cls.all_subclasses(c)])
 
     def __init__(self):
-        self.type_registry['default'] = {cls.type_string.lower(): cls for cls in self.all_subclasses(ScaleDecoder) if cls.type_string}
-        self.type_registry['default'].update({cls.__name__.lower(): cls for cls in self.all_subclasses(ScaleDecoder)})
+        # Classes of type packs that are already imported (e.g. by from scalecodec import Order) are left to
+        # load_type_pack(), so only the core types are registered up front
+        decoder_classes = [
+            cls for cls in self.all_subclasses(ScaleDecoder) if not cls.__module__.startswith('scalecodec.type_packs.')
+        ]
+
+        self.type_registry['default'] = {cls.type_string.lower(): cls for cls in decoder_classes if cls.type_string}
+        self.type_registry['default'].update({cls.__name__.lower(): cls for cls in decoder_classes})
+
+        for pack_name, type_strings in type_packs.items():
+            for type_string in type_strings:
+                self.lazy_types[type_string.lower()] = pack_name
 
     def get_decoder_class(self, type_string, spec_version_id='default'):
         # TODO move ScaleDecoder.get_decoder_class logic to here
-        decoder_class = self.type_registry.get(str(spec_version_id), {}).get(type_string.lower(), None)
+        decoder_class = self.get_spec_version_view(spec_version_id).get(type_string.lower(), None)
 
         if decoder_class:
             return decoder_class
-        else:
-            return self.type_registry.get('default', {}).get(type_string.lower(), None)
+
+        decoder_class = self.type_registry.get('default', {}).get(type_string.lower(), None)
+
+        if decoder_class is None and type_string.lower() in self.lazy_types:
+            self.load_type_pack(self.lazy_types[type_string.lower()])
+            decoder_class = self.type_registry['default'].get(type_string.lower(), None)
+
+        return decoder_class
+
+    def load_type_pack(self, pack_name):
+        # Imports a chain specific type pack (scalecodec.type_packs.<pack_name>) and adds its types to the default
+        # registry, types that are already registered are not replaced
+        module = import_module('scalecodec.type_packs.{}'.format(pack_name))
+        registry = self.type_registry.setdefault('default', {})
+
+        for cls in vars(module).values():
+            if isinstance(cls, type) and issubclass(cls, ScaleDecoder) and cls.__module__ == module.__name__:
+                if vars(cls).get('type_string'):
+                    registry.setdefault(cls.type_string.lower(), cls)
+                registry.setdefault(cls.__name__.lower(), cls)
+
+        for type_string in type_packs[pack_name]:
+            self.lazy_types.pop(type_string.lower(), None)
+
+    def get_spec_version_view(self, spec_version_id):
+        spec_version_id = str(spec_version_id)
+        view = self.spec_version_views.get(spec_version_id)
+
+        if view is None:
+            segment = ()
+
+            if self.type_registry_range_boundaries and spec_version_id.isdigit():
+                index = bisect_right(self.type_registry_range_boundaries, int(spec_version_id)) - 1
+                if index >= 0:
+                    segment = self.type_registry_range_segments[index]
+
+            if segment:
+                view = {}
+                for type_mapping in reversed(segment):
+                    view.update(type_mapping)
+                view.update(self.type_registry.get(spec_version_id, {}))
+            else:
+                view = self.type_registry.get(spec_version_id, {})
+
+            self.spec_version_views[spec_version_id] = view
+
+        return view
+
+    def get_type_sizes(self, spec_version_id='default'):
+        # Fixed encoded size of all registered types (None for variable sized types and types that cannot
+        # be resolved), type packs that are not loaded yet are not included
+        type_strings = set(self.type_registry.get('default', {}))
+        type_strings.update(self.get_spec_version_view(spec_version_id))
+
+        type_sizes = {}
+
+        for type_string in sorted(type_strings):
+            try:
+                decoder_plan = ScaleDecoder.get_decoder_plan(type_string, spec_version_id=spec_version_id)
+            except NotImplementedError:
+                type_sizes[type_string] = None
+            else:
+                type_sizes[type_string] = decoder_plan.get_fixed_size(spec_version_id)
+
+        return type_sizes
+
+    def add_type_registry_range(self, spec_version_from, spec_version_to, type_mapping):
+        # Registers type_mapping for spec_version_from up to and including spec_version_to (None for no upper
+        # bound). When ranges overlap, the range added last takes precedence.
+        if spec_version_to is not None and spec_version_to < spec_version_from:
+            raise ValueError('Invalid spec version range {}-{}'.format(spec_version_from, spec_version_to))
+
+        # Type strings are resolved to their decoder class, like update_type_registry()
+        type_mapping = {
+            type_string.lower(): self.get_decoder_class(decoder_class) if type(decoder_class) is str else decoder_class
+            for type_string, decoder_class in type_mapping.items()
+        }
+
+        self.type_registry_ranges.append((spec_version_from, spec_version_to, type_mapping))
+        self.build_type_registry_ranges()
+
+    def build_type_registry_ranges(self):
+        boundaries = set()
+        for range_from, range_to, _ in self.type_registry_ranges:
+            boundaries.add(range_from)
+            if range_to is not None:
+                boundaries.add(range_to + 1)
+
+        self.type_registry_range_boundaries[:] = sorted(boundaries)
+        self.type_registry_range_segments[:] = [
+            tuple(
+                range_type_mapping for range_from, range_to, range_type_mapping in reversed(self.type_registry_ranges)
+                if range_from <= boundary and (range_to is None or boundary <= range_to)
+            )
+            for boundary in self.type_registry_range_boundaries
+        ]
+
+        self.clear_decoder_plans()
+
+    def clear_type_registry_ranges(self):
+        self.type_registry_ranges.clear()
+        self.type_registry_range_boundaries.clear()
+        self.type_registry_range_segments.clear()
+        self.clear_decoder_plans()
 
     def update_type_registry(self, type_registry):
 
@@ -84,32 +216,275 @@ class RuntimeConfiguration(metaclass=Singleton):
 
                 self.type_registry[spec_version_id][type_string.lower()] = decoder_class
 
+        self.clear_decoder_plans()
+
+    def load_type_registry(self, type_registry):
+        # Loads a JSON type registry and compiles its definitions to decoder plans, no classes are created:
+        #
+        # {
+        #   "types": {<type_string>: <definition>, ...},
+        #   "versioning": [
+        #     {"spec_version": <spec_version_id>, "types": {<type_string>: <definition>, ...}},
+        #     {"spec_version_range": [<from>, <to>], "types": {<type_string>: <definition>, ...}},
+        #     ...
+        #   ]
+        # }
+        #
+        # A definition is either a type string alias ("u128", "Vec<AccountId>", "Option<Balance>", "(u32, u64)",
+        # "[u8; 64]") or a dict:
+        #   {"type": "struct", "type_mapping": [[<field>, <type_string>], ...]}
+        #   {"type": "enum", "value_list": [<value>, ...]}
+        #   {"type": "enum", "type_mapping": [[<variant>, <type_string>], ...]}
+        #
+        # The types of a versioning entry override the default types for that spec version only, or for the
+        # spec versions <from> up to and including <to> (null for no upper bound). A single spec version takes
+        # precedence over ranges, of overlapping ranges the one listed last takes precedence.
+        # Aliases are resolved when loaded, so the types they refer to must be known (or loaded in the same registry).
+
+        sections = [('default', self.type_registry.setdefault('default', {}), type_registry.get('types', {}))]
+        ranges_added = False
+
+        for version in type_registry.get('versioning', []):
+            if 'spec_version_range' in version:
+                spec_version_from, spec_version_to = version['spec_version_range']
+                if spec_version_to is not None and spec_version_to < spec_version_from:
+                    raise ValueError('Invalid spec version range {}-{}'.format(spec_version_from, spec_version_to))
+
+                registry = {}
+                self.type_registry_ranges.append((spec_version_from, spec_version_to, registry))
+                ranges_added = True
+                # Aliases of a range are resolved as of its first version
+                sections.append((str(spec_version_from), registry, version.get('types', {})))
+            else:
+                spec_version_id = str(version['spec_version'])
+                sections.append((spec_version_id, self.type_registry.setdefault(spec_version_id, {}), version.get('types', {})))
+
+        if ranges_added:
+            self.build_type_registry_ranges()
+
+        compiled = []
+
+        for spec_version_id, registry, definitions in sections:
+            aliases = []
+
+            for type_string, definition in definitions.items():
+                if type(definition) is str:
+                    aliases.append((type_string, definition))
+                else:
+                    registry[type_string.lower()] = self.compile_type_definition(type_string, definition)
+                    compiled.append((spec_version_id, registry, type_string))
+
+            # Aliases can refer to aliases further on in the registry, resolve until no more progress is made
+            while aliases:
+                unresolved = []
+                for type_string, definition in aliases:
+                    # Types of the same section are looked up directly, the resolved view of a range is not
+                    # updated while it is being loaded
+                    decoder_plan = registry.get(definition.lower())
+
+                    try:
+                        if not isinstance(decoder_plan, DecoderPlan):
+                            decoder_plan = ScaleDecoder.get_decoder_plan(definition, spec_version_id=spec_version_id)
+                    except NotImplementedError:
+                        unresolved.append((type_string, definition))
+                    else:
+                        registry[type_string.lower()] = decoder_plan
+                        compiled.append((spec_version_id, registry, type_string))
+
+                if len(unresolved) == len(aliases):
+                    raise NotImplementedError('Unable to resolve type alias(es): {}'.format(
+                        ', '.join('{} ({})'.format(type_string, definition) for type_string, definition in unresolved)
+                    ))
+
+                aliases = unresolved
+
+        self.clear_decoder_plans()
+
+        # Prime the plan cache, so the first lookups do not have to go through the registry
+        for spec_version_id, registry, type_string in compiled:
+            if registry is self.type_registry.get(spec_version_id):
+                self.decoder_plans[(spec_version_id, type_string)] = registry[type_string.lower()]
+
+    def load_type_registry_file(self, path):
+        # Imported here, json is not needed when no registry files are used
+        import json
+
+        with open(path) as type_registry_file:
+            self.load_type_registry(json.load(type_registry_file))
+
+    def compile_type_definition(self, type_string, definition):
+
+        if definition.get('type') == 'struct':
+            return DecoderPlan(type_string, self.get_decoder_class('struct'), type_mapping=tuple(
+                (key, data_type) for key, data_type in definition['type_mapping']
+            ))
+
+        elif definition.get('type') == 'enum':
+            if definition.get('type_mapping'):
+                return DecoderPlan(type_string, self.get_decoder_class('enum'), type_mapping=tuple(
+                    (key, data_type) for key, data_type in definition['type_mapping']
+                ))
+
+            return DecoderPlan(type_string, self.get_decoder_class('enum'), value_list=list(definition['value_list']))
+
+        raise NotImplementedError("Type definition '{}' of '{}' not supported".format(
+            definition.get('type'), type_string)
+        )
+
+    def clear_decoder_plans(self):
+        self.decoder_plans.clear()
+        self.spec_version_views.clear()
+        self.variant_decoders.clear()
+        RuntimeConfiguration.decoder_plans_generation += 1
+
     def set_type_registry(self, spec_version_id, type_mapping):
         self.type_registry[spec_version_id] = type_mapping
+        self.clear_decoder_plans()
 
     def override_type_registry(self, type_string, decoder_class, spec_version_id='default'):
         self.type_registry[spec_version_id][type_string.lower()] = decoder_class
+        self.clear_decoder_plans()
+
+
+class DecodeContext:
+
+    # Decoding options, shared by all decoders reading from the same ScaleBytes
+
+    def __init__(self, skip_docs=False, spec_version_id='default', max_elements=None, max_bytes=None, max_depth=None,
+                 values_only=False, intern_table=None, byte_output='hex', decode_utf8=True):
+        # Skip documentation in metadata (only the length prefixes are read), docs will be empty lists
+        self.skip_docs = skip_docs
+        # Only keep the values of decoded vectors, element decoder objects are not retained (Vec.elements and
+        # EventsDecoder.elements stay empty)
+        self.values_only = values_only
+        # Spec version of which the type registry is used to resolve the types of nested decoders
+        self.spec_version_id = spec_version_id
+        # Limits for untrusted data (None for no limit): the element count of a Vec, the size in bytes of a
+        # length prefixed value and the number of nested decoders
+        self.max_elements = max_elements
+        self.max_bytes = max_bytes
+        self.max_depth = max_depth
+        # InternTable for decoded account ids, equal values share one string object
+        self.intern_table = intern_table
+        # Output of hashes, account ids, signatures and byte arrays: 'hex' (hex strings), 'bytes' or 'memoryview'
+        # (slices of the decoded data without copying). Bytes account ids are interned like hex strings, the raw
+        # value of decoders is only built for hex output. Memoryview values are tracked by the garbage collector
+        # and are slower to decode than hex strings for values of up to 64 bytes, they only pay off for larger
+        # byte arrays or to avoid copies of the data.
+        if byte_output not in ('hex', 'bytes', 'memoryview'):
+            raise ValueError('Invalid byte output "{}"'.format(byte_output))
+        self.byte_output = byte_output
+        # Try to decode Bytes (and VecU8Length<n>) values as UTF-8 text before using the byte output
+        self.decode_utf8 = decode_utf8
+
+
+class InternTable:
+
+    # Bounded table of decoded strings, so the account ids of many decoded blocks that are kept in memory share
+    # their string objects. Only values that recur are interned (hashes are mostly unique and would only fill
+    # the table). A full table is cleared, so only the values seen since stay shared.
+
+    def __init__(self, max_size=100000):
+        self.max_size = max_size
+        self.strings = {}
+
+    def intern(self, value):
+        string = self.strings.get(value)
+
+        if string is None:
+            if len(self.strings) >= self.max_size:
+                self.strings.clear()
+
+            self.strings[value] = string = value
+
+        return string
+
+    def __len__(self):
+        return len(self.strings)
 
 
 class ScaleBytes:
 
-    def __init__(self, data):
+    default_context = DecodeContext()
+
+    def __init__(self, data, context=None):
         self.offset = 0
+        self.context = context or self.default_context
 
-        if type(data) is bytearray:
+        if type(data) in (bytearray, bytes):
             self.data = data
+        elif type(data) is memoryview:
+            self.data = data.tobytes()
         elif data[0:2] == '0x':
             self.data = bytearray.fromhex(data[2:])
         else:
             raise ValueError("Provided data is not in supported format: provided '{}'".format(type(data)))
 
         self.length = len(self.data)
+        # Number of decoders currently decoding from this data, only counted when the context has a max_depth
+        self.depth = 0
+        # View of the data for the memoryview byte output, created once
+        self.view = None
+
+    def check_elements(self, element_count, element_size=None):
+        # Checks the element count prefix of a Vec before its elements are decoded, the elements have to fit
+        # in the remaining data with at least <element_size> bytes each (no check for zero sized elements)
+        max_elements = self.context.max_elements
+
+        if max_elements is not None and element_count > max_elements:
+            raise DecodeLimitExceededException(
+                '{} elements exceed the limit of {} elements'.format(element_count, max_elements)
+            )
+
+        if element_size:
+            self.check_bytes(element_count * element_size)
+
+    def check_bytes(self, length):
+        # Checks the length prefix of a value before its bytes are read
+        max_bytes = self.context.max_bytes
+
+        if max_bytes is not None and length > max_bytes:
+            raise DecodeLimitExceededException('{} bytes exceed the limit of {} bytes'.format(length, max_bytes))
+
+        if length > self.length - self.offset:
+            raise DecodeLimitExceededException('{} bytes exceed the remaining {} bytes at offset {}'.format(
+                length, self.length - self.offset, self.offset
+            ))
+
+    def check_read(self, length):
+        # Checks that the next <length> bytes are within the data before they are read
+        if self.offset + length > self.length:
+            raise ValueError('Not enough data to read {} bytes at offset {}'.format(length, self.offset))
 
     def get_next_bytes(self, length):
+        self.check_read(length)
+
         data = self.data[self.offset:self.offset + length]
         self.offset += length
         return data
 
+    def get_next_output(self, length):
+        # Next bytes as bytes or memoryview, for the byte output of the context other than hex
+        self.check_read(length)
+
+        offset = self.offset
+        self.offset += length
+
+        return self.get_output(offset, length)
+
+    def get_output(self, offset, length):
+        # Bytes at offset as bytes or memoryview, without moving the offset or checking the end of the data
+        if self.context.byte_output == 'memoryview':
+            if self.view is None:
+                self.view = memoryview(self.data)
+
+            return self.view[offset:offset + length]
+
+        if type(self.data) is bytes:
+            return self.data[offset:offset + length]
+
+        return bytes(self.data[offset:offset + length])
+
     def get_remaining_bytes(self):
         data = self.data[self.offset:]
         self.offset = self.length
@@ -131,6 +506,9 @@ class ScaleDecoder(ABC):
 
     type_mapping = None
 
+    # Encoded size in bytes if it is the same for every value, None if the size is variable
+    fixed_size = None
+
     debug = False
 
     def __init__(self, data, sub_type=None):
@@ -152,17 +530,73 @@ class ScaleDecoder(ABC):
         if cls.type_string and cls.type_string[0] == '(' and cls.type_string[-1] == ')':
             type_mapping = ()
             n = 1
-            for struct_element in cls.type_string[1:-1].split(','):
-                type_mapping += (('col{}'.format(n), struct_element.strip()),)
+            for struct_element in cls.split_type_list(cls.type_string[1:-1]):
+                type_mapping += (('col{}'.format(n), struct_element),)
                 n += 1
 
             cls.type_mapping = type_mapping
 
+    @staticmethod
+    def split_type_list(type_list):
+        # Splits 'A, Vec<(B, C)>, [D; 2]' into its top level type strings
+        elements = []
+        depth = 0
+        start = 0
+
+        for index, char in enumerate(type_list):
+            if char in '<([':
+                depth += 1
+            elif char in '>)]':
+                depth -= 1
+            elif char == ',' and depth == 0:
+                elements.append(type_list[start:index].strip())
+                start = index + 1
+
+        elements.append(type_list[start:].strip())
+
+        return elements
+
     def get_next_bytes(self, length):
         data = self.data.get_next_bytes(length)
         self.raw_value += data.hex()
         return data
 
+    def get_next_output(self, length, hex_prefix='0x'):
+        # Next bytes in the byte output of the context, hex strings start with <hex_prefix>
+        if self.data.context.byte_output == 'hex':
+            return hex_prefix + self.get_next_bytes(length).hex()
+
+        return self.data.get_next_output(length)
+
+    def get_next_text(self, length):
+        # Next bytes as UTF-8 text, or in the byte output of the context (hex without prefix) when they are not
+        # valid UTF-8 or the context does not decode UTF-8
+        context = self.data.context
+
+        if context.byte_output == 'hex':
+            value = self.get_next_bytes(length)
+
+            if context.decode_utf8:
+                try:
+                    return value.decode()
+                except UnicodeDecodeError:
+                    pass
+
+            return value.hex()
+
+        self.data.check_read(length)
+
+        if context.decode_utf8:
+            try:
+                text = self.data.data[self.data.offset:self.data.offset + length].decode()
+            except UnicodeDecodeError:
+                pass
+            else:
+                self.data.offset += length
+                return text
+
+        return self.data.get_next_output(length)
+
     def get_next_u8(self):
         return int.from_bytes(self.get_next_bytes(1), byteorder='little')
 
@@ -177,12 +611,24 @@ class ScaleDecoder(ABC):
         self.raw_value += data.hex()
         return data
 
+    def intern(self, value):
+        # Shared instance of a decoded string (or bytes) when the context has an intern table
+        intern_table = self.data.context.intern_table
+
+        if intern_table is None or type(value) is memoryview:
+            return value
+
+        return intern_table.intern(value)
+
     @abstractmethod
     def process(self):
         pass
 
     def decode(self, check_remaining=True):
-        self.value = self.process()
+        if self.data.context.max_depth is None:
+            self.value = self.process()
+        else:
+            self.process_nested()
         if check_remaining and self.raw_value == '010400':
                 return self.value
 
@@ -191,30 +637,70 @@ class ScaleDecoder(ABC):
 
         return self.value
 
+    def process_nested(self):
+        if self.data.depth >= self.data.context.max_depth:
+            raise DecodeLimitExceededException(
+                'Nesting exceeds the limit of {} decoders'.format(self.data.context.max_depth)
+            )
+
+        self.data.depth += 1
+
+        try:
+            self.value = self.process()
+        finally:
+            self.data.depth -= 1
+
     def __str__(self):
         return str(self.value) or ''
 
+    @classmethod
+    def get_fixed_size(cls, **kwargs):
+        # kwargs are the arguments of the decoder plan (e.g. sub_type) and the spec_version_id
+        return cls.fixed_size
+
     def encode(self, value):
         raise NotImplemented("Encoding not implemented for this ScaleType")
 
     @classmethod
     def get_decoder_class(cls, type_string, data, **kwargs):
+        decoder_plan = cls.get_decoder_plan(
+            type_string, spec_version_id=kwargs.pop('spec_version_id', data.context.spec_version_id)
+        )
+        return decoder_plan.get_decoder(data, **kwargs)
+
+    @classmethod
+    def get_decoder_plan(cls, type_string, spec_version_id='default'):
+
+        runtime_config = RuntimeConfiguration()
+
+        plan_key = (str(spec_version_id), type_string)
+        decoder_plan = runtime_config.decoder_plans.get(plan_key)
+
+        if decoder_plan is None:
+            decoder_plan = cls.build_decoder_plan(type_string, spec_version_id)
+            runtime_config.decoder_plans[plan_key] = decoder_plan
+
+        return decoder_plan
+
+    @classmethod
+    def build_decoder_plan(cls, type_string, spec_version_id='default'):
 
         type_parts = None
 
         type_string = cls.convert_type(type_string)
-        if type_string == "ShardInfo<ShardNum>":
-         print(type_string)
 
         if type_string[-1:] == '>':
             # Check for specific implementation for composite type
             decoder_class = RuntimeConfiguration().get_decoder_class(
                 type_string.lower(),
-                spec_version_id=kwargs.get('spec_version_id', 'default')
+                spec_version_id=spec_version_id
             )
 
+            if isinstance(decoder_class, DecoderPlan):
+                return decoder_class
+
             if decoder_class:
-                return decoder_class(data, **kwargs)
+                return DecoderPlan(type_string, decoder_class)
 
             # Extract sub types
             type_parts = re.match(r'^([^<]*)<(.+)>$', type_string).groups()
@@ -222,27 +708,46 @@ class ScaleDecoder(ABC):
         if type_parts:
             decoder_class = RuntimeConfiguration().get_decoder_class(
                 type_parts[0].lower(),
-                spec_version_id=kwargs.get('spec_version_id', 'default')
+                spec_version_id=spec_version_id
             )
+            if isinstance(decoder_class, DecoderPlan):
+                # Generic parameters of registry definitions are not used
+                return decoder_class
+
             if decoder_class:
-                return decoder_class(data, sub_type=type_parts[1], **kwargs)
+                return DecoderPlan(type_string, decoder_class, sub_type=type_parts[1])
         else:
             decoder_class = RuntimeConfiguration().get_decoder_class(
                 type_string.lower(),
-                spec_version_id=kwargs.get('spec_version_id', 'default')
+                spec_version_id=spec_version_id
             )
+
+            if isinstance(decoder_class, DecoderPlan):
+                return decoder_class
+
             if decoder_class:
-                return decoder_class(data, **kwargs)
+                return DecoderPlan(type_string, decoder_class)
 
         # Custom tuple
         # TODO tuples should be converted to list not dict
         if type_string != '()' and type_string[0] == '(' and type_string[-1] == ')':
             decoder_class = RuntimeConfiguration().get_decoder_class('struct')
-            decoder_class.type_string = type_string
 
-            decoder_class.build_type_mapping()
+            type_mapping = tuple(
+                ('col{}'.format(n), struct_element)
+                for n, struct_element in enumerate(cls.split_type_list(type_string[1:-1]), start=1)
+            )
+
+            return DecoderPlan(type_string, decoder_class, type_mapping=type_mapping)
 
-            return decoder_class(data, **kwargs)
+        # Fixed length array, e.g. [u32; 4]
+        if type_string[0] == '[' and type_string[-1] == ']' and ';' in type_string:
+            element_type, element_count = type_string[1:-1].rsplit(';', 1)
+            decoder_class = RuntimeConfiguration().get_decoder_class('FixedLengthArray')
+
+            return DecoderPlan(
+                type_string, decoder_class, sub_type=element_type.strip(), element_count=int(element_count)
+            )
 
         raise NotImplementedError('Decoder class for "{}" not found'.format(type_string))
 
@@ -290,6 +795,96 @@ class ScaleDecoder(ABC):
         return name
 
 
+class DecoderPlan:
+
+    # Type string resolved to a decoder class and its constructor arguments, so decoding a value of this type
+    # does not convert and look up the type string again
+
+    def __init__(self, type_string, decoder_class, sub_type=None, type_mapping=None, **kwargs):
+        self.type_string = type_string
+        self.decoder_class = decoder_class
+        self.kwargs = kwargs
+
+        if sub_type:
+            self.kwargs['sub_type'] = sub_type
+
+        if type_mapping:
+            self.kwargs['type_mapping'] = type_mapping
+
+        # Generated value decoders by spec version id, see get_value_decoder()
+        self.value_decoders = {}
+        # Fixed sizes by spec version id, see get_fixed_size()
+        self.fixed_sizes = {}
+
+    def get_decoder(self, data, **kwargs):
+        if self.decoder_class is None:
+            raise NotImplementedError('Decoder class for "{}" not found'.format(self.type_string))
+
+        return self.decoder_class(data, **self.kwargs, **kwargs)
+
+    def decode(self, data, **kwargs):
+        obj = self.get_decoder(data, **kwargs)
+        obj.decode(check_remaining=False)
+        return obj
+
+    def get_value_decoder(self, spec_version_id='default'):
+        # Generated function that decodes the value of a Struct plan (see scalecodec.codegen) without creating
+        # decoder objects for its fields, None for other plans
+        spec_version_id = str(spec_version_id)
+
+        if spec_version_id not in self.value_decoders:
+            from scalecodec import codegen
+
+            value_decoder = None
+
+            if codegen.is_struct_plan(self):
+                try:
+                    value_decoder = codegen.generate_struct_decoder(self, spec_version_id)
+                except NotImplementedError:
+                    # Unknown field types fail when decoded, like they do for Struct
+                    pass
+
+            self.value_decoders[spec_version_id] = value_decoder
+
+        return self.value_decoders[spec_version_id]
+
+    def decode_param(self, data, **kwargs):
+        # Decodes a call or event argument, returns the serialized value and the raw value (hex)
+        value_decoder = self.get_value_decoder(data.context.spec_version_id)
+
+        if value_decoder:
+            # Struct decoders do not read any bytes themselves, their raw value is always empty
+            return value_decoder(data, kwargs.get('metadata')), ''
+
+        obj = self.decode(data, **kwargs)
+
+        return obj.serialize(), obj.raw_value
+
+    def get_fixed_size(self, spec_version_id='default'):
+        # Encoded size of every value of this type, None when variable sized
+        spec_version_id = str(spec_version_id)
+
+        if spec_version_id not in self.fixed_sizes:
+            if self.decoder_class is None:
+                self.fixed_sizes[spec_version_id] = None
+            else:
+                self.fixed_sizes[spec_version_id] = self.decoder_class.get_fixed_size(
+                    spec_version_id=spec_version_id, **self.kwargs
+                )
+
+        return self.fixed_sizes[spec_version_id]
+
+    def skip(self, data):
+        # Moves the offset of data past one value of this type, without decoding it if its size is fixed
+        fixed_size = self.get_fixed_size(data.context.spec_version_id)
+
+        if fixed_size is None:
+            self.decode(data)
+        else:
+            data.check_read(fixed_size)
+            data.offset += fixed_size
+
+
 # TODO move type_string and sub_type behaviour to this sub class
 class ScaleType(ScaleDecoder, ABC):
 
@@ -16,9 +16,9 @@
 from hashlib import blake2b
 from collections import OrderedDict
 
-from scalecodec.base import ScaleDecoder, ScaleBytes
+from scalecodec.base import ScaleDecoder, ScaleBytes, ScaleType
 from scalecodec.metadata import MetadataDecoder
-from scalecodec.types import Vec, CompactU32, Enum, Bytes, Struct, VecU8Length4
+from scalecodec.types import Vec, CompactU32, Enum, Bytes, Struct, VecU8Length4, U64
 
 
 class ExtrinsicsDecoder(ScaleDecoder):
@@ -37,6 +37,8 @@ class ExtrinsicsDecoder(ScaleDecoder):
         assert (type(metadata) == MetadataDecoder)
 
         self.metadata = metadata
+        # Offset of the extrinsic in the data, a Block decodes its extrinsics in place
+        self.start_offset = 0
         self.extrinsic_length = None
         self.extrinsic_hash = None
         self.version_info = None
@@ -57,28 +59,37 @@ class ExtrinsicsDecoder(ScaleDecoder):
     def generate_hash(self):
         if self.contains_transaction:
 
-            if self.extrinsic_length:
-                extrinsic_data = self.data.data
-            else:
+            extrinsic_data = memoryview(self.data.data)[self.start_offset:self.data.length]
+
+            if not self.extrinsic_length:
                 # Fallback for legacy version, prefix additional Compact<u32> with length
                 extrinsic_length_type = CompactU32(ScaleBytes(bytearray()))
-                extrinsic_length_type.encode(self.data.length)
-                extrinsic_data = extrinsic_length_type.data.data + self.data.data
+                extrinsic_length_type.encode(len(extrinsic_data))
+                extrinsic_data = extrinsic_length_type.data.data + extrinsic_data
 
             return blake2b(extrinsic_data, digest_size=32).digest().hex()
         else:
             return None
 
+    def process_call_index(self):
+        # Direct lookup of the two index bytes in the integer keyed call table, the lookup string of the
+        # call is the hex representation of these bytes
+        call_module_index, call_index = self.data.get_next_bytes(2)
+        self.call_module, self.call = self.metadata.get_call(call_module_index, call_index)
+        self.call_index = self.call.lookup
+        self.raw_value += self.call_index
+
     def process(self):
         # TODO for all attributes
         attribute_types = OrderedDict(self.type_mapping)
 
+        self.start_offset = self.data.offset
         self.extrinsic_length = self.process_type('Compact<u32>').value
 
         if self.extrinsic_length != self.data.get_remaining_length():
             # Fallback for legacy version
             self.extrinsic_length = None
-            self.data.reset()
+            self.data.offset = self.start_offset
 
         self.version_info = self.get_next_bytes(1).hex()
 
@@ -97,7 +108,7 @@ class ExtrinsicsDecoder(ScaleDecoder):
 
                 self.extrinsic_hash = self.generate_hash()
 
-            self.call_index = self.get_next_bytes(2).hex()
+            self.process_call_index()
 
         elif self.version_info == '02' or self.version_info == '82':
 
@@ -114,7 +125,7 @@ class ExtrinsicsDecoder(ScaleDecoder):
 
                 self.extrinsic_hash = self.generate_hash()
 
-            self.call_index = self.get_next_bytes(2).hex()
+            self.process_call_index()
 
         elif self.version_info == '03' or self.version_info == '83':
 
@@ -131,35 +142,34 @@ class ExtrinsicsDecoder(ScaleDecoder):
 
                 self.extrinsic_hash = self.generate_hash()
 
-            self.call_index = self.get_next_bytes(2).hex()
+            self.process_call_index()
 
         else:
             raise NotImplementedError('Extrinsics version "{}" is not implemented'.format(self.version_info))
 
         if self.call_index:
 
-            self.params_raw = self.data.data[self.data.offset:]
+            self.params_raw = self.data.data[self.data.offset:self.data.length]
 
             # Decode params
 
-            self.call = self.metadata.call_index[self.call_index][1]
-            self.call_module = self.metadata.call_index[self.call_index][0]
-
             if self.debug:
                 print('Call: ', self.call.name)
                 print('Module: ', self.call_module.name)
 
-            for arg in self.call.args:
+            arg_plans = self.metadata.get_arg_plans(self.call, self.data.context.spec_version_id)
+
+            for arg, arg_plan in zip(self.call.args, arg_plans):
                 if self.debug:
                     print('Param: ', arg.name, arg.type)
 
-                arg_type_obj = self.process_type(arg.type, metadata=self.metadata)
+                value, value_raw = arg_plan.decode_param(self.data, metadata=self.metadata)
 
                 self.params.append({
                     'name': arg.name,
                     'type': arg.type,
-                    'value': arg_type_obj.serialize(),
-                    'valueRaw': arg_type_obj.raw_value
+                    'value': value,
+                    'valueRaw': value_raw
                 })
 
         result = {
@@ -218,8 +228,11 @@ class EventsDecoder(Vec):
         super().__init__(data, metadata=metadata, **kwargs)
 
     def process(self):
-        print("event process===")
         element_count = self.process_type('Compact<u32>').value
+        self.data.check_elements(element_count, 1)
+
+        if self.data.context.values_only:
+            return list(self.iter_event_values(element_count))
 
         for i in range(0, element_count):
             element = self.process_type('EventRecord', metadata=self.metadata)
@@ -228,6 +241,23 @@ class EventsDecoder(Vec):
 
         return [e.value for e in self.elements]
 
+    def iter_events(self):
+        # Streaming alternative to decode(): yields the value of every event as soon as it is decoded,
+        # nothing is retained by the decoder so the caller can stop at any point
+        element_count = self.process_type('Compact<u32>').value
+        self.data.check_elements(element_count, 1)
+
+        yield from self.iter_event_values(element_count)
+
+    def iter_event_values(self, element_count):
+        # Same event dicts as process(): the EventRecord value with the position of the event in the block
+        # as 'event_idx' (only known here, an EventRecord decoded on its own has no 'event_idx')
+        for event_idx in range(0, element_count):
+            event_record = EventRecord(self.data, metadata=self.metadata)
+            event_record.decode(check_remaining=False)
+            event_record.value['event_idx'] = event_idx
+            yield event_record.value
+
 
 class EventRecord(ScaleDecoder):
 
@@ -255,21 +285,23 @@ class EventRecord(ScaleDecoder):
         if self.phase == 0:
             self.extrinsic_idx = self.process_type('U32').value
 
-        self.type = self.get_next_bytes(2).hex()
+        event_module_index, event_index = self.data.get_next_bytes(2)
+        self.event_module, self.event = self.metadata.get_event(event_module_index, event_index)
+
+        self.type = self.event.lookup
+        self.raw_value += self.type
 
         # Decode params
 
-        self.event = self.metadata.event_index[self.type][1]
-        print(self.event.name)
-        self.event_module = self.metadata.event_index[self.type][0]
+        arg_plans = self.metadata.get_arg_plans(self.event, self.data.context.spec_version_id)
 
-        for arg_type in self.event.args:
-            arg_type_obj = self.process_type(arg_type)
+        for arg_type, arg_plan in zip(self.event.args, arg_plans):
+            value, value_raw = arg_plan.decode_param(self.data)
 
             self.params.append({
                 'type': arg_type,
-                'value': arg_type_obj.serialize(),
-                'valueRaw': arg_type_obj.raw_value
+                'value': value,
+                'valueRaw': value_raw
             })
 
         # Topics introduced since MetadataV5
@@ -344,10 +376,35 @@ class PreRuntime(Struct):
     type_mapping = (('engine', 'ConsensusEngineId'), ('data', 'Bytes'))
 
 
+class CrfgLog(ScaleType):
+    type_string = 'Crfg'
+
+    def __init__(self, data, **kwargs):
+        self.delay = None
+        super().__init__(data, **kwargs)
+
+    def process(self):
+        # AuthoritiesChangeSignal(N, Vec<(SessionKey, u64)>)
+        self.delay = self.process_type('BlockNumber').value
+        return self.process_type('Vec<(SessionKey, u64)>').value
+
+
+class FinalityTrackerLog(U64):
+    type_string = 'Finalitytracker'
+
+
 class LogDigest(Enum):
     value_list = ['Other', 'AuthoritiesChange', 'ChangesTrieRoot', 'Seal', 'Consensus', 'SealV0', 'PreRuntime']
 
-    # value_list = ['System', 'Consensus', 'Sharding', 'Crfg']
+    # Yee modules put their logs in an 'Other' item, the payload is prefixed with the module and enum variant byte
+    other_log_types = {
+        (2, 0): 'ShardInfoLog',
+        (3, 0): 'CrfgLog',
+        (4, 0): 'FinalityTrackerLog',
+    }
+
+    # The other log items are decoded as the type named after their variant
+    log_type_mapping = tuple(zip(value_list, value_list))
 
     def __init__(self, data, **kwargs):
         self.log_type = None
@@ -355,24 +412,148 @@ class LogDigest(Enum):
         super().__init__(data, **kwargs)
 
     def process(self):
-        self.index = int(self.get_next_bytes(1).hex())
+        self.index = self.get_next_u8()
         self.index_value = self.value_list[self.index]
 
-        if self.data.__str__()[0:10] == '0x00180200':
-            self.data = ScaleBytes('0x' + self.data.__str__()[10:18])
-            self.log_type = self.process_type('ShardInfoLog')
-            return {'type': self.log_type.type_string, 'value': self.log_type.value}
+        if self.index_value == 'Other':
+            length = self.process_type('Compact<u32>').value
+            self.data.check_bytes(length)
+            end_offset = self.data.offset + length
 
-        if self.data.__str__()[0:10] == '0x00280400':
-            self.data = ScaleBytes('0x' + self.data.__str__()[10:26])
-            self.log_type = self.process_type('U64')
-            return {'type': 'Finalitytracker', 'value': self.log_type.value}
+            log_key = tuple(self.data.data[self.data.offset:self.data.offset + 2])
 
-        if self.data.__str__()[0:12] == '0x00ed030300':
-            self.data = ScaleBytes('0x' + self.data.__str__()[28:])
-            self.log_type = self.process_type('Vec<(SessionKey, u64)>')
-            return {'type': 'Crfg', 'value': self.log_type.value}
+            if length >= 2 and log_key in self.other_log_types:
+                self.get_next_bytes(2)
+                self.log_type = self.process_type(self.other_log_types[log_key])
 
-        self.log_type = self.process_type(self.value_list[self.index])
+                if self.data.offset == end_offset:
+                    return {'type': self.log_type.type_string, 'value': self.log_type.value}
+
+            # Unknown or malformed payload: return it as is
+            self.log_type = None
+            self.data.offset = end_offset - length
+            return {'type': 'Other', 'value': '0x{}'.format(self.get_next_bytes(length).hex())}
+
+        variant_decoders = self.get_variant_decoders(self.log_type_mapping, self.data.context.spec_version_id)
+        self.log_type = variant_decoders[self.index][1].decode(self.data)
         return {'type': self.log_type.type_string, 'value': self.log_type.value}
 
+
+class Header(ScaleType):
+    type_mapping = (
+        ('parent_hash', 'H256'),
+        ('number', 'Compact<BlockNumber>'),
+        ('state_root', 'H256'),
+        ('extrinsics_root', 'H256'),
+        ('digest', 'Vec<LogDigest>'),
+    )
+
+    def __init__(self, data, sub_type=None, **kwargs):
+        # Hashes are in the byte output of the context, with memoryview output they are slices of the decoded
+        # data and no copies are made until serialized
+        self.parent_hash = None
+        self.number = None
+        self.state_root = None
+        self.extrinsics_root = None
+        self.logs = []
+        super().__init__(data, sub_type, **kwargs)
+
+    def process(self):
+        self.parent_hash = self.get_next_output(32)
+        self.number = CompactU32(self.data).process()
+        self.state_root = self.get_next_output(32)
+        self.extrinsics_root = self.get_next_output(32)
+
+        log_count = CompactU32(self.data).process()
+        self.data.check_elements(log_count, 1)
+
+        for _ in range(0, log_count):
+            log_digest = LogDigest(self.data)
+            log_digest.decode(check_remaining=False)
+            self.logs.append(log_digest)
+
+        return {
+            'parent_hash': self.parent_hash,
+            'number': self.number,
+            'state_root': self.state_root,
+            'extrinsics_root': self.extrinsics_root,
+            'digest': {'logs': [log.value for log in self.logs]}
+        }
+
+    @classmethod
+    def decode_batch(cls, headers):
+        # Decode many raw headers (hex, bytes or ScaleBytes) at once, e.g. during fast sync
+        result = []
+
+        for header_data in headers:
+            if type(header_data) is not ScaleBytes:
+                if type(header_data) is str:
+                    header_data = bytes.fromhex(header_data[2:] if header_data[0:2] == '0x' else header_data)
+                header_data = ScaleBytes(header_data)
+
+            header = cls(header_data)
+            result.append(header.decode())
+
+        return result
+
+
+class Block(ScaleDecoder):
+
+    def __init__(self, data, sub_type=None, metadata: MetadataDecoder = None):
+
+        assert (type(metadata) == MetadataDecoder)
+
+        self.metadata = metadata
+        self.header = None
+        self.extrinsics = []
+        super().__init__(data, sub_type)
+
+    def process_header(self):
+        # Decodes the header and returns the extrinsic count
+        self.header = Header(self.data)
+        self.header.decode(check_remaining=False)
+
+        extrinsic_count = CompactU32(self.data).process()
+        # Every extrinsic has at least its length prefix
+        self.data.check_elements(extrinsic_count, 1)
+
+        return extrinsic_count
+
+    def process_extrinsic(self):
+        # Every extrinsic is decoded in place, with the end of the data limited to its length prefixed data
+        # (needed for the extrinsic hash)
+        start_offset = self.data.offset
+        extrinsic_length = CompactU32(self.data).process()
+        self.data.check_bytes(extrinsic_length)
+
+        block_length = self.data.length
+        self.data.length = self.data.offset + extrinsic_length
+        self.data.offset = start_offset
+
+        try:
+            extrinsic = ExtrinsicsDecoder(data=self.data, metadata=self.metadata)
+            extrinsic.decode()
+        finally:
+            self.data.offset = self.data.length
+            self.data.length = block_length
+
+        return extrinsic
+
+    def process(self):
+        extrinsic_count = self.process_header()
+
+        for _ in range(0, extrinsic_count):
+            self.extrinsics.append(self.process_extrinsic())
+
+        return {
+            'header': self.header.value,
+            'extrinsics': [e.value for e in self.extrinsics]
+        }
+
+    def iter_extrinsics(self):
+        # Streaming alternative to decode(): decodes the header (self.header) and yields the value of every
+        # extrinsic as soon as it is decoded, the extrinsic decoders are not retained
+        extrinsic_count = self.process_header()
+
+        for _ in range(0, extrinsic_count):
+            yield self.process_extrinsic().value
@@ -0,0 +1,101 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import json
+import os
+import tempfile
+from hashlib import blake2b
+
+from scalecodec.base import ScaleBytes, DecodeContext
+from scalecodec.metadata import MetadataDecoder
+
+
+class MetadataCache:
+
+    # Increase when the normalized metadata format changes, older cache files are then ignored
+    format_version = 1
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def get_metadata_bytes(metadata_data):
+        if type(metadata_data) is str:
+            return bytes.fromhex(metadata_data[2:] if metadata_data[0:2] == '0x' else metadata_data)
+        return bytes(metadata_data)
+
+    @classmethod
+    def get_metadata_hash(cls, metadata_data):
+        return blake2b(cls.get_metadata_bytes(metadata_data), digest_size=32).hexdigest()
+
+    def get_path(self, metadata_hash):
+        return os.path.join(self.directory, '{}.json'.format(metadata_hash))
+
+    def load(self, metadata_hash, spec_version_id='default', compile_plans=True):
+        # Returns the cached MetadataDecoder or None if not present (or unreadable), spec_version_id and
+        # compile_plans are passed to MetadataDecoder.from_normalized()
+        try:
+            with open(self.get_path(metadata_hash), 'r') as cache_file:
+                cache_data = json.load(cache_file)
+
+            if cache_data.get('format_version') != self.format_version:
+                return None
+
+            return MetadataDecoder.from_normalized(
+                cache_data['metadata'], spec_version_id=spec_version_id, compile_plans=compile_plans
+            )
+
+        except (OSError, ValueError, KeyError, IndexError, TypeError):
+            return None
+
+    def store(self, metadata_hash, metadata_decoder):
+        cache_data = {
+            'format_version': self.format_version,
+            'metadata': metadata_decoder.get_normalized()
+        }
+
+        # Write to a temporary file and atomically move it into place, so concurrent writers of the
+        # same entry never leave a partially written file for readers
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix='.{}-'.format(metadata_hash), suffix='.tmp')
+
+        try:
+            with os.fdopen(fd, 'w') as tmp_file:
+                json.dump(cache_data, tmp_file, separators=(',', ':'))
+            os.replace(tmp_path, self.get_path(metadata_hash))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def get(self, metadata_data, spec_version_id='default', compile_plans=True):
+        # Returns the MetadataDecoder for the provided encoded metadata (hex or bytes), decoded once and
+        # loaded from the cache afterwards. The decoder plans are compiled for spec_version_id, with
+        # compile_plans=False compile_decoder_plans() should be called by the caller.
+        metadata_bytes = self.get_metadata_bytes(metadata_data)
+        metadata_hash = blake2b(metadata_bytes, digest_size=32).hexdigest()
+
+        metadata_decoder = self.load(metadata_hash, spec_version_id, compile_plans)
+
+        if metadata_decoder is None:
+            # Docs are not part of the cached runtime, so they are skipped here as well
+            metadata_decoder = MetadataDecoder(
+                ScaleBytes(metadata_bytes, context=DecodeContext(skip_docs=True)), compile_plans=compile_plans,
+                spec_version_id=spec_version_id
+            )
+            metadata_decoder.decode()
+            self.store(metadata_hash, metadata_decoder)
+
+        return metadata_decoder
@@ -0,0 +1,249 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Generates a straight-line Python function per Struct (and tuple) decoder plan, which reads the fields of
+# fixed width primitives, compacts and bytes inline and only falls back to decoder objects for other fields.
+# The generated function takes a ScaleBytes (and optionally the metadata), returns the same value as
+# Struct.process() and leaves the offset after the struct.
+
+from scalecodec.base import ScaleDecoder
+from scalecodec.exceptions import InvalidScaleTypeValueException
+from scalecodec.types import Struct, Compact, CompactU32, Bytes, U8, U16, U32, U64, U128, H256, H512, Bool, \
+    AccountId
+
+# Inlined reads by the process function of the decoder class, so subclasses that override process() are not
+# inlined, with the number of bytes read
+int_process = {
+    U8.process: 1,
+    U16.process: 2,
+    U32.process: 4,
+    U64.process: 8,
+    U128.process: 16,
+}
+
+# Hashes and account ids, with the number of bytes read and if the value is interned
+hex_process = {
+    H256.process: (32, False),
+    AccountId.process: (32, True),
+    H512.process: (64, False),
+}
+
+# Compiled code by generated source, plans of different runtimes with the same layout share the code
+compiled_code = {}
+
+
+def check_length(data, offset):
+    # Reads past the end of the data raise, like ScaleBytes.get_next_bytes()
+    if offset > len(data):
+        raise ValueError('Not enough data to read past offset {}'.format(len(data)))
+
+
+def decode_compact(data, offset, size=None):
+    # Same result as CompactU32.process(), or with the size of T as Compact<T> for an unsigned integer T, which
+    # only decodes the first <size> bytes of the value
+    if offset >= len(data):
+        raise ValueError('Not enough data to read 1 bytes at offset {}'.format(offset))
+
+    mode = data[offset] & 0b11
+
+    if mode == 3:
+        length = (data[offset] >> 2) + 4
+        check_length(data, offset + 1 + length)
+        return int.from_bytes(data[offset + 1:offset + 1 + min(length, size or length)], 'little'), offset + 1 + length
+
+    length = 1 << mode
+    check_length(data, offset + length)
+
+    return int.from_bytes(data[offset:offset + min(length, size or length)], 'little') >> 2, offset + length
+
+
+def decode_bytes(data, offset):
+    # Same result as Bytes.process(), data is the ScaleBytes
+    length, offset = decode_compact(data.data, offset)
+
+    data.offset = offset
+    data.check_bytes(length)
+
+    value = data.data[offset:offset + length]
+
+    if data.context.decode_utf8:
+        try:
+            return value.decode(), offset + length
+        except UnicodeDecodeError:
+            pass
+
+    if data.context.byte_output == 'hex':
+        return value.hex(), offset + length
+
+    return data.get_next_output(length), offset + length
+
+
+def read_output(data, offset, length, intern):
+    # Same result as get_next_output() of a hash decoder for the bytes and memoryview output, the end of the data
+    # is checked by the generated decoder after the fixed fields
+    value = data.get_output(offset, length)
+
+    if intern and data.context.intern_table is not None and type(value) is bytes:
+        return data.context.intern_table.intern(value)
+
+    return value
+
+
+def decode_bool(data, offset):
+    check_length(data, offset + 1)
+
+    if data[offset:offset + 1] not in (b'\x00', b'\x01'):
+        raise InvalidScaleTypeValueException('Invalid value for datatype "bool"')
+    return data[offset] == 1, offset + 1
+
+
+def is_struct_plan(decoder_plan):
+    return decoder_plan.decoder_class is not None and decoder_plan.decoder_class.process is Struct.process \
+        and get_type_mapping(decoder_plan) is not None
+
+
+def get_type_mapping(decoder_plan):
+    if 'type_mapping' in decoder_plan.kwargs:
+        return decoder_plan.kwargs['type_mapping']
+
+    if decoder_plan.decoder_class.type_mapping is None:
+        decoder_plan.decoder_class.build_type_mapping()
+
+    return decoder_plan.decoder_class.type_mapping
+
+
+def is_int_plan(decoder_plan):
+    return decoder_plan.decoder_class is not None and decoder_plan.decoder_class.process in int_process
+
+
+def offset_source(position):
+    return 'o + {}'.format(position) if position else 'o'
+
+
+def generate_fixed_field(index, field_plan, position):
+    # Returns the source lines reading fixed width field value v<index> at <position> bytes after offset o and
+    # its size, or None for other fields. Consecutive fixed fields are read at precomputed positions and the
+    # offset is moved once.
+    process = field_plan.decoder_class.process if field_plan.decoder_class else None
+
+    if process in int_process:
+        size = int_process[process]
+        return ["v{} = int.from_bytes(d[{}:{}], 'little')".format(
+            index, offset_source(position), offset_source(position + size)
+        )], size
+
+    if process in hex_process:
+        # Hex strings are read inline when the context has hex output (local h), other byte outputs are read
+        # by read_output(). Account ids go through the intern table (local i) of the context, like AccountId.process()
+        size, intern = hex_process[process]
+        lines = ["v{} = '0x' + d[{}:{}].hex() if h else read_output(data, {}, {}, {})".format(
+            index, offset_source(position), offset_source(position + size), offset_source(position), size, intern
+        )]
+
+        if intern:
+            lines += ['if h and i is not None:', '    v{} = i.intern(v{})'.format(index, index)]
+
+        return lines, size
+
+
+def generate_field(index, field_plan, spec_version_id, namespace):
+    # Returns the source lines reading field value v<index>, local o is the offset in d (the raw data)
+    decoder_class = field_plan.decoder_class
+    process = decoder_class.process if decoder_class else None
+
+    if process is CompactU32.process:
+        return ['v{}, o = decode_compact(d, o)'.format(index)]
+
+    if process is Compact.process and field_plan.kwargs.get('sub_type'):
+        sub_type_plan = ScaleDecoder.get_decoder_plan(field_plan.kwargs['sub_type'], spec_version_id)
+
+        if is_int_plan(sub_type_plan):
+            size = int_process[sub_type_plan.decoder_class.process]
+            return ['v{}, o = decode_compact(d, o, {})'.format(index, size)]
+
+    if process is Bytes.process:
+        return ['v{}, o = decode_bytes(data, o)'.format(index)]
+
+    if process is Bool.process:
+        return ['v{}, o = decode_bool(d, o)'.format(index)]
+
+    if is_struct_plan(field_plan) and field_plan.get_value_decoder(spec_version_id):
+        # Nested structs are generated as well and called with the offset synchronized
+        namespace['f{}'.format(index)] = field_plan.get_value_decoder(spec_version_id)
+        return ['data.offset = o', 'v{} = f{}(data, metadata)'.format(index, index), 'o = data.offset']
+
+    # Like Struct, the metadata is passed to all field decoders
+    namespace['p{}'.format(index)] = field_plan
+    return [
+        'data.offset = o', 'v{} = p{}.decode(data, metadata=metadata).value'.format(index, index), 'o = data.offset'
+    ]
+
+
+def generate_struct_decoder(decoder_plan, spec_version_id='default'):
+    type_mapping = get_type_mapping(decoder_plan)
+
+    namespace = {
+        'decode_compact': decode_compact,
+        'decode_bytes': decode_bytes,
+        'decode_bool': decode_bool,
+        'read_output': read_output,
+        'check_length': check_length,
+    }
+
+    lines = ['def decode(data, metadata=None):', '    d = data.data', '    o = data.offset']
+
+    position = 0
+
+    for index, (key, data_type) in enumerate(type_mapping):
+        field_plan = ScaleDecoder.get_decoder_plan(data_type, spec_version_id=spec_version_id)
+        fixed_field = generate_fixed_field(index, field_plan, position)
+
+        if fixed_field:
+            lines += ['    ' + line for line in fixed_field[0]]
+            position += fixed_field[1]
+            continue
+
+        if position:
+            lines += ['    o += {}'.format(position), '    check_length(d, o)']
+            position = 0
+
+        lines += ['    ' + line for line in generate_field(index, field_plan, spec_version_id, namespace)]
+
+    if position:
+        lines += ['    o += {}'.format(position), '    check_length(d, o)']
+
+    if any(line.startswith('    if h and i is not None') for line in lines):
+        lines.insert(3, '    i = data.context.intern_table')
+
+    if any(' if h else ' in line for line in lines):
+        lines.insert(3, "    h = data.context.byte_output == 'hex'")
+
+    lines.append('    data.offset = o')
+    lines.append('    return {{{}}}'.format(', '.join(
+        '{!r}: v{}'.format(key, index) for index, (key, data_type) in enumerate(type_mapping)
+    )))
+
+    source = '\n'.join(lines)
+
+    if source not in compiled_code:
+        compiled_code[source] = compile(source, '<struct {}>'.format(decoder_plan.type_string), 'exec')
+
+    exec(compiled_code[source], namespace)
+
+    decode = namespace['decode']
+    decode.source = source
+
+    return decode
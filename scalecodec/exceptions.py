@@ -23,3 +23,7 @@ class RemainingScaleBytesNotEmptyException(Exception):
 
 class InvalidScaleTypeValueException(Exception):
     pass
+
+
+class DecodeLimitExceededException(Exception):
+    pass
@@ -0,0 +1,236 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from hashlib import blake2b
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+class XXH64:
+
+    # Pure Python XXH64, with the subset of the xxhash.xxh64 interface used by the storage hashers.
+    # Only used when the xxhash package is not installed.
+
+    P1 = 11400714785074694791
+    P2 = 14029467366897019727
+    P3 = 1609587929392839161
+    P4 = 9650029242287828579
+    P5 = 2870177450012600261
+    MASK = 0xffffffffffffffff
+
+    def __init__(self, data=b'', seed=0):
+        self.seed = seed
+        self.total_length = 0
+        self.buffer = b''
+        self.v1 = (seed + self.P1 + self.P2) & self.MASK
+        self.v2 = (seed + self.P2) & self.MASK
+        self.v3 = seed & self.MASK
+        self.v4 = (seed - self.P1) & self.MASK
+
+        if data:
+            self.update(data)
+
+    @classmethod
+    def rotl(cls, value, bits):
+        return ((value << bits) | (value >> (64 - bits))) & cls.MASK
+
+    @classmethod
+    def round(cls, acc, lane):
+        acc = (acc + lane * cls.P2) & cls.MASK
+        return (cls.rotl(acc, 31) * cls.P1) & cls.MASK
+
+    @classmethod
+    def merge_round(cls, acc, value):
+        acc ^= cls.round(0, value)
+        return (acc * cls.P1 + cls.P4) & cls.MASK
+
+    def update(self, data):
+        self.total_length += len(data)
+        data = self.buffer + bytes(data)
+
+        stripes_end = len(data) - len(data) % 32
+
+        if stripes_end:
+            v1, v2, v3, v4 = self.v1, self.v2, self.v3, self.v4
+            round_ = self.round
+
+            for offset in range(0, stripes_end, 32):
+                v1 = round_(v1, int.from_bytes(data[offset:offset + 8], 'little'))
+                v2 = round_(v2, int.from_bytes(data[offset + 8:offset + 16], 'little'))
+                v3 = round_(v3, int.from_bytes(data[offset + 16:offset + 24], 'little'))
+                v4 = round_(v4, int.from_bytes(data[offset + 24:offset + 32], 'little'))
+
+            self.v1, self.v2, self.v3, self.v4 = v1, v2, v3, v4
+
+        self.buffer = data[stripes_end:]
+
+    def copy(self):
+        other = XXH64.__new__(XXH64)
+        other.__dict__.update(self.__dict__)
+        return other
+
+    def intdigest(self):
+        mask = self.MASK
+
+        if self.total_length >= 32:
+            h = (self.rotl(self.v1, 1) + self.rotl(self.v2, 7) + self.rotl(self.v3, 12) + self.rotl(self.v4, 18)) & mask
+            for v in (self.v1, self.v2, self.v3, self.v4):
+                h = self.merge_round(h, v)
+        else:
+            h = (self.seed + self.P5) & mask
+
+        h = (h + self.total_length) & mask
+
+        data = self.buffer
+        offset = 0
+
+        while offset + 8 <= len(data):
+            h ^= self.round(0, int.from_bytes(data[offset:offset + 8], 'little'))
+            h = (self.rotl(h, 27) * self.P1 + self.P4) & mask
+            offset += 8
+
+        if offset + 4 <= len(data):
+            h ^= (int.from_bytes(data[offset:offset + 4], 'little') * self.P1) & mask
+            h = (self.rotl(h, 23) * self.P2 + self.P3) & mask
+            offset += 4
+
+        while offset < len(data):
+            h ^= (data[offset] * self.P5) & mask
+            h = (self.rotl(h, 11) * self.P1) & mask
+            offset += 1
+
+        h ^= h >> 33
+        h = (h * self.P2) & mask
+        h ^= h >> 29
+        h = (h * self.P3) & mask
+        h ^= h >> 32
+
+        return h
+
+
+def xxh64(data=b'', seed=0):
+    if xxhash:
+        return xxhash.xxh64(data, seed=seed)
+    return XXH64(data, seed=seed)
+
+
+class Hasher:
+
+    # Storage hasher, optionally with a prefix that is already absorbed into the hash state so hashing
+    # many keys with the same prefix only processes the keys
+
+    def __init__(self, prefix=b''):
+        self.prefix = prefix
+
+    def hash(self, data):
+        raise NotImplementedError()
+
+
+class Blake2Hasher(Hasher):
+
+    digest_size = None
+
+    def __init__(self, prefix=b''):
+        super().__init__(prefix)
+        self.state = blake2b(prefix, digest_size=self.digest_size)
+
+    def hash(self, data):
+        state = self.state.copy()
+        state.update(data)
+        return state.digest()
+
+
+class Blake2_128(Blake2Hasher):
+    digest_size = 16
+
+
+class Blake2_256(Blake2Hasher):
+    digest_size = 32
+
+
+class TwoxHasher(Hasher):
+
+    seeds = ()
+
+    def __init__(self, prefix=b''):
+        super().__init__(prefix)
+        self.states = [xxh64(prefix, seed=seed) for seed in self.seeds]
+
+    def hash(self, data):
+        digest = b''
+        for state in self.states:
+            state = state.copy()
+            state.update(data)
+            digest += state.intdigest().to_bytes(8, 'little')
+        return digest
+
+
+class Twox64(TwoxHasher):
+    seeds = (0,)
+
+
+class Twox128(TwoxHasher):
+    seeds = (0, 1)
+
+
+class Twox256(TwoxHasher):
+    seeds = (0, 1, 2, 3)
+
+
+class Twox128Concat(Twox128):
+
+    def hash(self, data):
+        return super().hash(data) + self.prefix + bytes(data)
+
+
+hashers = {
+    'blake2128': Blake2_128,
+    'blake2256': Blake2_256,
+    'twox64': Twox64,
+    'twox128': Twox128,
+    'twox256': Twox256,
+    'twox128concat': Twox128Concat,
+}
+
+
+def get_hasher(name, prefix=b''):
+    # Accepts the StorageHasher names (e.g. 'Twox128Concat') as well as the function names used as
+    # key2Hasher in MetadataV4 (e.g. 'blake2_256')
+    hasher_class = hashers.get(name.lower().replace('_', ''))
+
+    if hasher_class is None:
+        raise ValueError("Hasher '{}' not supported".format(name))
+
+    return hasher_class(prefix)
+
+
+def blake2_128(data):
+    return Blake2_128().hash(data)
+
+
+def blake2_256(data):
+    return Blake2_256().hash(data)
+
+
+def twox_128(data):
+    return Twox128().hash(data)
+
+
+def twox_256(data):
+    return Twox256().hash(data)
@@ -14,238 +14,621 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from scalecodec.base import ScaleDecoder, ScaleType
+import copy
+import sys
+
+from scalecodec.base import ScaleDecoder, ScaleType, ScaleBytes, DecoderPlan, RuntimeConfiguration, DecodeContext
+from scalecodec.storage import StorageKeyBuilder, StorageValueDecoder
+
+
+def intern_string(value):
+    # Only strings can be interned, e.g. lookups of calls outside the index are None
+    if type(value) is str:
+        return sys.intern(value)
+
+    return value
+
+
+def get_metadata_context(context):
+    # Names, types and docs of the metadata are always decoded as UTF-8 text and hex strings, whatever the
+    # byte output of the decode context (the other options apply)
+    if context.byte_output == 'hex' and context.decode_utf8:
+        return context
+
+    metadata_context = copy.copy(context)
+    metadata_context.byte_output = 'hex'
+    metadata_context.decode_utf8 = True
+
+    return metadata_context
+
+
+def decode_with_metadata_context(decode, data, check_remaining):
+    # Calls decode() of a metadata decoder with the metadata context on its data, the context of the caller's
+    # ScaleBytes is restored afterwards
+    context = data.context
+    data.context = get_metadata_context(context)
+
+    try:
+        return decode(check_remaining)
+    finally:
+        data.context = context
 
 
 class MetadataDecoder(ScaleDecoder):
 
-    def __init__(self, data, **kwargs):
+    versions = [
+        "MetadataV0Decoder",
+        "MetadataV1Decoder",
+        "MetadataV2Decoder",
+        "MetadataV3Decoder",
+        "MetadataV4Decoder",
+        "MetadataV5Decoder",
+        "MetadataV6Decoder",
+        "MetadataV7Decoder",
+    ]
+
+    def __init__(self, data, compile_plans=True, spec_version_id=None, **kwargs):
+        # With compile_plans=False compile_decoder_plans() should be called after decoding, e.g. to reuse
+        # the plans of a previous runtime (otherwise the plans are compiled on first use).
+        # The argument plans of calls and events are compiled for the type registry of spec_version_id (by
+        # default the spec version of the decode context).
+        self.compile_plans = compile_plans
+        self.spec_version_id = str(spec_version_id if spec_version_id is not None else data.context.spec_version_id)
         self.version = None
         self.metadata = None
         self.call_index = None
         self.event_index = None
+        self.call_index_table = None
+        self.event_index_table = None
+        self.storage_key_builders = {}
+        self.storage_value_decoders = {}
+        self.constant_values = {}
+        self.decoder_plans_key = None
+        # Plans of extrinsics and events decoded with another spec version, by call or event
+        self.spec_version_arg_plans = {}
+        self.spec_version_arg_plans_key = None
         super().__init__(data, **kwargs)
 
+    def decode(self, check_remaining=True):
+        return decode_with_metadata_context(super().decode, self.data, check_remaining)
+
+    @property
+    def value(self):
+        if self.metadata is not None:
+            return self.metadata.value
+
+    @value.setter
+    def value(self, value):
+        # Value is a view on the decoded metadata, assignments (e.g. by decode()) are ignored
+        pass
+
     def process(self):
         magic_bytes = self.get_next_bytes(4)
 
         if magic_bytes == b'meta':
 
-            self.version = self.process_type('Enum', value_list=[
-                "MetadataV0Decoder",
-                "MetadataV1Decoder",
-                "MetadataV2Decoder",
-                "MetadataV3Decoder",
-                "MetadataV4Decoder",
-                "MetadataV5Decoder",
-                "MetadataV6Decoder",
-                "MetadataV7Decoder",
-            ])
+            self.version = self.process_type('Enum', value_list=self.versions)
 
             self.metadata = self.process_type(self.version.value)
 
-            # TODO remove duplicate reference?
-            self.call_index = self.metadata.call_index
-            self.event_index = self.metadata.event_index
-
-            return self.metadata.value
-
         else:
             # Fall back to version unaware legacy MetadataV0
             self.data.reset()
 
             self.metadata = self.process_type('MetadataV0Decoder')
 
-            # TODO remove duplicate reference?
-            self.call_index = self.metadata.call_index
-            self.event_index = self.metadata.event_index
+        # TODO remove duplicate reference?
+        self.call_index = self.metadata.call_index
+        self.event_index = self.metadata.event_index
+        self.build_index_tables()
+        self.intern_names()
+
+        if self.compile_plans:
+            self.compile_decoder_plans()
+
+    def build_index_tables(self):
+        # Integer keyed alternative of call_index and event_index: table[module index][call or event index]
+        # so decoders can look up the two raw index bytes directly
+        self.call_index_table = self.get_index_table(self.call_index)
+        self.event_index_table = self.get_index_table(self.event_index)
+
+    def intern_names(self):
+        # The module, call and event names, lookups and argument types end up in every decoded extrinsic and
+        # event, interned they are shared with all other runtimes and identical strings in this one
+        for module, call in self.call_index.values():
+            module.name = intern_string(module.name)
+            module.identifier = intern_string(module.identifier)
+            call.name = intern_string(call.name)
+            call.lookup = intern_string(call.lookup)
+
+            for arg in call.args:
+                arg.name = intern_string(arg.name)
+                arg.type = intern_string(arg.type)
+
+        for module, event in self.event_index.values():
+            module.name = intern_string(module.name)
+            module.identifier = intern_string(module.identifier)
+            event.name = intern_string(event.name)
+            event.lookup = intern_string(event.lookup)
+            event.args = [intern_string(arg_type) for arg_type in event.args]
+
+    @staticmethod
+    def get_index_table(index):
+        index_table = []
+
+        for lookup, item in index.items():
+            module_index = int(lookup[0:2], 16)
+            item_index = int(lookup[2:4], 16)
+
+            while len(index_table) <= module_index:
+                index_table.append([])
 
-            return self.metadata.value
+            module_items = index_table[module_index]
+
+            while len(module_items) <= item_index:
+                module_items.append(None)
+
+            module_items[item_index] = item
+
+        return index_table
+
+    def compile_decoder_plans(self, spec_version_id=None, previous=None):
+        # Resolve the argument types of all calls and events once, decoding extrinsics and events then
+        # only walks the prebuilt plans. Unsupported types only fail when actually decoded.
+        # When the previous runtime (MetadataDecoder) is provided, the plan lists of calls and events and the
+        # storage key builders and value decoders that are unchanged according to MetadataDiff are shared with
+        # that runtime instead of compiled again.
+        if spec_version_id is not None:
+            self.spec_version_id = str(spec_version_id)
+
+        spec_version_id = self.spec_version_id
+        previous_calls = {}
+        previous_events = {}
+
+        self.decoder_plans_key = (spec_version_id, RuntimeConfiguration.decoder_plans_generation)
+
+        if previous is not None and self.is_plan_compatible(previous):
+            metadata_diff = self.diff(previous)
+            previous_calls = metadata_diff.get_unchanged_items('calls')
+            previous_events = metadata_diff.get_unchanged_items('events')
+            self.reuse_storage_decoders(previous, metadata_diff.get_unchanged_items('storage'))
+
+        for module, call in self.call_index.values():
+            previous_call = previous_calls.get((module.name, call.name))
+
+            if previous_call and previous_call.arg_plans is not None:
+                call.arg_plans = previous_call.arg_plans
+            else:
+                call.arg_plans = [self.get_arg_decoder_plan(arg.type, spec_version_id) for arg in call.args]
+
+        for module, event in self.event_index.values():
+            previous_event = previous_events.get((module.name, event.name))
+
+            if previous_event and previous_event.arg_plans is not None:
+                event.arg_plans = previous_event.arg_plans
+            else:
+                event.arg_plans = [self.get_arg_decoder_plan(arg_type, spec_version_id) for arg_type in event.args]
+
+    def reuse_storage_decoders(self, previous, previous_entries):
+        # Shares the storage key builders and value decoders of the previous runtime for the unchanged storage
+        # entries (by module and entry name), when they were built for the type registry of its plans
+        for decoders, previous_decoders in (
+                (self.storage_key_builders, previous.storage_key_builders),
+                (self.storage_value_decoders, previous.storage_value_decoders)):
+
+            for cache_key, decoder in list(previous_decoders.items()):
+                module_name, entry_name, spec_version_id, generation = cache_key
+
+                if (spec_version_id, generation) == previous.decoder_plans_key:
+                    module, entry = previous.get_storage_entry(module_name, entry_name)
+
+                    if previous_entries.get((module.name, entry_name)) is entry:
+                        decoders[(module_name, entry_name) + self.decoder_plans_key] = decoder
+
+    def is_plan_compatible(self, previous):
+        # Plans can only be shared when compiled for the same type registry: the same generation and the same
+        # types for both spec versions (e.g. a runtime upgrade without type registry changes)
+        if previous.decoder_plans_key is None or previous.decoder_plans_key[1] != self.decoder_plans_key[1]:
+            return False
+
+        runtime_config = RuntimeConfiguration()
+
+        return runtime_config.get_spec_version_view(previous.decoder_plans_key[0]) == \
+            runtime_config.get_spec_version_view(self.decoder_plans_key[0])
+
+    def get_arg_plans(self, item, spec_version_id=None):
+        # Decoder plans of the arguments of a call or event for the type registry of the spec version (by default
+        # self.spec_version_id). The plans are compiled on first use and again after the type registry changed
+        # (e.g. by update_type_registry()).
+        spec_version_id = self.spec_version_id if spec_version_id is None else str(spec_version_id)
+        generation = RuntimeConfiguration.decoder_plans_generation
 
+        if spec_version_id == self.spec_version_id:
+            if self.decoder_plans_key != (spec_version_id, generation):
+                self.compile_decoder_plans()
 
-class MetadataV4Decoder(ScaleDecoder):
+            return item.arg_plans
 
-    def __init__(self, data, sub_type=None):
-        self.version = None
-        self.modules = []
-        self.call_index = {}
-        self.event_index = {}
+        # Other spec versions (e.g. one runtime decoding a range of spec versions) compile per call or event
+        if self.spec_version_arg_plans_key != (spec_version_id, generation):
+            self.spec_version_arg_plans = {}
+            self.spec_version_arg_plans_key = (spec_version_id, generation)
 
-        super().__init__(data, sub_type)
+        arg_plans = self.spec_version_arg_plans.get(item)
 
-    def process(self):
-        result_data = {
-            "magicNumber": 1635018093,  # struct.unpack('<L', bytearray.fromhex("6174656d")),
-            "metadata": {
-                "MetadataV4": {
-                    "modules": [],
-                }
+        if arg_plans is None:
+            arg_types = [arg.type for arg in item.args] if type(item) is Call else item.args
+            arg_plans = [self.get_arg_decoder_plan(arg_type, spec_version_id) for arg_type in arg_types]
+            self.spec_version_arg_plans[item] = arg_plans
+
+        return arg_plans
+
+    def diff(self, previous):
+        # Changes of this runtime compared to the previous runtime (MetadataDecoder)
+        return MetadataDiff(previous, self)
+
+    @classmethod
+    def get_arg_decoder_plan(cls, type_string, spec_version_id='default'):
+        try:
+            return cls.get_decoder_plan(type_string, spec_version_id=spec_version_id)
+        except NotImplementedError:
+            return DecoderPlan(type_string, None)
+
+    def get_call(self, call_module_index, call_index):
+        try:
+            call = self.call_index_table[call_module_index][call_index]
+        except IndexError:
+            call = None
+
+        if call is None:
+            raise ValueError("Call index '{:02x}{:02x}' not found in metadata".format(call_module_index, call_index))
+
+        return call
+
+    def get_event(self, event_module_index, event_index):
+        try:
+            event = self.event_index_table[event_module_index][event_index]
+        except IndexError:
+            event = None
+
+        if event is None:
+            raise ValueError("Event index '{:02x}{:02x}' not found in metadata".format(event_module_index, event_index))
+
+        return event
+
+    def get_storage_entry(self, module_name, entry_name):
+        for module in self.metadata.modules:
+            if module_name in (module.name, module.prefix) and module.storage:
+                for entry in module.storage:
+                    if entry.name == entry_name:
+                        return module, entry
+
+        raise ValueError("Storage entry '{}.{}' not found in metadata".format(module_name, entry_name))
+
+    def get_storage_key_builder(self, module_name, entry_name, spec_version_id=None):
+        # The key types are resolved with the type registry of the spec version (by default self.spec_version_id),
+        # cached by type registry generation so changes of the type registry are picked up
+        spec_version_id = self.spec_version_id if spec_version_id is None else str(spec_version_id)
+        cache_key = (module_name, entry_name, spec_version_id, RuntimeConfiguration.decoder_plans_generation)
+        storage_key_builder = self.storage_key_builders.get(cache_key)
+
+        if storage_key_builder is None:
+            module, entry = self.get_storage_entry(module_name, entry_name)
+            storage_key_builder = StorageKeyBuilder(module.prefix, entry, spec_version_id=spec_version_id)
+            self.storage_key_builders[cache_key] = storage_key_builder
+
+        return storage_key_builder
+
+    def get_storage_key(self, module_name, entry_name, *params, spec_version_id=None):
+        return self.get_storage_key_builder(module_name, entry_name, spec_version_id).get_key(*params)
+
+    def get_storage_keys(self, module_name, entry_name, params_list, spec_version_id=None):
+        return self.get_storage_key_builder(module_name, entry_name, spec_version_id).get_keys(params_list)
+
+    def get_storage_value_decoder(self, module_name, entry_name, spec_version_id=None):
+        # Cached per spec version and type registry generation, like the storage key builders
+        spec_version_id = self.spec_version_id if spec_version_id is None else str(spec_version_id)
+        cache_key = (module_name, entry_name, spec_version_id, RuntimeConfiguration.decoder_plans_generation)
+        storage_value_decoder = self.storage_value_decoders.get(cache_key)
+
+        if storage_value_decoder is None:
+            module, entry = self.get_storage_entry(module_name, entry_name)
+            storage_value_decoder = StorageValueDecoder(entry, spec_version_id=spec_version_id)
+            self.storage_value_decoders[cache_key] = storage_value_decoder
+
+        return storage_value_decoder
+
+    def decode_storage(self, module_name, entry_name, data, spec_version_id=None):
+        # Decodes a storage value (hex or bytes), None (no value stored) results in the default value
+        return self.get_storage_value_decoder(module_name, entry_name, spec_version_id).decode(data)
+
+    def decode_storage_batch(self, module_name, entry_name, data_list, spec_version_id=None):
+        return self.get_storage_value_decoder(module_name, entry_name, spec_version_id).decode_batch(data_list)
+
+    def get_constant(self, module_name, constant_name):
+        # Constants are only decoded on first access, the decoded value is cached for this runtime
+        cache_key = (module_name, constant_name)
+
+        if cache_key not in self.constant_values:
+            for module in self.metadata.modules:
+                if module_name in (module.name, module.prefix):
+                    for constant in module.constants:
+                        if constant.name == constant_name:
+                            # Decoded with the type registry of the spec version of this runtime
+                            self.constant_values[cache_key] = self.get_decoder_plan(
+                                constant.type, spec_version_id=self.spec_version_id
+                            ).decode(
+                                ScaleBytes(constant.constant_value, context=DecodeContext(
+                                    spec_version_id=self.spec_version_id
+                                ))
+                            ).value
+                            break
+
+            if cache_key not in self.constant_values:
+                raise ValueError("Constant '{}.{}' not found in metadata".format(module_name, constant_name))
+
+        value = self.constant_values[cache_key]
+
+        if type(value) in (dict, list):
+            # Do not hand out the cached instance
+            return copy.deepcopy(value)
+
+        return value
+
+    def get_normalized(self):
+        # Compact representation of the decoded runtime (without docs) that can be stored as JSON and
+        # loaded again with from_normalized(), much faster than decoding the metadata
+        modules = []
+        module_positions = {}
+        item_positions = {}
+
+        for module in self.metadata.modules + getattr(self.metadata, 'events_modules', []):
+
+            for items in (module.calls, module.events):
+                for item_position, item in enumerate(items or []):
+                    item_positions[id(item)] = item_position
+
+            module_positions[id(module)] = len(modules)
+
+            modules.append({
+                'name': module.name,
+                'prefix': module.prefix,
+                'identifier': module.get_identifier(),
+                'storage': None if module.storage is None else [
+                    [entry.name, entry.modifier, entry.type, entry.fallback] for entry in module.storage
+                ],
+                'calls': None if module.calls is None else [
+                    [call.name, [[arg.name, arg.type] for arg in call.args]] for call in module.calls
+                ],
+                'events': None if module.events is None else [[event.name, event.args] for event in module.events],
+                'constants': [
+                    [constant.name, constant.type, constant.constant_value] for constant in module.constants
+                ]
+            })
+
+        return {
+            'version': self.version.index if self.version else None,
+            'modules': modules,
+            'call_index': {
+                lookup: [module_positions[id(module)], item_positions[id(call)]]
+                for lookup, (module, call) in self.call_index.items()
+            },
+            'event_index': {
+                lookup: [module_positions[id(module)], item_positions[id(event)]]
+                for lookup, (module, event) in self.event_index.items()
             }
         }
 
-        self.modules = self.process_type('Vec<MetadataV4Module>').elements
+    @classmethod
+    def from_normalized(cls, normalized, spec_version_id='default', compile_plans=True):
 
-        # Build call and event index
+        metadata_decoder = cls(ScaleBytes(bytearray()), compile_plans=compile_plans, spec_version_id=spec_version_id)
 
-        call_module_index = 0
-        event_module_index = 0
+        if normalized['version'] is None:
+            version_name = 'MetadataV0Decoder'
+        else:
+            metadata_decoder.version = cls.get_decoder_class('Enum', ScaleBytes(bytearray()), value_list=cls.versions)
+            metadata_decoder.version.index = normalized['version']
+            metadata_decoder.version.value = cls.versions[normalized['version']]
+            version_name = metadata_decoder.version.value
+
+        metadata = cls.get_decoder_class(version_name, ScaleBytes(bytearray()))
+
+        metadata.modules = [
+            Module(
+                name=module['name'],
+                prefix=module['prefix'],
+                identifier=module['identifier'],
+                storage=None if module['storage'] is None else [
+                    StorageEntry(*storage_entry) for storage_entry in module['storage']
+                ],
+                calls=None if module['calls'] is None else [
+                    Call(name, [Arg(*arg) for arg in args]) for name, args in module['calls']
+                ],
+                events=None if module['events'] is None else [Event(*event) for event in module['events']],
+                constants=[Constant(*constant) for constant in module['constants']]
+            ) for module in normalized['modules']
+        ]
+
+        for lookup, (module_position, call_position) in normalized['call_index'].items():
+            module = metadata.modules[module_position]
+            module.calls[call_position].lookup = lookup
+            metadata.call_index[lookup] = (module, module.calls[call_position])
+
+        for lookup, (module_position, event_position) in normalized['event_index'].items():
+            module = metadata.modules[module_position]
+            module.events[event_position].lookup = lookup
+            metadata.event_index[lookup] = (module, module.events[event_position])
+
+        if metadata.value is None:
+            # MetadataV0 builds its value while decoding, use the generic representation instead
+            metadata.value = {
+                "magicNumber": 1635018093,
+                "metadata": {
+                    version_name[:-len('Decoder')]: {
+                        "modules": [module.value for module in metadata.modules]
+                    }
+                }
+            }
 
-        for module in self.modules:
-            if module.calls is not None:
-                for call_index, call in enumerate(module.calls):
-                    call.lookup = "{:02x}{:02x}".format(call_module_index, call_index)
-                    self.call_index[call.lookup] = (module, call)
-                call_module_index += 1
+        metadata_decoder.metadata = metadata
+        metadata_decoder.call_index = metadata.call_index
+        metadata_decoder.event_index = metadata.event_index
+        metadata_decoder.build_index_tables()
+        metadata_decoder.intern_names()
 
-            if module.events is not None:
-                for event_index, event in enumerate(module.events):
-                    event.lookup = "{:02x}{:02x}".format(event_module_index, event_index)
-                    self.event_index[event.lookup] = (module, event)
-                event_module_index += 1
+        if compile_plans:
+            metadata_decoder.compile_decoder_plans()
 
-        result_data["metadata"]["MetadataV4"]["modules"] = [m.value for m in self.modules]
+        return metadata_decoder
 
-        return result_data
 
+class MetadataDiff:
 
-class MetadataV4Module(ScaleType):
+    # Compares two decoded runtimes by signature: calls and events by name and argument types, storage
+    # entries by name, modifier, type and fallback and constants by name, type and value. Items are keyed
+    # by (module name, item name). Changes in call or event indices (e.g. a module added in between) are
+    # reported separately, as they affect decoding even when all signatures are unchanged.
 
-    def __init__(self, data, sub_type=None):
-        self.name = None
-        self.prefix = None
-        self.call_index = None
-        self.has_storage = False
-        self.storage = None
-        self.has_calls = False
-        self.calls = None
-        self.has_events = False
-        self.events = None
-        self.constants = []
-        super().__init__(data, sub_type)
+    categories = ('calls', 'events', 'storage', 'constants')
 
-    def get_identifier(self):
-        return self.name.lower()
+    def __init__(self, old, new):
+        self.old_signatures = self.get_signatures(old)
+        self.new_signatures = self.get_signatures(new)
 
-    def process(self):
+        self.added = {}
+        self.removed = {}
+        self.changed = {}
+        self.unchanged = {}
 
-        self.name = self.process_type('Bytes').value
-        self.prefix = self.process_type('Bytes').value
+        for category in self.categories:
+            old_items = self.old_signatures[category]
+            new_items = self.new_signatures[category]
 
-        result = {
-            "name": self.name,
-            "prefix": self.prefix,
-            "storage": self.storage,
-            "calls": self.calls,
-            "events": self.events,
-            "constants": self.constants
-        }
+            self.added[category] = [key for key in new_items if key not in old_items]
+            self.removed[category] = [key for key in old_items if key not in new_items]
+            self.changed[category] = []
+            self.unchanged[category] = []
 
-        self.has_storage = self.process_type('bool').value
+            for key, (signature, item) in new_items.items():
+                if key in old_items:
+                    if old_items[key][0] == signature:
+                        self.unchanged[category].append(key)
+                    else:
+                        self.changed[category].append(key)
 
-        if self.has_storage:
-            # TODO convert to Option<Vec<MetadataModuleStorage>>
-            self.storage = self.process_type('Vec<MetadataV4ModuleStorage>').elements
-            result["storage"] = [s.value for s in self.storage]
+        old_modules = [module.name for module in old.metadata.modules]
+        new_modules = [module.name for module in new.metadata.modules]
 
-        self.has_calls = self.process_type('bool').value
+        self.added_modules = [name for name in new_modules if name not in old_modules]
+        self.removed_modules = [name for name in old_modules if name not in new_modules]
 
-        if self.has_calls:
-            # TODO convert to Option<Vec<MetadataModuleCall>>
-            self.calls = self.process_type('Vec<MetadataModuleCall>').elements
-            result["calls"] = [s.value for s in self.calls]
+        changed_modules = set()
+        for category in self.categories:
+            for key in self.added[category] + self.removed[category] + self.changed[category]:
+                changed_modules.add(key[0])
 
-        self.has_events = self.process_type('bool').value
+        self.changed_modules = [
+            name for name in new_modules if name in changed_modules and name not in self.added_modules
+        ]
 
-        if self.has_events:
-            # TODO convert to Option<Vec<MetadataModuleEvent>>
-            self.events = self.process_type('Vec<MetadataModuleEvent>').elements
-            result["events"] = [s.value for s in self.events]
+        self.call_index_changed = self.get_lookups(old.call_index) != self.get_lookups(new.call_index)
+        self.event_index_changed = self.get_lookups(old.event_index) != self.get_lookups(new.event_index)
 
-        return result
+    def get_unchanged_items(self, category):
+        # Items of the old runtime that are unchanged in the new runtime, by (module name, item name)
+        return {key: self.old_signatures[category][key][1] for key in self.unchanged[category]}
 
+    @classmethod
+    def get_signatures(cls, metadata_decoder):
+        signatures = {category: {} for category in cls.categories}
 
-class MetadataV4ModuleStorage(ScaleType):
+        for module, call in metadata_decoder.call_index.values():
+            signatures['calls'][(module.name, call.name)] = (
+                tuple((arg.name, arg.type) for arg in call.args), call
+            )
 
-    def __init__(self, data, sub_type=None):
-        self.name = None
-        self.modifier = None
-        self.type = {}
-        self.fallback = None
-        self.docs = []
-        self.hasher = None
-        super().__init__(data, sub_type)
+        for module, event in metadata_decoder.event_index.values():
+            signatures['events'][(module.name, event.name)] = (tuple(event.args), event)
 
-    def process(self):
+        for module in metadata_decoder.metadata.modules:
+            for entry in module.storage or []:
+                signatures['storage'][(module.name, entry.name)] = (
+                    (module.prefix, entry.modifier, cls.freeze(entry.type), entry.fallback), entry
+                )
 
-        self.name = self.process_type('Bytes').value
-        self.modifier = self.process_type('Enum', value_list=["Optional", "Default"]).value
+            for constant in module.constants:
+                signatures['constants'][(module.name, constant.name)] = (
+                    (constant.type, constant.constant_value), constant
+                )
 
-        storage_function_type = self.process_type('Enum', value_list=["PlainType", "MapType", "DoubleMapType"]).value
+        return signatures
 
-        if storage_function_type == 'MapType':
-            self.hasher = self.process_type('StorageHasher')
-            self.type = {
-                "MapType": {
-                    "hasher": self.hasher.value,
-                    "key": self.convert_type(self.process_type('Bytes').value),
-                    "value": self.convert_type(self.process_type('Bytes').value),
-                    "isLinked": self.process_type('bool').value
-                }
-            }
-        elif storage_function_type == 'DoubleMapType':
-            self.hasher = self.process_type('StorageHasher')
-            self.type = {
-                "DoubleMapType": {
-                    "hasher": self.hasher.value,
-                    "key1": self.convert_type(self.process_type('Bytes').value),
-                    "key2": self.convert_type(self.process_type('Bytes').value),
-                    "value": self.convert_type(self.process_type('Bytes').value),
-                    "key2Hasher": self.process_type('Bytes').value
-                }
-            }
+    @classmethod
+    def freeze(cls, value):
+        # Hashable and comparable representation of the storage type dicts
+        if type(value) is dict:
+            return tuple((key, cls.freeze(item)) for key, item in sorted(value.items()))
+        return value
 
-        elif storage_function_type == 'PlainType':
-            self.type = {
-                "PlainType": self.convert_type(self.process_type('Bytes').value)
-            }
+    @staticmethod
+    def get_lookups(index):
+        return {lookup: (module.name, item.name) for lookup, (module, item) in index.items()}
 
-        self.fallback = self.process_type('HexBytes').value
+    def has_changes(self):
+        return bool(
+            self.added_modules or self.removed_modules or self.call_index_changed or self.event_index_changed or
+            any(self.added[category] or self.removed[category] or self.changed[category]
+                for category in self.categories)
+        )
 
-        self.docs = self.process_type('Vec<Bytes>').value
 
-        return {
-            "name": self.name,
-            "modifier": self.modifier,
-            "type": self.type,
-            "fallback": self.fallback,
-            "docs": self.docs
-        }
+class MetadataVersionDecoder(ScaleDecoder):
 
+    # Common base of the MetadataV1 and later decoders. All versions decode into the same runtime model
+    # (Module, Call, Arg, Event, StorageEntry and Constant), the version specific dict representation
+    # is only generated from that model when the value is first accessed
 
-class MetadataV5Decoder(ScaleDecoder):
+    module_type = None
 
     def __init__(self, data, sub_type=None):
         self.version = None
         self.modules = []
         self.call_index = {}
         self.event_index = {}
-
+        self.metadata_value = None
         super().__init__(data, sub_type)
 
-    def process(self):
-        result_data = {
-            "magicNumber": 1635018093,  # struct.unpack('<L', bytearray.fromhex("6174656d")),
-            "metadata": {
-                "MetadataV5": {
-                    "modules": [],
+    def decode(self, check_remaining=True):
+        return decode_with_metadata_context(super().decode, self.data, check_remaining)
+
+    @property
+    def value(self):
+        if self.metadata_value is None:
+            self.metadata_value = {
+                "magicNumber": 1635018093,  # struct.unpack('<L', bytearray.fromhex("6174656d")),
+                "metadata": {
+                    self.__class__.__name__[:-len('Decoder')]: {
+                        "modules": [self.get_module_value(module) for module in self.modules],
+                    }
                 }
             }
-        }
+        return self.metadata_value
 
-        self.modules = self.process_type('Vec<MetadataV4Module>').elements
+    @value.setter
+    def value(self, value):
+        # Value is derived from the modules, assignments (e.g. by decode()) are ignored
+        pass
 
-        # Build call and event index
+    def get_module_value(self, module):
+        return module.value
 
+    def process(self):
+        self.modules = self.process_type(self.module_type).value
+        self.metadata_value = None
+        self.build_index()
+
+    def build_index(self):
         call_module_index = 0
         event_module_index = 0
 
@@ -262,577 +645,296 @@ class MetadataV5Decoder(ScaleDecoder):
                     self.event_index[event.lookup] = (module, event)
                 event_module_index += 1
 
-        result_data["metadata"]["MetadataV5"]["modules"] = [m.value for m in self.modules]
 
-        return result_data
+class MetadataV1Decoder(MetadataVersionDecoder):
+    module_type = 'Vec<MetadataV1Module>'
 
 
-class MetadataV5Module(ScaleType):
+class MetadataV2Decoder(MetadataVersionDecoder):
+    module_type = 'Vec<MetadataModule>'
 
-    def __init__(self, data, sub_type=None):
-        self.name = None
-        self.prefix = None
-        self.call_index = None
-        self.has_storage = False
-        self.storage = None
-        self.has_calls = False
-        self.calls = None
-        self.has_events = False
-        self.events = None
-        self.constants = []
-        super().__init__(data, sub_type)
 
-    def get_identifier(self):
-        return self.name.lower()
+class MetadataV3Decoder(MetadataVersionDecoder):
+    module_type = 'Vec<MetadataModule>'
 
-    def process(self):
 
-        self.name = self.process_type('Bytes').value
-        self.prefix = self.process_type('Bytes').value
+class MetadataV4Decoder(MetadataVersionDecoder):
+    module_type = 'Vec<MetadataV4Module>'
 
-        result = {
-            "name": self.name,
-            "prefix": self.prefix,
-            "storage": self.storage,
-            "calls": self.calls,
-            "events": self.events,
-            "constants": self.constants
-        }
 
-        self.has_storage = self.process_type('bool').value
+class MetadataV5Decoder(MetadataVersionDecoder):
+    module_type = 'Vec<MetadataV5Module>'
 
-        if self.has_storage:
-            # TODO convert to Option<Vec<MetadataModuleStorage>>
-            self.storage = self.process_type('Vec<MetadataV5ModuleStorage>').elements
-            result["storage"] = [s.value for s in self.storage]
 
-        self.has_calls = self.process_type('bool').value
+class MetadataV6Decoder(MetadataVersionDecoder):
+    module_type = 'Vec<MetadataV6Module>'
 
-        if self.has_calls:
-            # TODO convert to Option<Vec<MetadataModuleCall>>
-            self.calls = self.process_type('Vec<MetadataModuleCall>').elements
-            result["calls"] = [s.value for s in self.calls]
 
-        self.has_events = self.process_type('bool').value
+class MetadataV7Decoder(MetadataVersionDecoder):
+    module_type = 'Vec<MetadataV7Module>'
 
-        if self.has_events:
-            # TODO convert to Option<Vec<MetadataModuleEvent>>
-            self.events = self.process_type('Vec<MetadataModuleEvent>').elements
-            result["events"] = [s.value for s in self.events]
-
-        return result
+    def get_module_value(self, module):
+        module_value = module.value
 
-
-class MetadataV5ModuleStorage(ScaleType):
-    def __init__(self, data, sub_type=None):
-        self.name = None
-        self.modifier = None
-        self.type = {}
-        self.fallback = None
-        self.docs = []
-        self.hasher = None
-        super().__init__(data, sub_type)
-
-    def process(self):
-
-        self.name = self.process_type('Bytes').value
-        self.modifier = self.process_type('Enum', value_list=["Optional", "Default"]).value
-
-        storage_function_type = self.process_type('Enum', value_list=["PlainType", "MapType", "DoubleMapType"]).value
-
-        if storage_function_type == 'MapType':
-            self.hasher = self.process_type('StorageHasher')
-            self.type = {
-                "MapType": {
-                    "hasher": self.hasher.value,
-                    "key": self.convert_type(self.process_type('Bytes').value),
-                    "value": self.convert_type(self.process_type('Bytes').value),
-                    "isLinked": self.process_type('bool').value
-                }
+        if module.storage is not None:
+            # Storage entries are grouped under the module prefix since MetadataV7
+            module_value["storage"] = {
+                "prefix": module.prefix,
+                "items": module_value["storage"]
             }
-        elif storage_function_type == 'DoubleMapType':
-            self.hasher = self.process_type('StorageHasher')
-            self.type = {
-                "DoubleMapType": {
-                    "hasher": self.hasher.value,
-                    "key1": self.convert_type(self.process_type('Bytes').value),
-                    "key2": self.convert_type(self.process_type('Bytes').value),
-                    "value": self.convert_type(self.process_type('Bytes').value),
-                    "key2Hasher": self.process_type('StorageHasher').value
-                }
-            }
-
-        elif storage_function_type == 'PlainType':
-            self.type = {
-                "PlainType": self.convert_type(self.process_type('Bytes').value)
-            }
-
-        self.fallback = self.process_type('HexBytes').value
-
-        self.docs = self.process_type('Vec<Bytes>').value
-
-        return {
-            "name": self.name,
-            "modifier": self.modifier,
-            "type": self.type,
-            "fallback": self.fallback,
-            "docs": self.docs
-        }
 
+        return module_value
 
-class MetadataV6Decoder(ScaleDecoder):
-
-    def __init__(self, data, sub_type=None):
-        self.version = None
-        self.modules = []
-        self.call_index = {}
-        self.event_index = {}
-
-        super().__init__(data, sub_type)
 
-    def process(self):
-        result_data = {
-            "magicNumber": 1635018093,  # struct.unpack('<L', bytearray.fromhex("6174656d")),
-            "metadata": {
-                "MetadataV6": {
-                    "modules": [],
-                }
-            }
-        }
-
-        self.modules = self.process_type('Vec<MetadataV6Module>').elements
-
-        # Build call and event index
-
-        call_module_index = 0
-        event_module_index = 0
-
-        for module in self.modules:
-            if module.calls is not None:
-                for call_index, call in enumerate(module.calls):
-                    call.lookup = "{:02x}{:02x}".format(call_module_index, call_index)
-                    self.call_index[call.lookup] = (module, call)
-                call_module_index += 1
-
-            if module.events is not None:
-                for event_index, event in enumerate(module.events):
-                    event.lookup = "{:02x}{:02x}".format(event_module_index, event_index)
-                    self.event_index[event.lookup] = (module, event)
-                event_module_index += 1
-
-        result_data["metadata"]["MetadataV6"]["modules"] = [m.value for m in self.modules]
-
-        return result_data
+class MetadataModule(ScaleType):
 
+    # MetadataV2 and V3 module, later versions only differ in storage entry and constants format
 
-class MetadataV6Module(ScaleType):
-
-    def __init__(self, data, sub_type=None):
-        self.name = None
-        self.prefix = None
-        self.call_index = None
-        self.has_storage = False
-        self.storage = None
-        self.has_calls = False
-        self.calls = None
-        self.has_events = False
-        self.events = None
-        self.constants = []
-        super().__init__(data, sub_type)
-
-    def get_identifier(self):
-        return self.name.lower()
+    storage_type = 'Vec<MetadataModuleStorage>'
+    constants_type = None
 
     def process(self):
 
-        self.name = self.process_type('Bytes').value
-        self.prefix = self.process_type('Bytes').value
+        name = self.process_type('Bytes').value
+        prefix = self.process_type('Bytes').value
 
-        result = {
-            "name": self.name,
-            "prefix": self.prefix,
-            "storage": self.storage,
-            "calls": self.calls,
-            "events": self.events,
-            "constants": self.constants
-        }
-
-        self.has_storage = self.process_type('bool').value
-
-        if self.has_storage:
-            # TODO convert to Option<Vec<MetadataModuleStorage>>
-            self.storage = self.process_type('Vec<MetadataV6ModuleStorage>').elements
-            result["storage"] = [s.value for s in self.storage]
+        storage = self.process_storage()
 
-        self.has_calls = self.process_type('bool').value
-
-        if self.has_calls:
+        calls = None
+        if self.process_type('bool').value:
             # TODO convert to Option<Vec<MetadataModuleCall>>
-            self.calls = self.process_type('Vec<MetadataModuleCall>').elements
-            result["calls"] = [s.value for s in self.calls]
-
-        self.has_events = self.process_type('bool').value
+            calls = self.process_type('Vec<MetadataModuleCall>').value
 
-        if self.has_events:
+        events = None
+        if self.process_type('bool').value:
             # TODO convert to Option<Vec<MetadataModuleEvent>>
-            self.events = self.process_type('Vec<MetadataModuleEvent>').elements
-            result["events"] = [s.value for s in self.events]
+            events = self.process_type('Vec<MetadataModuleEvent>').value
 
-        self.constants = self.process_type('Vec<MetadataV6ModuleConstants>').elements
-        result["constants"] = [s.value for s in self.constants]
+        constants = []
+        if self.constants_type:
+            constants = self.process_type(self.constants_type).value
 
-        return result
+        return Module(name, prefix=prefix, storage=storage, calls=calls, events=events, constants=constants)
 
+    def process_storage(self):
+        if self.process_type('bool').value:
+            # TODO convert to Option<Vec<MetadataModuleStorage>>
+            return self.process_type(self.storage_type).value
 
-class MetadataV6ModuleStorage(MetadataV5ModuleStorage):
-    pass
 
+class MetadataV1Module(MetadataModule):
+    storage_type = 'Vec<MetadataV1ModuleStorage>'
 
-class MetadataV6ModuleConstants(ScaleType):
 
-    def __init__(self, data, sub_type=None):
-        self.name = None
-        self.type = None
-        self.constant_value = None
-        self.docs = []
-        super().__init__(data, sub_type)
+class MetadataV4Module(MetadataModule):
+    storage_type = 'Vec<MetadataV4ModuleStorage>'
 
-    def process(self):
 
-        self.name = self.process_type('Bytes').value
-        self.type = self.convert_type(self.process_type('Bytes').value)
-        self.constant_value = self.process_type('HexBytes').value
-        self.docs = self.process_type('Vec<Bytes>').value
+class MetadataV5Module(MetadataModule):
+    storage_type = 'Vec<MetadataV5ModuleStorage>'
 
-        return {
-            "name": self.name,
-            "type": self.type,
-            "value": self.constant_value,
-            "docs": self.docs
-        }
 
+class MetadataV6Module(MetadataModule):
+    storage_type = 'Vec<MetadataV6ModuleStorage>'
+    constants_type = 'Vec<MetadataV6ModuleConstants>'
 
-class MetadataV7Decoder(ScaleDecoder):
 
-    def __init__(self, data, sub_type=None):
-        self.version = None
-        self.modules = []
-        self.call_index = {}
-        self.event_index = {}
+class MetadataV7Module(MetadataModule):
 
-        super().__init__(data, sub_type)
+    constants_type = 'Vec<MetadataV7ModuleConstants>'
 
     def process(self):
-        result_data = {
-            "magicNumber": 1635018093,  # struct.unpack('<L', bytearray.fromhex("6174656d")),
-            "metadata": {
-                "MetadataV7": {
-                    "modules": [],
-                }
-            }
-        }
 
-        self.modules = self.process_type('Vec<MetadataV7Module>').elements
+        name = self.process_type('Bytes').value
 
-        # Build call and event index
-
-        call_module_index = 0
-        event_module_index = 0
+        prefix = None
+        storage = None
 
-        for module in self.modules:
-            if module.calls is not None:
-                for call_index, call in enumerate(module.calls):
-                    call.lookup = "{:02x}{:02x}".format(call_module_index, call_index)
-                    self.call_index[call.lookup] = (module, call)
-                call_module_index += 1
+        if self.process_type('bool').value:
+            # Prefix moved from the module to the storage since MetadataV7
+            prefix, storage = self.process_type('MetadataV7ModuleStorage').value
 
-            if module.events is not None:
-                for event_index, event in enumerate(module.events):
-                    event.lookup = "{:02x}{:02x}".format(event_module_index, event_index)
-                    self.event_index[event.lookup] = (module, event)
-                event_module_index += 1
+        calls = None
+        if self.process_type('bool').value:
+            calls = self.process_type('Vec<MetadataModuleCall>').value
 
-        result_data["metadata"]["MetadataV7"]["modules"] = [m.value for m in self.modules]
+        events = None
+        if self.process_type('bool').value:
+            events = self.process_type('Vec<MetadataModuleEvent>').value
 
-        return result_data
+        constants = self.process_type(self.constants_type).value
 
+        return Module(name, prefix=prefix, storage=storage, calls=calls, events=events, constants=constants)
 
-class MetadataV7Module(MetadataV6Module):
 
-    def __init__(self, data, sub_type=None):
-        self.name = None
-        self.prefix = None
-        self.call_index = None
-        self.has_storage = False
-        self.storage = None
-        self.has_calls = False
-        self.calls = None
-        self.has_events = False
-        self.events = None
-        self.constants = []
-        super().__init__(data, sub_type)
+class MetadataV7ModuleStorage(ScaleType):
 
     def process(self):
+        prefix = self.process_type('Bytes').value
+        items = self.process_type('Vec<MetadataV7ModuleStorageEntry>').value
 
-        self.name = self.process_type('Bytes').value
-
-        result = {
-            "name": self.name,
-            "prefix": self.prefix,
-            "storage": self.storage,
-            "calls": self.calls,
-            "events": self.events,
-            "constants": self.constants
-        }
+        return prefix, items
 
-        self.has_storage = self.process_type('bool').value
 
-        if self.has_storage:
-            # TODO convert to Option<Vec<MetadataModuleStorage>>
-            self.storage = self.process_type('MetadataV7ModuleStorage')
-            result["storage"] = self.storage.value
-            # TODO moved to storage, change data model
-            self.prefix = self.storage.prefix
-            result["prefix"] = self.prefix
-
-        self.has_calls = self.process_type('bool').value
-
-        if self.has_calls:
-            # TODO convert to Option<Vec<MetadataModuleCall>>
-            self.calls = self.process_type('Vec<MetadataModuleCall>').elements
-            result["calls"] = [s.value for s in self.calls]
-
-        self.has_events = self.process_type('bool').value
-
-        if self.has_events:
-            # TODO convert to Option<Vec<MetadataModuleEvent>>
-            self.events = self.process_type('Vec<MetadataModuleEvent>').elements
-            result["events"] = [s.value for s in self.events]
-
-        self.constants = self.process_type('Vec<MetadataV7ModuleConstants>').elements
-        result["constants"] = [s.value for s in self.constants]
-
-        return result
+class MetadataModuleStorage(ScaleType):
 
+    # MetadataV2 and V3 storage entry, other versions override process_storage_type()
 
-class MetadataV7ModuleStorage(MetadataV6ModuleStorage):
+    def process(self):
+        name = self.process_type('Bytes').value
+        modifier = self.process_type('Enum', value_list=["Optional", "Default"]).value
 
-    def __init__(self, data, sub_type=None):
-        self.prefix = None
-        self.items = []
+        storage_type = self.process_storage_type()
 
-        super().__init__(data, sub_type)
+        fallback = self.process_type('HexBytes').value
+        docs = self.process_type('MetadataDocs').value
 
-    def process(self):
+        return StorageEntry(name, modifier, storage_type, fallback, docs)
 
-        self.prefix = self.process_type('Bytes').value
-        self.items = self.process_type('Vec<MetadataV7ModuleStorageEntry>').elements
+    def process_storage_type(self):
+        if self.process_type('bool').value:
+            return {
+                "MapType": {
+                    "key": self.convert_type(self.process_type('Bytes').value),
+                    "value": self.convert_type(self.process_type('Bytes').value),
+                    "isLinked": self.process_type('bool').value
+                }
+            }
+        else:
+            return {
+                "PlainType": self.convert_type(self.process_type('Bytes').value)
+            }
 
-        return {
-            "prefix": self.prefix,
-            "items": [s.value for s in self.items]
-        }
 
+class MetadataV1ModuleStorage(MetadataModuleStorage):
 
-class MetadataV7ModuleStorageEntry(ScaleDecoder):
+    def process_storage_type(self):
+        if self.process_type('bool').value:
+            return {
+                "MapType": {
+                    "key": self.convert_type(self.process_type('Bytes').value),
+                    "value": self.convert_type(self.process_type('Bytes').value)
+                }
+            }
+        else:
+            return {
+                "PlainType": self.convert_type(self.process_type('Bytes').value)
+            }
 
-    def __init__(self, data, sub_type=None):
-        self.name = None
-        self.modifier = None
-        self.type = {}
-        self.fallback = None
-        self.docs = []
-        self.hasher = None
-        super().__init__(data, sub_type)
 
-    def process(self):
+class MetadataV4ModuleStorage(MetadataModuleStorage):
 
-        self.name = self.process_type('Bytes').value
-        self.modifier = self.process_type('Enum', value_list=["Optional", "Default"]).value
+    key2_hasher_type = 'Bytes'
 
+    def process_storage_type(self):
         storage_function_type = self.process_type('Enum', value_list=["PlainType", "MapType", "DoubleMapType"]).value
 
         if storage_function_type == 'MapType':
-            self.hasher = self.process_type('StorageHasher')
-            self.type = {
+            return {
                 "MapType": {
-                    "hasher": self.hasher.value,
+                    "hasher": self.process_type('StorageHasher').value,
                     "key": self.convert_type(self.process_type('Bytes').value),
                     "value": self.convert_type(self.process_type('Bytes').value),
                     "isLinked": self.process_type('bool').value
                 }
             }
         elif storage_function_type == 'DoubleMapType':
-            self.hasher = self.process_type('StorageHasher')
-            self.type = {
+            return {
                 "DoubleMapType": {
-                    "hasher": self.hasher.value,
+                    "hasher": self.process_type('StorageHasher').value,
                     "key1": self.convert_type(self.process_type('Bytes').value),
                     "key2": self.convert_type(self.process_type('Bytes').value),
                     "value": self.convert_type(self.process_type('Bytes').value),
-                    "key2Hasher": self.process_type('StorageHasher').value
+                    "key2Hasher": self.process_type(self.key2_hasher_type).value
                 }
             }
-
         elif storage_function_type == 'PlainType':
-            self.type = {
+            return {
                 "PlainType": self.convert_type(self.process_type('Bytes').value)
             }
 
-        self.fallback = self.process_type('HexBytes').value
-
-        self.docs = self.process_type('Vec<Bytes>').value
-
-        return {
-            "name": self.name,
-            "modifier": self.modifier,
-            "type": self.type,
-            "fallback": self.fallback,
-            "docs": self.docs
-        }
-
-
-class MetadataV7ModuleConstants(MetadataV6ModuleConstants):
-    pass
-
-
-class MetadataV3Decoder(ScaleDecoder):
-
-    def __init__(self, data, sub_type=None):
-        self.version = None
-        self.modules = []
-        self.call_index = {}
-        self.event_index = {}
-
-        super().__init__(data, sub_type)
-
-    def process(self):
-        result_data = {
-            "magicNumber": 1635018093,  # struct.unpack('<L', bytearray.fromhex("6174656d")),
-            "metadata": {
-                "MetadataV3": {
-                    "modules": [],
-                }
-            }
-        }
-
-        self.modules = self.process_type('Vec<MetadataModule>').elements
-
-        # Build call and event index
-
-        call_module_index = 0
-        event_module_index = 0
-
-        for module in self.modules:
-            if module.calls is not None:
-                for call_index, call in enumerate(module.calls):
-                    call.lookup = "{:02x}{:02x}".format(call_module_index, call_index)
-                    self.call_index[call.lookup] = (module, call)
-                call_module_index += 1
-
-            if module.events is not None:
-                for event_index, event in enumerate(module.events):
-                    event.lookup = "{:02x}{:02x}".format(event_module_index, event_index)
-                    self.event_index[event.lookup] = (module, event)
-                event_module_index += 1
+        return {}
 
-        result_data["metadata"]["MetadataV3"]["modules"] = [m.value for m in self.modules]
 
-        return result_data
+class MetadataV5ModuleStorage(MetadataV4ModuleStorage):
+    key2_hasher_type = 'StorageHasher'
 
 
-class MetadataV2Decoder(ScaleDecoder):
+class MetadataV6ModuleStorage(MetadataV5ModuleStorage):
+    pass
 
-    def __init__(self, data, sub_type=None):
-        self.version = None
-        self.modules = []
-        self.call_index = {}
-        self.event_index = {}
 
-        super().__init__(data, sub_type)
+class MetadataV7ModuleStorageEntry(MetadataV5ModuleStorage):
+    pass
 
-    def process(self):
-        result_data = {
-            "magicNumber": 1635018093,  # struct.unpack('<L', bytearray.fromhex("6174656d")),
-            "metadata": {
-                "MetadataV2": {
-                    "modules": [],
-                }
-            }
-        }
 
-        self.modules = self.process_type('Vec<MetadataModule>').elements
+class MetadataV6ModuleConstants(ScaleType):
 
-        # Build call and event index
+    def process(self):
+        name = self.process_type('Bytes').value
+        constant_type = self.convert_type(self.process_type('Bytes').value)
+        constant_value = self.process_type('HexBytes').value
+        docs = self.process_type('MetadataDocs').value
 
-        call_module_index = 0
-        event_module_index = 0
+        return Constant(name, constant_type, constant_value, docs)
 
-        for module in self.modules:
-            if module.calls is not None:
-                for call_index, call in enumerate(module.calls):
-                    call.lookup = "{:02x}{:02x}".format(call_module_index, call_index)
-                    self.call_index[call.lookup] = (module, call)
-                call_module_index += 1
 
-            if module.events is not None:
-                for event_index, event in enumerate(module.events):
-                    event.lookup = "{:02x}{:02x}".format(event_module_index, event_index)
-                    self.event_index[event.lookup] = (module, event)
-                event_module_index += 1
+class MetadataV7ModuleConstants(MetadataV6ModuleConstants):
+    pass
 
-        result_data["metadata"]["MetadataV2"]["modules"] = [m.value for m in self.modules]
 
-        return result_data
+class MetadataDocs(ScaleType):
 
+    def process(self):
+        if self.data.context.skip_docs:
+            # Only read the length prefixes to skip over the documentation lines
+            line_count = self.process_type('Compact<u32>').value
+            # Every line has at least its length prefix
+            self.data.check_elements(line_count, 1)
 
-class MetadataV1Decoder(ScaleDecoder):
+            for _ in range(line_count):
+                length = self.process_type('Compact<u32>').value
+                self.data.check_bytes(length)
+                self.data.offset += length
+            return []
 
-    def __init__(self, data, sub_type=None):
-        self.version = None
-        self.modules = []
-        self.call_index = {}
-        self.event_index = {}
+        return self.process_type('Vec<Bytes>').value
 
-        super().__init__(data, sub_type)
+
+class MetadataModuleCall(ScaleType):
 
     def process(self):
-        result_data = {
-            "magicNumber": 1635018093,  # struct.unpack('<L', bytearray.fromhex("6174656d")),
-            "metadata": {
-                "MetadataV1": {
-                    "modules": [],
-                }
-            }
-        }
+        name = self.process_type('Bytes').value
+        args = self.process_type('Vec<MetadataModuleCallArgument>').value
+        docs = self.process_type('MetadataDocs').value
 
-        self.modules = self.process_type('Vec<MetadataV1Module>').elements
+        return Call(name, args, docs)
 
-        # Build call and event index
 
-        call_module_index = 0
-        event_module_index = 0
+class MetadataModuleCallArgument(ScaleType):
 
-        for module in self.modules:
-            if module.calls is not None:
-                for call_index, call in enumerate(module.calls):
-                    call.lookup = "{:02x}{:02x}".format(call_module_index, call_index)
-                    self.call_index[call.lookup] = (module, call)
-                call_module_index += 1
+    def process(self):
+        name = self.process_type('Bytes').value
+        arg_type = self.convert_type(self.process_type('Bytes').value)
 
-            if module.events is not None:
-                for event_index, event in enumerate(module.events):
-                    event.lookup = "{:02x}{:02x}".format(event_module_index, event_index)
-                    self.event_index[event.lookup] = (module, event)
-                event_module_index += 1
+        return Arg(name, arg_type)
 
-        result_data["metadata"]["MetadataV1"]["modules"] = [m.value for m in self.modules]
 
-        return result_data
+class MetadataModuleEvent(ScaleType):
+
+    def process(self):
+        name = self.process_type('Bytes').value
+        args = self.process_type('Vec<Bytes>').value
+        docs = self.process_type('MetadataDocs').value
+
+        return Event(name, args, docs)
 
 
 class MetadataV0Decoder(ScaleDecoder):
 
+    # Legacy MetadataV0 decodes into the same runtime model, but its deviating dict representation contains
+    # fields outside of that model (function ids, sections) so it is still built while decoding
+
     def __init__(self, data, sub_type=None):
         self.version = None
         self.events_modules = []
@@ -840,9 +942,11 @@ class MetadataV0Decoder(ScaleDecoder):
         self.sections = []
         self.call_index = {}
         self.event_index = {}
-
         super().__init__(data, sub_type)
 
+    def decode(self, check_remaining=True):
+        return decode_with_metadata_context(super().decode, self.data, check_remaining)
+
     def process(self):
         result_data = {
             "metadata": {
@@ -857,21 +961,22 @@ class MetadataV0Decoder(ScaleDecoder):
             }
         }
 
-        self.events_modules = self.process_type('Vec<MetadataV0EventModule>').elements
+        self.events_modules = self.process_type('Vec<MetadataV0EventModule>').value
 
-        self.modules = self.process_type('Vec<MetadataV0Module>').elements
+        module_decoders = self.process_type('Vec<MetadataV0Module>', retain_elements=True).elements
+        self.modules = [module_decoder.module for module_decoder in module_decoders]
 
         # TODO why "Call" unused?
         _ = self.process_type('Bytes').value
 
-        self.sections = self.process_type('Vec<MetadataV0Section>').elements
+        self.sections = self.process_type('Vec<MetadataV0Section>').value
 
         # Build call and event index
         call_module_index = 0
         for module_index, module in enumerate(self.modules):
-            if module_index > 0 and (len(module.functions) > 0 or len(module.storage) > 0):
+            if module_index > 0 and (len(module.calls) > 0 or len(module.storage) > 0):
 
-                for call_index, call in enumerate(module.functions):
+                for call_index, call in enumerate(module.calls):
                     call.lookup = "{:02x}{:02x}".format(call_module_index, call_index)
                     self.call_index[call.lookup] = (module, call)
 
@@ -882,96 +987,85 @@ class MetadataV0Decoder(ScaleDecoder):
                 event.lookup = "{:02x}{:02x}".format(event_module_index, event_index)
                 self.event_index[event.lookup] = (event_module, event)
 
-        result_data["metadata"]["MetadataV0"]["outerEvent"]["events"] = [e.value for e in self.events_modules]
-        result_data["metadata"]["MetadataV0"]["modules"] = [m.value for m in self.modules]
-        result_data["metadata"]["MetadataV0"]["sections"] = [s.value for s in self.sections]
+        result_data["metadata"]["MetadataV0"]["outerEvent"]["events"] = [
+            {
+                'name': event_module.name,
+                'events': [
+                    {"name": event.name, "arguments": event.args, "docs": event.docs} for event in event_module.events
+                ]
+            } for event_module in self.events_modules
+        ]
+        result_data["metadata"]["MetadataV0"]["modules"] = [m.value for m in module_decoders]
+        result_data["metadata"]["MetadataV0"]["sections"] = self.sections
 
         return result_data
 
 
 class MetadataV0EventModule(ScaleType):
 
-    def __init__(self, data, sub_type=None):
-        self.name = None
-        self.events = None
-        super().__init__(data, sub_type)
-
     def process(self):
-        self.name = self.process_type('Bytes').value
-        self.events = self.process_type('Vec<MetadataV0Event>').elements
-
-        return {
-            'name': self.name,
-            'events': [s.value for s in self.events]
-        }
-
+        name = self.process_type('Bytes').value
+        events = self.process_type('Vec<MetadataV0Event>').value
 
-class MetadataV0Event(ScaleType):
+        return Module(name, events=events)
 
-    def __init__(self, data, sub_type=None):
-        self.name = None
-        self.args = []
-        self.docs = []
-        super().__init__(data, sub_type)
-
-    def process(self):
-        self.name = self.process_type('Bytes').value
-        self.args = self.process_type('Vec<Bytes>').value
-        self.docs = self.process_type('Vec<Bytes>').value
 
-        return {
-            "name": self.name,
-            "arguments": self.args,
-            "docs": self.docs
-        }
+class MetadataV0Event(MetadataModuleEvent):
+    pass
 
 
 class MetadataV0Module(ScaleType):
 
     def __init__(self, data, sub_type=None):
-        self.prefix = None
-        self.name = None
-        self.call_name = None
-        self.functions = []
-        self.has_storage = False
-        self.storage_prefix = None
-        self.storage = []
-        self.constants = []
+        self.module = None
         super().__init__(data, sub_type)
 
-    # TODO move to version agnostic superclass MetadataModule
-    def get_identifier(self):
-        return self.prefix.lower()
-
     def process(self):
-        self.prefix = self.process_type('Bytes').value
-        self.name = self.process_type('Bytes').value
-        self.call_name = self.process_type('Bytes').value
+        prefix = self.process_type('Bytes').value
+        name = self.process_type('Bytes').value
+        call_name = self.process_type('Bytes').value
+
+        functions = self.process_type('Vec<MetadataV0ModuleFunction>', retain_elements=True).elements
 
-        self.functions = self.process_type('Vec<MetadataV0ModuleFunction>').elements
+        self.module = Module(name, prefix=prefix, identifier=prefix.lower(), calls=[f.value for f in functions])
 
         result = {
-            "prefix": self.prefix,
+            "prefix": prefix,
             "index": None,
             "module": {
-                "name": self.name,
+                "name": name,
                 "call": {
-                    "name": self.call_name,
-                    "functions": [s.value for s in self.functions]
+                    "name": call_name,
+                    "functions": [
+                        {
+                            "id": function.id,
+                            "name": function.value.name,
+                            "args": [arg.value for arg in function.value.args],
+                            "docs": function.value.docs
+                        } for function in functions
+                    ]
                 }
 
             },
         }
 
-        self.has_storage = self.process_type('bool').value
+        self.module.storage = []
 
-        if self.has_storage:
-            self.storage_prefix = self.process_type('Bytes').value
-            self.storage = self.process_type('Vec<MetadataV0ModuleStorage>').elements
+        if self.process_type('bool').value:
+            storage_prefix = self.process_type('Bytes').value
+            self.module.storage = self.process_type('Vec<MetadataV0ModuleStorage>').value
 
             result["storage"] = {
-                "prefix": self.storage_prefix,
-                "functions": [s.value for s in self.storage]
+                "prefix": storage_prefix,
+                "functions": [
+                    {
+                        "name": entry.name,
+                        "modifier": entry.modifier,
+                        "type": entry.type,
+                        "default": entry.fallback,
+                        "docs": entry.docs
+                    } for entry in self.module.storage
+                ]
             }
 
         return result
@@ -981,344 +1075,157 @@ class MetadataV0ModuleFunction(ScaleType):
 
     def __init__(self, data, sub_type=None):
         self.id = None
-        self.name = None
-        self.args = []
-        self.docs = []
         super().__init__(data, sub_type)
 
-    def get_identifier(self):
-        return self.name
-
     def process(self):
         self.id = self.get_next_bytes(2).hex()
-        self.name = self.process_type('Bytes').value
-        self.args = self.process_type('Vec<MetadataModuleCallArgument>').elements
-        self.docs = self.process_type('Vec<Bytes>').value
-
-        return {
-            "id": self.id,
-            "name": self.name,
-            "args": [s.value for s in self.args],
-            "docs": self.docs
-        }
-
-
-class MetadataV0ModuleStorage(ScaleType):
-
-    def __init__(self, data, sub_type=None):
-        self.name = None
-        self.modifier = None
-        self.type = {}
-        self.fallback = None
-        self.docs = []
-        super().__init__(data, sub_type)
-
-    def process(self):
-        self.name = self.process_type('Bytes').value
-        self.modifier = self.process_type('Enum', value_list=["Optional", "Default"]).value
-
-        is_key_value = self.process_type('bool').value
-
-        if is_key_value:
-            self.type = {
-                "MapType": {
-                    "key": self.convert_type(self.process_type('Bytes').value),
-                    "value": self.convert_type(self.process_type('Bytes').value)}
-            }
-        else:
-            self.type = {
-                "PlainType": self.convert_type(self.process_type('Bytes').value)
-            }
+        name = self.process_type('Bytes').value
+        args = self.process_type('Vec<MetadataModuleCallArgument>').value
+        docs = self.process_type('MetadataDocs').value
 
-        self.fallback = self.process_type('HexBytes').value
+        return Call(name, args, docs)
 
-        self.docs = self.process_type('Vec<Bytes>').value
 
-        return {
-            "name": self.name,
-            "modifier": self.modifier,
-            "type": self.type,
-            "default": self.fallback,
-            "docs": self.docs
-        }
+class MetadataV0ModuleStorage(MetadataV1ModuleStorage):
+    pass
 
 
 class MetadataV0Section(ScaleType):
 
-    def __init__(self, data, sub_type=None):
-        self.name = None
-        self.code = None
-        self.id = None
-
-        super().__init__(data, sub_type)
-
     def process(self):
-        self.name = self.process_type('Bytes').value
-        self.code = self.process_type('Bytes').value
-        self.id = self.get_next_bytes(2).hex()
-
         return {
-            "name": self.name,
-            "code": self.code,
-            "id": self.id
-        }
-
-
-class MetadataModule(ScaleType):
-
-    def __init__(self, data, sub_type=None):
-        self.name = None
-        self.prefix = None
-        self.call_index = None
-        self.has_storage = False
-        self.storage = None
-        self.has_calls = False
-        self.calls = None
-        self.has_events = False
-        self.events = None
-        self.constants = []
-        super().__init__(data, sub_type)
-
-    def get_identifier(self):
-        return self.name.lower()
-
-    def process(self):
-
-        self.name = self.process_type('Bytes').value
-        self.prefix = self.process_type('Bytes').value
-
-        result = {
-            "name": self.name,
-            "prefix": self.prefix,
-            "storage": self.storage,
-            "calls": self.calls,
-            "events": self.events,
-            "constants": self.constants
+            "name": self.process_type('Bytes').value,
+            "code": self.process_type('Bytes').value,
+            "id": self.get_next_bytes(2).hex()
         }
 
-        self.has_storage = self.process_type('bool').value
-
-        if self.has_storage:
-            # TODO convert to Option<Vec<MetadataModuleStorage>>
-            self.storage = self.process_type('Vec<MetadataModuleStorage>').elements
-            result["storage"] = [s.value for s in self.storage]
-
-        self.has_calls = self.process_type('bool').value
-
-        if self.has_calls:
-            # TODO convert to Option<Vec<MetadataModuleCall>>
-            self.calls = self.process_type('Vec<MetadataModuleCall>').elements
-            result["calls"] = [s.value for s in self.calls]
-
-        self.has_events = self.process_type('bool').value
-
-        if self.has_events:
-            # TODO convert to Option<Vec<MetadataModuleEvent>>
-            self.events = self.process_type('Vec<MetadataModuleEvent>').elements
-            result["events"] = [s.value for s in self.events]
 
-        return result
+# Version independent runtime model, all metadata versions are decoded into (or loaded as) these objects
 
+class Module:
 
-class MetadataV1Module(ScaleType):
+    __slots__ = ('name', 'prefix', 'identifier', 'storage', 'calls', 'events', 'constants')
 
-    def __init__(self, data, sub_type=None):
-        self.name = None
-        self.prefix = None
-        self.call_index = None
-        self.has_storage = False
-        self.storage = None
-        self.has_calls = False
-        self.calls = None
-        self.has_events = False
-        self.events = None
-        self.constants = []
-        super().__init__(data, sub_type)
+    def __init__(self, name, prefix=None, identifier=None, storage=None, calls=None, events=None, constants=None):
+        self.name = name
+        self.prefix = prefix
+        self.identifier = identifier or name.lower()
+        self.storage = storage
+        self.calls = calls
+        self.events = events
+        self.constants = constants or []
 
     def get_identifier(self):
-        return self.name.lower()
+        return self.identifier
 
-    def process(self):
-
-        self.name = self.process_type('Bytes').value
-        self.prefix = self.process_type('Bytes').value
-
-        result = {
+    @property
+    def value(self):
+        return {
             "name": self.name,
             "prefix": self.prefix,
-            "storage": self.storage,
-            "calls": self.calls,
-            "events": self.events,
-            "constants": self.constants
+            "storage": None if self.storage is None else [s.value for s in self.storage],
+            "calls": None if self.calls is None else [c.value for c in self.calls],
+            "events": None if self.events is None else [e.value for e in self.events],
+            "constants": [c.value for c in self.constants]
         }
 
-        self.has_storage = self.process_type('bool').value
-
-        if self.has_storage:
-            # TODO convert to Option<Vec<MetadataModuleStorage>>
-            self.storage = self.process_type('Vec<MetadataV1ModuleStorage>').elements
-            result["storage"] = [s.value for s in self.storage]
-
-        self.has_calls = self.process_type('bool').value
-
-        if self.has_calls:
-            # TODO convert to Option<Vec<MetadataModuleCall>>
-            self.calls = self.process_type('Vec<MetadataModuleCall>').elements
-            result["calls"] = [s.value for s in self.calls]
-
-        self.has_events = self.process_type('bool').value
-
-        if self.has_events:
-            # TODO convert to Option<Vec<MetadataModuleEvent>>
-            self.events = self.process_type('Vec<MetadataModuleEvent>').elements
-            result["events"] = [s.value for s in self.events]
-
-        return result
-
-
-class MetadataModuleStorage(ScaleType):
-
-    def __init__(self, data, sub_type=None):
-        self.name = None
-        self.modifier = None
-        self.type = {}
-        self.fallback = None
-        self.docs = []
-        super().__init__(data, sub_type)
-
-    def process(self):
-        self.name = self.process_type('Bytes').value
-        self.modifier = self.process_type('Enum', value_list=["Optional", "Default"]).value
-
-        is_key_value = self.process_type('bool').value
 
-        if is_key_value:
-            self.type = {
-                "MapType": {
-                    "key": self.convert_type(self.process_type('Bytes').value),
-                    "value": self.convert_type(self.process_type('Bytes').value),
-                    "isLinked": self.process_type('bool').value
-                }
+class Call:
 
-            }
-        else:
-            self.type = {
-                "PlainType": self.convert_type(self.process_type('Bytes').value)
-            }
+    __slots__ = ('name', 'args', 'docs', 'lookup', 'arg_plans')
 
-        self.fallback = self.process_type('HexBytes').value
+    def __init__(self, name, args, docs=None):
+        self.name = name
+        self.args = args
+        self.docs = docs or []
+        self.lookup = None
+        self.arg_plans = None
 
-        self.docs = self.process_type('Vec<Bytes>').value
+    def get_identifier(self):
+        return self.name
 
+    @property
+    def value(self):
         return {
             "name": self.name,
-            "modifier": self.modifier,
-            "type": self.type,
-            "fallback": self.fallback,
+            "args": [a.value for a in self.args],
             "docs": self.docs
         }
 
 
-class MetadataV1ModuleStorage(ScaleType):
-
-    def __init__(self, data, sub_type=None):
-        self.name = None
-        self.modifier = None
-        self.type = {}
-        self.fallback = None
-        self.docs = []
-        super().__init__(data, sub_type)
-
-    def process(self):
-        self.name = self.process_type('Bytes').value
-        self.modifier = self.process_type('Enum', value_list=["Optional", "Default"]).value
-
-        is_key_value = self.process_type('bool').value
-
-        if is_key_value:
-            self.type = {
-                "MapType": {
-                    "key": self.convert_type(self.process_type('Bytes').value),
-                    "value": self.convert_type(self.process_type('Bytes').value)
-                }
-
-            }
-        else:
-            self.type = {
-                "PlainType": self.convert_type(self.process_type('Bytes').value)
-            }
+class Arg:
 
-        self.fallback = self.process_type('HexBytes').value
+    __slots__ = ('name', 'type')
 
-        self.docs = self.process_type('Vec<Bytes>').value
+    def __init__(self, name, type):
+        self.name = name
+        self.type = type
 
+    @property
+    def value(self):
         return {
             "name": self.name,
-            "modifier": self.modifier,
-            "type": self.type,
-            "fallback": self.fallback,
-            "docs": self.docs
+            "type": self.type
         }
 
 
-class MetadataModuleCall(ScaleType):
-
-    def __init__(self, data, sub_type=None):
-        self.name = None
-        self.args = []
-        self.docs = []
-        super().__init__(data, sub_type)
-
-    def get_identifier(self):
-        return self.name
-
-    def process(self):
-        self.name = self.process_type('Bytes').value
+class Event:
 
-        self.args = self.process_type('Vec<MetadataModuleCallArgument>').elements
+    __slots__ = ('name', 'args', 'docs', 'lookup', 'arg_plans')
 
-        self.docs = self.process_type('Vec<Bytes>').value
+    def __init__(self, name, args, docs=None):
+        self.name = name
+        self.args = args
+        self.docs = docs or []
+        self.lookup = None
+        self.arg_plans = None
 
+    @property
+    def value(self):
         return {
             "name": self.name,
-            "args": [a.value for a in self.args],
+            "args": self.args,
             "docs": self.docs
         }
 
 
-class MetadataModuleCallArgument(ScaleType):
-
-    def __init__(self, data, sub_type=None):
-        self.name = None
-        self.type = None
+class StorageEntry:
 
-        super().__init__(data, sub_type)
+    __slots__ = ('name', 'modifier', 'type', 'fallback', 'docs')
 
-    def process(self):
-        self.name = self.process_type('Bytes').value
-        self.type = self.convert_type(self.process_type('Bytes').value)
+    def __init__(self, name, modifier, type, fallback, docs=None):
+        self.name = name
+        self.modifier = modifier
+        self.type = type
+        self.fallback = fallback
+        self.docs = docs or []
 
+    @property
+    def value(self):
         return {
             "name": self.name,
-            "type": self.type
+            "modifier": self.modifier,
+            "type": self.type,
+            "fallback": self.fallback,
+            "docs": self.docs
         }
 
 
-class MetadataModuleEvent(ScaleType):
+class Constant:
 
-    def __init__(self, data, sub_type=None):
-        self.name = None
-        self.args = []
-        self.docs = []
-        super().__init__(data, sub_type)
+    __slots__ = ('name', 'type', 'constant_value', 'docs')
 
-    def process(self):
-        self.name = self.process_type('Bytes').value
-        self.args = self.process_type('Vec<Bytes>').value
-        self.docs = self.process_type('Vec<Bytes>').value
+    def __init__(self, name, type, constant_value, docs=None):
+        self.name = name
+        self.type = type
+        self.constant_value = constant_value
+        self.docs = docs or []
 
+    @property
+    def value(self):
         return {
             "name": self.name,
-            "args": self.args,
+            "type": self.type,
+            "value": self.constant_value,
             "docs": self.docs
         }
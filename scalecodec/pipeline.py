@@ -0,0 +1,151 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from scalecodec.base import ScaleBytes, DecodeContext
+from scalecodec.block import Block, EventsDecoder
+from scalecodec.metadata import MetadataDecoder
+
+
+class RawBlock:
+
+    def __init__(self, data, spec_version=None, events=None):
+        # Encoded block (hex or bytes), the runtime spec version it was produced with and optionally
+        # the encoded 'System.Events' storage value of the block
+        self.data = data
+        self.spec_version = spec_version
+        self.events = events
+
+
+def decode_metadata(data, context=None):
+    metadata_decoder = MetadataDecoder(ScaleBytes(data, context=context))
+    metadata_decoder.decode()
+    return metadata_decoder
+
+
+def get_decode_contexts(raw_block):
+    # Decode contexts of the block and its events, types are resolved with the type registry of the spec
+    # version of the block. Only the event values are returned, the event decoders are not retained.
+    spec_version_id = 'default' if raw_block.spec_version is None else raw_block.spec_version
+
+    return DecodeContext(spec_version_id=spec_version_id), \
+        DecodeContext(spec_version_id=spec_version_id, values_only=True)
+
+
+def decode_block(raw_block, metadata):
+    block_context, events_context = get_decode_contexts(raw_block)
+
+    block = Block(ScaleBytes(raw_block.data, context=block_context), metadata=metadata)
+    result = block.decode()
+
+    if raw_block.events is not None:
+        events_decoder = EventsDecoder(ScaleBytes(raw_block.events, context=events_context), metadata=metadata)
+        result['events'] = events_decoder.decode()
+
+    result['spec_version'] = raw_block.spec_version
+
+    return result
+
+
+class BlockPipeline:
+
+    def __init__(self, metadata_provider=None, metadata=None, concurrency=4, executor=None, decode_context=None):
+        # metadata_provider is called with the spec version of a block when it differs from the current
+        # runtime and should return a MetadataDecoder or encoded metadata (hex or bytes), optionally
+        # as an awaitable. Encoded metadata is decoded with decode_context (e.g. DecodeContext(skip_docs=True)).
+        # An executor passed in is owned by the caller and not shut down, otherwise a thread pool of
+        # `concurrency` workers is created for each process() run.
+        if concurrency < 1:
+            raise ValueError('Concurrency should be at least 1')
+
+        self.metadata_provider = metadata_provider
+        self.metadata = metadata
+        self.spec_version = None
+        self.concurrency = concurrency
+        self.executor = executor
+        self.decode_context = decode_context
+
+    async def switch_runtime(self, spec_version, loop, executor):
+        if self.metadata_provider is None:
+            raise ValueError('No metadata provider available for spec version {}'.format(spec_version))
+
+        metadata = self.metadata_provider(spec_version)
+
+        if asyncio.iscoroutine(metadata) or isinstance(metadata, asyncio.Future):
+            metadata = await metadata
+
+        if type(metadata) is not MetadataDecoder:
+            metadata = await loop.run_in_executor(executor, decode_metadata, metadata, self.decode_context)
+
+        self.metadata = metadata
+        self.spec_version = spec_version
+
+    async def process(self, source):
+        # Decode the raw blocks from the async iterable source in the executor and yield the results
+        # in source order. At most `concurrency` blocks are in flight, the source is not read further
+        # until the oldest one is consumed.
+        loop = asyncio.get_running_loop()
+
+        executor = self.executor or ThreadPoolExecutor(max_workers=self.concurrency)
+
+        pending = deque()
+
+        try:
+            async for raw_block in source:
+
+                if type(raw_block) is not RawBlock:
+                    raw_block = RawBlock(raw_block)
+
+                if raw_block.spec_version is not None and raw_block.spec_version != self.spec_version:
+                    await self.switch_runtime(raw_block.spec_version, loop, executor)
+
+                if self.metadata is None:
+                    raise ValueError('No metadata available to decode block')
+
+                pending.append(loop.run_in_executor(executor, decode_block, raw_block, self.metadata))
+
+                if len(pending) >= self.concurrency:
+                    yield await pending.popleft()
+
+            while pending:
+                yield await pending.popleft()
+
+        finally:
+            for future in pending:
+                future.cancel()
+
+            if executor is not self.executor:
+                executor.shutdown(wait=False)
+
+
+class LocalBlockSource:
+
+    def __init__(self, blocks, delay=0):
+        # In-process stand-in for a node subscription, yields the provided raw blocks
+        self.blocks = blocks
+        self.delay = delay
+        self.blocks_read = 0
+
+    def __aiter__(self):
+        return self.iterate()
+
+    async def iterate(self):
+        for raw_block in self.blocks:
+            await asyncio.sleep(self.delay)
+            self.blocks_read += 1
+            yield raw_block
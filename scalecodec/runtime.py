@@ -0,0 +1,199 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import sys
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import RLock
+
+from scalecodec.base import ScaleBytes
+from scalecodec.metadata import MetadataDecoder
+
+
+def estimate_size(obj, seen=None):
+    # Rough deep size in bytes of an object graph, only used to bound caches
+    if seen is None:
+        seen = set()
+
+    if id(obj) in seen:
+        return 0
+
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        size += sum(estimate_size(key, seen) + estimate_size(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, seen) for item in obj)
+    elif hasattr(obj, '__dict__') and not isinstance(obj, type):
+        size += estimate_size(obj.__dict__, seen)
+    elif hasattr(obj, '__slots__') and not isinstance(obj, type):
+        size += sum(estimate_size(getattr(obj, slot), seen) for slot in obj.__slots__ if hasattr(obj, slot))
+
+    return size
+
+
+class Runtime:
+
+    def __init__(self, metadata, spec_version=None, metadata_hash=None):
+        self.metadata = metadata
+        self.spec_version = spec_version
+        self.metadata_hash = metadata_hash
+        self.size = 0
+
+    def estimate_size(self, seen=None):
+        # Objects already in seen (e.g. decoder plans shared with another runtime) are not counted again
+        self.size = estimate_size(self, seen)
+        return self.size
+
+
+class RuntimeManager:
+
+    def __init__(self, metadata_provider=None, max_runtimes=8, max_bytes=None, metadata_cache=None,
+                 decode_context=None):
+        # metadata_provider is called with a spec version on a miss and should return a MetadataDecoder or
+        # the encoded metadata (hex or bytes). Runtimes are evicted least recently used first when there
+        # are more than max_runtimes or their estimated size exceeds max_bytes. decode_context is used to
+        # decode encoded metadata, e.g. DecodeContext(skip_docs=True).
+        self.metadata_provider = metadata_provider
+        self.max_runtimes = max_runtimes
+        self.max_bytes = max_bytes
+        self.metadata_cache = metadata_cache
+        self.decode_context = decode_context
+
+        self.runtimes = OrderedDict()
+        self.spec_versions = {}
+        self.total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.lock = RLock()
+
+    def get_runtime(self, spec_version=None, metadata_hash=None):
+
+        with self.lock:
+            if metadata_hash is None:
+                metadata_hash = self.spec_versions.get(spec_version)
+
+            runtime = self.runtimes.get(metadata_hash)
+
+            if runtime:
+                self.hits += 1
+                self.runtimes.move_to_end(metadata_hash)
+                return runtime
+
+            self.misses += 1
+
+        if spec_version is None or self.metadata_provider is None:
+            return None
+
+        return self.add_runtime(self.metadata_provider(spec_version), spec_version=spec_version)
+
+    def get_metadata(self, spec_version):
+        runtime = self.get_runtime(spec_version=spec_version)
+        if runtime:
+            return runtime.metadata
+
+    def add_runtime(self, metadata, spec_version=None, metadata_hash=None):
+
+        if type(metadata) is MetadataDecoder:
+            if metadata_hash is None:
+                if not metadata.data.length:
+                    raise ValueError('Metadata hash is required for metadata not decoded from SCALE bytes')
+                metadata_hash = blake2b(bytes(metadata.data.data), digest_size=32).hexdigest()
+            # A provided MetadataDecoder keeps its own spec version
+            compile_spec_version = None
+        elif self.metadata_cache:
+            metadata_hash = self.metadata_cache.get_metadata_hash(metadata)
+            metadata = self.metadata_cache.get(metadata, spec_version_id=spec_version, compile_plans=False)
+            compile_spec_version = spec_version
+        else:
+            # Storage entries, constants and the decoder plans use the type registry of the spec version
+            metadata = MetadataDecoder(
+                ScaleBytes(metadata, context=self.decode_context), compile_plans=False, spec_version_id=spec_version
+            )
+            metadata.decode()
+            metadata_hash = blake2b(bytes(metadata.data.data), digest_size=32).hexdigest()
+            compile_spec_version = spec_version
+
+        with self.lock:
+            if metadata_hash in self.runtimes:
+                # Same runtime for another spec version
+                if spec_version is not None:
+                    self.spec_versions[spec_version] = metadata_hash
+                self.runtimes.move_to_end(metadata_hash)
+                return self.runtimes[metadata_hash]
+
+        # Carry over the decoder plans of calls, events and storage entries unchanged since the most recently
+        # used runtime
+        previous_runtime = self.get_latest_runtime()
+        metadata.compile_decoder_plans(
+            compile_spec_version, previous=previous_runtime.metadata if previous_runtime else None
+        )
+
+        runtime = Runtime(metadata, spec_version=spec_version, metadata_hash=metadata_hash)
+
+        with self.lock:
+            if spec_version is not None:
+                self.spec_versions[spec_version] = metadata_hash
+
+            if metadata_hash in self.runtimes:
+                # Added concurrently
+                self.runtimes.move_to_end(metadata_hash)
+                return self.runtimes[metadata_hash]
+
+            self.runtimes[metadata_hash] = runtime
+            self.update_sizes()
+            self.evict()
+
+        return runtime
+
+    def get_latest_runtime(self):
+        with self.lock:
+            if self.runtimes:
+                return next(reversed(self.runtimes.values()))
+
+    def update_sizes(self):
+        # Decoder plans and interned names are shared between runtimes, so they are only counted for the
+        # most recently used runtime holding them. Runtime.size is then about the size freed when evicting
+        # it before the more recent runtimes.
+        seen = set()
+        self.total_bytes = sum(runtime.estimate_size(seen) for runtime in reversed(self.runtimes.values()))
+
+    def evict(self):
+        # Always keep the most recently added runtime, even if it exceeds the limits on its own
+        while len(self.runtimes) > 1 and (
+                (self.max_runtimes is not None and len(self.runtimes) > self.max_runtimes) or
+                (self.max_bytes is not None and self.total_bytes > self.max_bytes)):
+
+            metadata_hash, runtime = self.runtimes.popitem(last=False)
+            self.evictions += 1
+
+            for spec_version in [k for k, v in self.spec_versions.items() if v == metadata_hash]:
+                del self.spec_versions[spec_version]
+
+            # Objects shared with the evicted runtime are now counted for the next runtime holding them
+            self.update_sizes()
+
+    def get_stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'runtimes': len(self.runtimes),
+            'bytes': self.total_bytes
+        }
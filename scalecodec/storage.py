@@ -0,0 +1,125 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import copy
+
+from scalecodec.base import ScaleDecoder, ScaleBytes, DecodeContext
+from scalecodec.hashing import get_hasher, twox_128
+
+
+class StorageKeyBuilder:
+
+    # Builds the storage keys of a storage entry, using the key layout of the runtimes described by
+    # metadata V0-V7: plain entries are stored at twox128("<prefix> <name>"), maps at
+    # hasher("<prefix> <name>" + key) and double maps at hasher("<prefix> <name>" + key1) + key2_hasher(key2).
+    # The prefix is absorbed in the hasher state once, so batches only hash the encoded keys.
+
+    def __init__(self, prefix, entry, spec_version_id='default'):
+        self.prefix = prefix
+        self.entry = entry
+        self.storage_prefix = '{} {}'.format(prefix, entry.name).encode()
+
+        self.key = None
+        self.hasher = None
+        self.key2_hasher = None
+        self.key_plans = []
+
+        if 'PlainType' in entry.type:
+            self.key = '0x{}'.format(twox_128(self.storage_prefix).hex())
+
+        elif 'MapType' in entry.type:
+            map_type = entry.type['MapType']
+            # Maps were always hashed with blake2_256 before the hasher was added to the metadata (V4)
+            self.hasher = get_hasher(map_type.get('hasher', 'Blake2_256'), self.storage_prefix)
+            self.key_plans = [ScaleDecoder.get_decoder_plan(map_type['key'], spec_version_id=spec_version_id)]
+
+        elif 'DoubleMapType' in entry.type:
+            map_type = entry.type['DoubleMapType']
+            self.hasher = get_hasher(map_type['hasher'], self.storage_prefix)
+            self.key2_hasher = get_hasher(map_type['key2Hasher'])
+            self.key_plans = [
+                ScaleDecoder.get_decoder_plan(map_type['key1'], spec_version_id=spec_version_id),
+                ScaleDecoder.get_decoder_plan(map_type['key2'], spec_version_id=spec_version_id)
+            ]
+        else:
+            raise NotImplementedError("Storage type '{}' not supported".format(entry.type))
+
+    @staticmethod
+    def encode_param(key_plan, param):
+        # Already encoded keys are used as is
+        if type(param) in (bytes, bytearray):
+            return bytes(param)
+
+        return bytes(key_plan.get_decoder(ScaleBytes(bytearray())).encode(param).data)
+
+    def get_key(self, *params):
+        if len(params) != len(self.key_plans):
+            raise ValueError('Storage entry {} requires {} key(s), {} provided'.format(
+                self.entry.name, len(self.key_plans), len(params))
+            )
+
+        if self.key:
+            return self.key
+
+        storage_key = self.hasher.hash(self.encode_param(self.key_plans[0], params[0]))
+
+        if self.key2_hasher:
+            storage_key += self.key2_hasher.hash(self.encode_param(self.key_plans[1], params[1]))
+
+        return '0x{}'.format(storage_key.hex())
+
+    def get_keys(self, params_list):
+        # Batch variant of get_key(), maps take a list of keys and double maps a list of (key1, key2) tuples
+        if len(self.key_plans) == 1:
+            return [self.get_key(param) for param in params_list]
+
+        return [self.get_key(*params) for params in params_list]
+
+
+class StorageValueDecoder:
+
+    # Decodes the storage values of a storage entry, the value type is resolved once and the fallback of
+    # 'Default' entries is decoded once and returned for missing (None) values
+
+    def __init__(self, entry, spec_version_id='default'):
+        self.entry = entry
+
+        if 'PlainType' in entry.type:
+            self.value_type = entry.type['PlainType']
+        else:
+            self.value_type = list(entry.type.values())[0]['value']
+
+        self.value_plan = ScaleDecoder.get_decoder_plan(self.value_type, spec_version_id=spec_version_id)
+        # Only values are returned, element decoders of (large) vectors are not retained
+        self.context = DecodeContext(spec_version_id=spec_version_id, values_only=True)
+
+        self.default = None
+
+        if entry.modifier == 'Default' and entry.fallback:
+            self.default = self.value_plan.decode(ScaleBytes(entry.fallback, context=self.context)).value
+
+    def decode(self, data):
+        # data is the encoded value (hex or bytes) as returned by the node, or None when not present
+        if data is None:
+            if type(self.default) in (dict, list):
+                # Do not hand out the cached instance
+                return copy.deepcopy(self.default)
+            return self.default
+
+        return self.value_plan.decode(ScaleBytes(data, context=self.context)).value
+
+    def decode_batch(self, data_list):
+        return [self.decode(data) for data in data_list]
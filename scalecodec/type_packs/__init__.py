@@ -0,0 +1,49 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Chain specific types, which are only imported when one of their type strings is looked up and not found in
+# the registry of the core types (or loaded explicitly with RuntimeConfiguration().load_type_pack(<name>)).
+# Per pack the class names and type strings it provides; test_type_registry checks these are complete.
+
+type_packs = {
+    'edgeware': (
+        'EdgewareKeys', 'EdgewareQueuedKeys', '(ValidatorId, EdgewareKeys)', 'IdentityType', 'VoteType',
+        'voting::VoteType', 'VoteOutcome', 'Identity', 'ProposalTitle', 'ProposalContents', 'ProposalStage',
+        'ProposalCategory', 'VoteStage', 'TallyType', 'voting::TallyType', 'Attestation',
+    ),
+    'joystream': (
+        'ContentId', 'MemberId', 'PaidTermId', 'SubscriptionId', 'SchemaId', 'DownloadSessionId', 'UserInfo',
+        'Role', 'ContentVisibility', 'ContentMetadata', 'ContentMetadataUpdate', 'LiaisonJudgement', 'BlockAndTime',
+        'DataObjectTypeId', '<T as DOTRTrait>::DataObjectTypeId', 'DataObject', 'DataObjectStorageRelationshipId',
+        'IPNSIdentity', 'AccountInfo', 'AccountInfo<BlockNumber>', 'DownloadState', 'DownloadSession', 'Url',
+        'EntryMethod', 'Profile', 'PaidMembershipTerms', 'ThreadId', 'InputValidationLengthConstraint',
+        'BlockchainTimestamp', 'BlockchainTimestamp<BlockNumber, Moment>', 'ModerationAction', 'PostId',
+        'PostTextChange', 'PostTextChange<BlockNumber, Moment>', 'Post', 'Post<BlockNumber, Moment, AccountId>',
+        'Thread', 'Thread<BlockNumber, Moment, AccountId>', 'CategoryId', 'ChildPositionInParentCategory',
+        'Category', 'Category<BlockNumber, Moment, AccountId>', 'ProposalStatus', 'VoteKind',
+        'RuntimeUpgradeProposal', 'RuntimeUpgradeProposal<AccountId, Balance, BlockNumber, Hash>', 'TallyResult',
+        'TallyResult<BlockNumber>',
+    ),
+    'polkadot': (
+        'SessionKeysPolkadot', 'Bidder', 'Bidder<AccountId, ParaIdOf>', 'BlockAttestations', 'IncludedBlocks',
+        'CandidateReceipt', 'CollatorSignature', 'HeadData', 'UpwardMessage', 'ParachainDispatchOrigin',
+        'WinningDataEntry',
+    ),
+    'robonomics': (
+        'Order', 'Order<Balance, AccountId>', 'Offer', 'Offer<Balance, AccountId>', 'Demand',
+        'Demand<Balance, AccountId>', 'Liability', 'Liability<Balance, AccountId>', 'LiabilityIndex',
+    ),
+}
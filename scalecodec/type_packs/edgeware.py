@@ -0,0 +1,85 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Edgeware types, loaded on first lookup (see scalecodec.type_packs)
+
+from scalecodec.base import ScaleType
+from scalecodec.types import Bytes, Enum, Struct
+
+
+class EdgewareKeys(Struct):
+    type_mapping = (
+        ('grandpa', 'AccountId'),
+    )
+
+
+class EdgewareQueuedKeys(Struct):
+    type_string = '(ValidatorId, EdgewareKeys)'
+
+    type_mapping = (
+        ('validator', 'ValidatorId'),
+        ('keys', 'EdgewareKeys'),
+    )
+
+
+class IdentityType(Bytes):
+    pass
+
+
+class VoteType(Enum):
+    type_string = 'voting::VoteType'
+
+    value_list = ['Binary', 'MultiOption']
+
+
+class VoteOutcome(ScaleType):
+
+    def process(self):
+        return list(self.get_next_bytes(32))
+
+
+class Identity(Bytes):
+    pass
+
+
+class ProposalTitle(Bytes):
+    pass
+
+
+class ProposalContents(Bytes):
+    pass
+
+
+class ProposalStage(Enum):
+    value_list = ['PreVoting', 'Voting', 'Completed']
+
+
+class ProposalCategory(Enum):
+    value_list = ['Signaling']
+
+
+class VoteStage(Enum):
+    value_list = ['PreVoting', 'Commit', 'Voting', 'Completed']
+
+
+class TallyType(Enum):
+    type_string = 'voting::TallyType'
+
+    value_list = ['OnePerson', 'OneCoin']
+
+
+class Attestation(Bytes):
+    pass
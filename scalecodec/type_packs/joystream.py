@@ -0,0 +1,310 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Joystream types, loaded on first lookup (see scalecodec.type_packs)
+
+from scalecodec.types import Bytes, Enum, H256, Struct, U64
+
+
+class ContentId(H256):
+    pass
+
+
+class MemberId(U64):
+    pass
+
+
+class PaidTermId(U64):
+    pass
+
+
+class SubscriptionId(U64):
+    pass
+
+
+class SchemaId(U64):
+    pass
+
+
+class DownloadSessionId(U64):
+    pass
+
+
+class UserInfo(Struct):
+    type_mapping = (
+        ('handle', 'Option<Vec<u8>>'),
+        ('avatar_uri', 'Option<Vec<u8>>'),
+        ('about', 'Option<Vec<u8>>')
+    )
+
+
+class Role(Enum):
+    value_list = ['Storage']
+
+
+class ContentVisibility(Enum):
+    value_list = ['Draft', 'Public']
+
+
+class ContentMetadata(Struct):
+    type_mapping = (
+        ('owner', 'AccountId'),
+        ('added_at', 'BlockAndTime'),
+        ('children_ids', 'Vec<ContentId>'),
+        ('visibility', 'ContentVisibility'),
+        ('schema', 'SchemaId'),
+        ('json', 'Vec<u8>'),
+
+    )
+
+
+class ContentMetadataUpdate(Struct):
+    type_mapping = (
+        ('children_ids', 'Option<Vec<ContentId>>'),
+        ('visibility', 'Option<ContentVisibility>'),
+        ('schema', 'Option<SchemaId>'),
+        ('json', 'Option<Vec<u8>>')
+    )
+
+
+class LiaisonJudgement(Enum):
+    value_list = ['Pending', 'Accepted', 'Rejected']
+
+
+class BlockAndTime(Struct):
+    type_mapping = (
+        ('block', 'BlockNumber'),
+        ('time', 'Moment')
+    )
+
+
+class DataObjectTypeId(U64):
+    type_string = "<T as DOTRTrait>::DataObjectTypeId"
+
+
+class DataObject(Struct):
+    type_mapping = (
+        ('owner', 'AccountId'),
+        ('added_at', 'BlockAndTime'),
+        ('type_id', 'DataObjectTypeId'),
+        ('size', 'u64'),
+        ('liaison', 'AccountId'),
+        ('liaison_judgement', 'LiaisonJudgement'),
+        ('ipfs_content_id', 'Bytes'),
+    )
+
+
+class DataObjectStorageRelationshipId(U64):
+    pass
+
+
+class IPNSIdentity(Bytes):
+    pass
+
+
+class AccountInfo(Struct):
+    type_string = 'AccountInfo<BlockNumber>'
+
+    type_mapping = (
+        ('identity', 'IPNSIdentity'),
+        ('expires_at', 'BlockNumber'),
+    )
+
+
+class DownloadState(Enum):
+    value_list = ['Started', 'Ended']
+
+
+class DownloadSession(Struct):
+    type_mapping = (
+        ('content_id', 'ContentId'),
+        ('consumer', 'AccountId'),
+        ('distributor', 'AccountId'),
+        ('initiated_at_block', 'BlockNumber'),
+        ('initiated_at_time', 'BlockNumber'),
+        ('state', 'DownloadState'),
+        ('transmitted_bytes', 'u64'),
+    )
+
+
+class Url(Bytes):
+    pass
+
+
+class EntryMethod(Enum):
+    value_list = ['Paid', 'Screening']
+
+
+class Profile(Struct):
+    type_mapping = (
+        ('id', 'MemberId'),
+        ('handle', 'Bytes'),
+        ('avatar_uri', 'Bytes'),
+        ('about', 'Bytes'),
+        ('registered_at_block', 'BlockNumber'),
+        ('registered_at_time', 'Moment'),
+        ('entry', 'EntryMethod'),
+        ('suspended', 'bool'),
+        ('subscription', 'Option<SubscriptionId>'),
+    )
+
+
+class PaidMembershipTerms(Struct):
+    type_mapping = (
+        ('id', 'PaidTermId'),
+        ('fee', 'BalanceOf'),
+        ('text', 'Bytes'),
+    )
+
+
+class ThreadId(U64):
+    pass
+
+
+class InputValidationLengthConstraint(Struct):
+    type_mapping = (
+        ('min', 'u16'),
+        ('max_min_diff', 'u16'),
+    )
+
+
+class BlockchainTimestamp(Struct):
+    type_string = 'BlockchainTimestamp<BlockNumber, Moment>'
+
+    type_mapping = (
+        ('block', 'BlockNumber'),
+        ('time', 'Moment'),
+    )
+
+
+class ModerationAction(Struct):
+    type_mapping = (
+        ('moderated_at', 'BlockchainTimestamp<BlockNumber, Moment>'),
+        ('moderator_id', 'AccountId'),
+        ('rationale', 'Vec<u8>'),
+    )
+
+
+class PostId(U64):
+    pass
+
+
+class PostTextChange(Struct):
+    type_string = 'PostTextChange<BlockNumber, Moment>'
+
+    type_mapping = (
+        ('expired_at', 'BlockchainTimestamp<BlockNumber, Moment>'),
+        ('text', 'Vec<u8>'),
+    )
+
+
+class Post(Struct):
+    type_string = 'Post<BlockNumber, Moment, AccountId>'
+
+    type_mapping = (
+        ('id', 'PostId'),
+        ('thread_id', 'ThreadId'),
+        ('nr_in_thread', 'u32'),
+        ('current_text', 'Vec<u8>'),
+        ('moderation', 'Option<ModerationAction<BlockNumber, Moment, AccountId>>'),
+        ('text_change_history', 'Vec<PostTextChange<BlockNumber, Moment>>'),
+        ('created_at', 'BlockchainTimestamp<BlockNumber, Moment>'),
+        ('author_id', 'AccountId'),
+
+    )
+
+
+class Thread(Struct):
+    type_string = 'Thread<BlockNumber, Moment, AccountId>'
+
+    type_mapping = (
+        ('id', 'ThreadId'),
+        ('title', 'Vec<u8>'),
+        ('category_id', 'CategoryId'),
+        ('nr_in_category', 'u32'),
+        ('moderation', 'Option<ModerationAction<BlockNumber, Moment, AccountId>>'),
+        ('num_unmoderated_posts', 'u32'),
+        ('num_moderated_posts', 'u32'),
+        ('author_id', 'AccountId'),
+        ('created_at', 'BlockchainTimestamp<BlockNumber, Moment>'),
+        ('author_id', 'AccountId'),
+    )
+
+
+class CategoryId(U64):
+    pass
+
+
+class ChildPositionInParentCategory(Struct):
+    type_mapping = (
+        ('parent_id', 'CategoryId'),
+        ('child_nr_in_parent_category', 'u32'),
+    )
+
+
+class Category(Struct):
+    type_string = 'Category<BlockNumber, Moment, AccountId>'
+
+    type_mapping = (
+        ('id', 'CategoryId'),
+        ('title', 'Vec<u8>'),
+        ('description', 'Vec<u8>'),
+        ('created_at', 'BlockchainTimestamp<BlockNumber, Moment>'),
+        ('deleted', 'bool'),
+        ('archived', 'bool'),
+        ('num_direct_subcategories', 'u32'),
+        ('num_direct_unmoderated_threads', 'u32'),
+        ('num_direct_moderated_threads', 'u32'),
+        ('position_in_parent_category', 'Option<ChildPositionInParentCategory>'),
+        ('moderator_id', 'AccountId'),
+    )
+
+
+class ProposalStatus(Enum):
+    value_list = ['Active', 'Cancelled', 'Expired', 'Approved', 'Rejected', 'Slashed']
+
+
+class VoteKind(Enum):
+    value_list = ['Abstain', 'Approve', 'Reject', 'Slash']
+
+
+class RuntimeUpgradeProposal(Struct):
+    type_string = 'RuntimeUpgradeProposal<AccountId, Balance, BlockNumber, Hash>'
+
+    type_mapping = (
+        ('id', 'u32'),
+        ('proposer', 'AccountId'),
+        ('stake', 'Balance'),
+        ('name', 'Vec<u8>'),
+        ('description', 'Vec<u8>'),
+        ('wasm_hash', 'Hash'),
+        ('proposed_at', 'BlockNumber'),
+        ('status', 'ProposalStatus'),
+    )
+
+
+class TallyResult(Struct):
+    type_string = 'TallyResult<BlockNumber>'
+
+    type_mapping = (
+        ('proposal_id', 'u32'),
+        ('abstentions', 'u32'),
+        ('approvals', 'u32'),
+        ('rejections', 'u32'),
+        ('slashes', 'u32'),
+        ('status', 'ProposalStatus'),
+        ('finalized_at', 'BlockNumber'),
+    )
@@ -0,0 +1,92 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Polkadot (parachains and slots) types, loaded on first lookup (see scalecodec.type_packs)
+
+from scalecodec.types import Bytes, Enum, Signature, Struct
+
+
+class SessionKeysPolkadot(Struct):
+    type_mapping = (
+        ('grandpa', 'AccountId'),
+        ('babe', 'AccountId'),
+        ('im_online', 'AccountId'),
+        ('parachains', 'AccountId'),
+    )
+
+
+class Bidder(Enum):
+    type_string = 'Bidder<AccountId, ParaIdOf>'
+
+    value_list = ['NewBidder', 'ParaId']
+
+
+class BlockAttestations(Struct):
+    type_mapping = (
+        ('receipt', 'CandidateReceipt'),
+        ('valid', 'Vec<AccountId>'),
+        ('invalid', 'Vec<AccountId>'),
+    )
+
+
+class IncludedBlocks(Struct):
+    type_mapping = (
+        ('actualNumber', 'BlockNumber'),
+        ('session', 'SessionIndex'),
+        ('randomSeed', 'H256'),
+        ('activeParachains', 'Vec<ParaId>'),
+        ('paraBlocks', 'Vec<Hash>'),
+    )
+
+
+class CandidateReceipt(Struct):
+    type_mapping = (
+        ('parachainIndex', 'ParaId'),
+        ('collator', 'AccountId'),
+        ('signature', 'CollatorSignature'),
+        ('headData', 'HeadData'),
+        ('balanceUploads', 'Vec<BalanceUpload>'),
+        ('egressQueueRoots', 'Vec<EgressQueueRoot>'),
+        ('fees', 'u64'),
+        ('blockDataHash', 'Hash'),
+    )
+
+
+class CollatorSignature(Signature):
+    pass
+
+
+class HeadData(Bytes):
+    pass
+
+
+class UpwardMessage(Struct):
+    type_mapping = (
+        ('origin', 'ParachainDispatchOrigin'),
+        ('data', 'Bytes'),
+    )
+
+
+class ParachainDispatchOrigin(Enum):
+    value_list = ['Signed', 'Parachain']
+
+
+class WinningDataEntry(Struct):
+    type_mapping = (
+        ('AccountId', 'AccountId'),
+        ('ParaIdOf', 'ParaIdOf'),
+        ('BalanceOf', 'BalanceOf'),
+    )
@@ -0,0 +1,63 @@
+#  Scale Codec
+#  Copyright (C) 2019  openAware B.V.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Robonomics types, loaded on first lookup (see scalecodec.type_packs)
+
+from scalecodec.types import Struct, U64
+
+
+class Order(Struct):
+    type_string = 'Order<Balance, AccountId>'
+
+    type_mapping = (
+        ('models', 'Vec<u8>'),
+        ('objective', 'Vec<u8>'),
+        ('cost', 'Balance'),
+        ('custodian', 'AccountId'),
+    )
+
+
+class Offer(Struct):
+    type_string = 'Offer<Balance, AccountId>'
+
+    type_mapping = (
+        ('order', 'Order<Balance, AccountId>'),
+        # ('sender', 'AccountId'),
+    )
+
+
+class Demand(Struct):
+    type_string = 'Demand<Balance, AccountId>'
+
+    type_mapping = (
+        ('order', 'Order<Balance, AccountId>'),
+        # ('sender', 'AccountId'), TODO not present in current blocks but referenced in https://github.com/airalab/substrate-node-robonomics/blob/master/res/custom_types.json
+    )
+
+
+class Liability(Struct):
+    type_string = 'Liability<Balance, AccountId>'
+
+    type_mapping = (
+        ('order', 'Order<Balance, AccountId>'),
+        ('promisee', 'AccountId'),
+        # ('promisor', 'AccountId'), TODO not present in current blocks but referenced in https://github.com/airalab/substrate-node-robonomics/blob/master/res/custom_types.json
+        ('result', 'Option<Vec<u8>>'),
+    )
+
+
+class LiabilityIndex(U64):
+    pass
@@ -16,8 +16,9 @@
 # You should have received a copy of the GNU General Public License
 # along with Polkascan. If not, see <http://www.gnu.org/licenses/>.
 
+import struct
 from datetime import datetime
-from scalecodec.base import ScaleType, ScaleBytes
+from scalecodec.base import ScaleType, ScaleBytes, RuntimeConfiguration, DecoderPlan
 
 
 class Compact(ScaleType):
@@ -55,8 +56,18 @@ class Compact(ScaleType):
         self.process_compact_bytes()
 
         if self.sub_type:
+            compact_bytes = self.compact_bytes
+            spec_version_id = self.data.context.spec_version_id
+            sub_type_size = self.get_decoder_plan(self.sub_type, spec_version_id).get_fixed_size(spec_version_id)
 
-            byte_data = self.get_decoder_class(self.sub_type, ScaleBytes(self.compact_bytes)).process()
+            # Reads past the end of the data raise, so the compact bytes are zero padded to the size of the
+            # sub type (same little endian value)
+            if sub_type_size and len(compact_bytes) < sub_type_size:
+                compact_bytes = bytes(compact_bytes).ljust(sub_type_size, b'\x00')
+
+            # The sub type is resolved with the spec version of the decode context
+            compact_data = ScaleBytes(compact_bytes, context=self.data.context)
+            byte_data = self.get_decoder_class(self.sub_type, compact_data).process()
 
             # TODO Assumptions
             if type(byte_data) is int and self.compact_length <= 4:
@@ -121,12 +132,22 @@ class Bytes(ScaleType):
     def process(self):
 
         length = self.process_type('Compact<u32>').value
-        value = self.get_next_bytes(length)
+        self.data.check_bytes(length)
+
+        return self.get_next_text(length)
 
-        try:
-            return value.decode()
-        except UnicodeDecodeError:
-            return value.hex()
+    def encode(self, value):
+        if type(value) is str:
+            if value[0:2] == '0x':
+                value = bytes.fromhex(value[2:])
+            else:
+                value = value.encode()
+
+        self.data = CompactU32(ScaleBytes(bytearray())).encode(len(value))
+        self.data.data += value
+        self.data.length = len(self.data.data)
+
+        return self.data
 
 
 class OptionBytes(ScaleType):
@@ -146,6 +167,7 @@ class String(ScaleType):
 
     def process(self):
         length = self.process_type('Compact<u32>').value
+        self.data.check_bytes(length)
         value = self.get_next_bytes(length)
 
         return value.decode()
@@ -155,11 +177,13 @@ class HexBytes(ScaleType):
 
     def process(self):
         length = self.process_type('Compact<u32>').value
+        self.data.check_bytes(length)
 
-        return '0x{}'.format(self.get_next_bytes(length).hex())
+        return self.get_next_output(length)
 
 
 class U8(ScaleType):
+    fixed_size = 1
 
     def process(self):
         return self.get_next_u8()
@@ -174,6 +198,7 @@ class U8(ScaleType):
 
 
 class U16(ScaleType):
+    fixed_size = 2
 
     def process(self):
         return int.from_bytes(self.get_next_bytes(2), byteorder='little')
@@ -188,6 +213,7 @@ class U16(ScaleType):
 
 
 class U32(ScaleType):
+    fixed_size = 4
 
     def process(self):
         return int.from_bytes(self.get_next_bytes(4), byteorder='little')
@@ -202,6 +228,7 @@ class U32(ScaleType):
 
 
 class U64(ScaleType):
+    fixed_size = 8
 
     def process(self):
         return int(int.from_bytes(self.get_next_bytes(8), byteorder='little'))
@@ -216,72 +243,83 @@ class U64(ScaleType):
 
 
 class U128(ScaleType):
+    fixed_size = 16
 
     def process(self):
         return int(int.from_bytes(self.get_next_bytes(16), byteorder='little'))
 
+    def encode(self, value):
+        if 0 <= value <= 2 ** 128 - 1:
+            self.data = ScaleBytes(bytearray(int(value).to_bytes(16, 'little')))
+        else:
+            raise ValueError('{} out of range for u128'.format(value))
+
+        return self.data
+
 
 class H256(ScaleType):
+    fixed_size = 32
 
     def process(self):
-        return '0x{}'.format(self.get_next_bytes(32).hex())
+        return self.get_next_output(32)
+
+    def encode(self, value):
+        if type(value) is str and value[0:2] == '0x':
+            value = bytes.fromhex(value[2:])
+
+        if type(value) not in (bytes, bytearray) or len(value) != 32:
+            raise ValueError('Value should be 32 bytes or a hex string of 32 bytes')
+
+        self.data = ScaleBytes(bytearray(value))
+
+        return self.data
 
 
 class H512(ScaleType):
+    fixed_size = 64
 
     def process(self):
-        return '0x{}'.format(self.get_next_bytes(64).hex())
+        return self.get_next_output(64)
 
 
 class VecU8Length32(ScaleType):
     type_string = '[u8; 32]'
+    fixed_size = 32
 
     def process(self):
-        return '0x{}'.format(self.get_next_bytes(32).hex())
+        return self.get_next_output(32)
 
 
 class VecU8Length16(ScaleType):
     type_string = '[u8; 16]'
+    fixed_size = 16
 
     def process(self):
-        value = self.get_next_bytes(16)
-        try:
-            return value.decode()
-        except UnicodeDecodeError:
-            return value.hex()
+        return self.get_next_text(16)
 
 
 class VecU8Length8(ScaleType):
     type_string = '[u8; 8]'
+    fixed_size = 8
 
     def process(self):
-        value = self.get_next_bytes(8)
-        try:
-            return value.decode()
-        except UnicodeDecodeError:
-            return value.hex()
+        return self.get_next_text(8)
 
 
 class VecU8Length4(ScaleType):
     type_string = '[u8; 4]'
+    fixed_size = 4
 
     def process(self):
-        value = self.get_next_bytes(4)
-        try:
-            return value.decode()
-        except UnicodeDecodeError:
-            return value.hex()
+        return self.get_next_text(4)
 
 
 class VecU8Length2(ScaleType):
     type_string = '[u8; 2]'
+    fixed_size = 2
 
     def process(self):
-        value = self.get_next_bytes(2)
-        try:
-            return value.decode()
-        except UnicodeDecodeError:
-            return value.hex()
+        return self.get_next_text(2)
 
 
 class Struct(ScaleType):
@@ -293,6 +331,39 @@ class Struct(ScaleType):
 
         super().__init__(data, **kwargs)
 
+    @classmethod
+    def get_fixed_size(cls, type_mapping=None, spec_version_id='default', **kwargs):
+        if cls.process is not Struct.process:
+            return cls.fixed_size
+
+        if type_mapping is None:
+            if cls.type_mapping is None:
+                cls.build_type_mapping()
+            type_mapping = cls.type_mapping
+
+        if type_mapping is None:
+            return None
+
+        field_sizes = cls.get_field_sizes(type_mapping, spec_version_id)
+
+        if None not in field_sizes:
+            return sum(field_sizes)
+
+    @classmethod
+    def get_field_sizes(cls, type_mapping, spec_version_id='default'):
+        # Fixed size per field, None for variable sized fields and fields of unknown types
+        field_sizes = []
+
+        for key, data_type in type_mapping:
+            try:
+                field_plan = cls.get_decoder_plan(data_type, spec_version_id=spec_version_id)
+            except NotImplementedError:
+                field_sizes.append(None)
+            else:
+                field_sizes.append(field_plan.get_fixed_size(spec_version_id))
+
+        return field_sizes
+
     def process(self):
 
         result = {}
@@ -301,6 +372,44 @@ class Struct(ScaleType):
 
         return result
 
+    def encode(self, value):
+        # Value is a dict by field name or a list/tuple in field order
+        if type(value) is dict:
+            value = [value[key] for key, data_type in self.type_mapping]
+
+        if len(value) != len(self.type_mapping):
+            raise ValueError('{} values provided for {} fields'.format(len(value), len(self.type_mapping)))
+
+        spec_version_id = self.data.context.spec_version_id
+
+        field_data = [
+            bytes(self.get_decoder_plan(data_type, spec_version_id=spec_version_id).get_decoder(
+                ScaleBytes(bytearray())
+            ).encode(field_value).data)
+            for (key, data_type), field_value in zip(self.type_mapping, value)
+        ]
+
+        field_sizes = self.get_field_sizes(self.type_mapping, spec_version_id)
+
+        if None in field_sizes:
+            self.data = ScaleBytes(bytearray(b''.join(field_data)))
+            return self.data
+
+        # Fixed size structs are written in a buffer of the final size at the precomputed field offsets
+        data = bytearray(sum(field_sizes))
+        offset = 0
+
+        for (key, data_type), field_size, field_bytes in zip(self.type_mapping, field_sizes, field_data):
+            if len(field_bytes) != field_size:
+                raise ValueError('Encoded "{}" is {} bytes, expected {}'.format(key, len(field_bytes), field_size))
+
+            data[offset:offset + field_size] = field_bytes
+            offset += field_size
+
+        self.data = ScaleBytes(data)
+
+        return self.data
+
 
 class Era(ScaleType):
 
@@ -318,6 +427,7 @@ class EraIndex(U32):
 
 
 class Bool(ScaleType):
+    fixed_size = 1
 
     def process(self):
         return self.get_next_bool()
@@ -371,6 +481,7 @@ class ShardInfo(Struct):
 
 class RelayTypes(ScaleType):
     type_string = '[u8; 1]'
+    fixed_size = 1
 
     def process(self):
         value = int.from_bytes(self.get_next_bytes(1),'little')
@@ -402,18 +513,22 @@ class BoxProposal(ScaleType):
         super().__init__(data, **kwargs)
 
     def process(self):
-        self.call_index = self.get_next_bytes(2).hex()
+        call_module_index, call_index = self.data.get_next_bytes(2)
+        self.call_module, self.call = self.metadata.get_call(call_module_index, call_index)
+
+        self.call_index = self.call.lookup
+        self.raw_value += self.call_index
 
-        self.call_module, self.call = self.metadata.call_index[self.call_index]
+        arg_plans = self.metadata.get_arg_plans(self.call, self.data.context.spec_version_id)
 
-        for arg in self.call.args:
-            arg_type_obj = self.process_type(arg.type, metadata=self.metadata)
+        for arg, arg_plan in zip(self.call.args, arg_plans):
+            value, value_raw = arg_plan.decode_param(self.data, metadata=self.metadata)
 
             self.params.append({
                 'name': arg.name,
                 'type': arg.type,
-                'value': arg_type_obj.serialize(),
-                'valueRaw': arg_type_obj.raw_value
+                'value': value,
+                'valueRaw': value_raw
             })
 
         return {
@@ -461,7 +576,13 @@ class Linkage(Struct):
 
 
 class AccountId(H256):
-    pass
+
+    def process(self):
+        # Account ids recur in many events and extrinsics, they are shared through the intern table of the
+        # context like the raw value that ends up in the valueRaw of call and event arguments
+        value = self.intern(self.get_next_output(32))
+        self.raw_value = self.intern(self.raw_value)
+        return value
 
 
 class AccountIndex(U32):
@@ -512,7 +633,7 @@ class KeyValue(Struct):
 class Signature(ScaleType):
 
     def process(self):
-        return self.get_next_bytes(64).hex()
+        return self.get_next_output(64, hex_prefix='')
 
 
 class AuthoritySignature(ScaleType):
@@ -548,13 +669,45 @@ class Index(U64):
 
 class Vec(ScaleType):
 
-    def __init__(self, data, **kwargs):
+    def __init__(self, data, retain_elements=None, **kwargs):
         self.elements = []
+        # Keep the element decoder objects in self.elements, by default unless the context is values only
+        self.retain_elements = retain_elements
         super().__init__(data, **kwargs)
 
+    def retains_elements(self):
+        if self.retain_elements is None:
+            return not self.data.context.values_only
+
+        return self.retain_elements
+
     def process(self):
         element_count = self.process_type('Compact<u32>').value
 
+        if element_count:
+            element_plan = self.get_decoder_plan(self.sub_type, spec_version_id=self.data.context.spec_version_id)
+
+            # Variable sized elements take at least one byte, zero sized elements are only limited by max_elements
+            element_size = element_plan.get_fixed_size(self.data.context.spec_version_id)
+            self.data.check_elements(element_count, 1 if element_size is None else element_size)
+
+            if not self.retains_elements():
+                if element_plan.decoder_class.process in FixedLengthArray.struct_formats:
+                    struct_format, element_size = FixedLengthArray.struct_formats[element_plan.decoder_class.process]
+
+                    # Integers are unpacked at once, without element decoder objects
+                    return list(struct.unpack(
+                        '<{}{}'.format(element_count, struct_format), self.get_next_bytes(element_count * element_size)
+                    ))
+
+                # Element decoders are discarded as soon as their value is extracted
+                value_decoder = element_plan.get_value_decoder(self.data.context.spec_version_id)
+
+                if value_decoder:
+                    return [value_decoder(self.data) for _ in range(0, element_count)]
+
+                return [element_plan.decode(self.data).value for _ in range(0, element_count)]
+
         result = []
         for _ in range(0, element_count):
             element = self.process_type(self.sub_type)
@@ -564,6 +717,53 @@ class Vec(ScaleType):
         return result
 
 
+class FixedLengthArray(ScaleType):
+
+    element_count = 0
+
+    # Element types of which all values are unpacked at once, by process function (so subclasses that
+    # override process() are decoded per element) with their struct format and size
+    struct_formats = {
+        U16.process: ('H', 2),
+        U32.process: ('I', 4),
+        U64.process: ('Q', 8),
+    }
+
+    def __init__(self, data, element_count=None, **kwargs):
+        if element_count is not None:
+            self.element_count = element_count
+
+        super().__init__(data, **kwargs)
+
+    @classmethod
+    def get_fixed_size(cls, sub_type=None, element_count=None, spec_version_id='default', **kwargs):
+        if sub_type is None:
+            return None
+
+        element_size = cls.get_decoder_plan(sub_type, spec_version_id=spec_version_id).get_fixed_size(spec_version_id)
+
+        if element_size is not None:
+            return element_size * element_count
+
+    def process(self):
+        element_plan = self.get_decoder_plan(self.sub_type, spec_version_id=self.data.context.spec_version_id)
+
+        # Byte arrays are read with a single slice
+        if element_plan.decoder_class is U8:
+            return self.get_next_output(self.element_count)
+
+        if element_plan.decoder_class.process in self.struct_formats:
+            struct_format, element_size = self.struct_formats[element_plan.decoder_class.process]
+            data = self.get_next_bytes(self.element_count * element_size)
+
+            if len(data) != self.element_count * element_size:
+                raise ValueError('Not enough data for [{}; {}]'.format(self.sub_type, self.element_count))
+
+            return list(struct.unpack('<{}{}'.format(self.element_count, struct_format), data))
+
+        return [element_plan.decode(self.data).value for _ in range(0, self.element_count)]
+
+
 # class BalanceTransferExtrinsic(Decoder):
 #
 #     type_string = '(Address,Compact<Balance>)'
@@ -584,7 +784,7 @@ class Address(ScaleType):
         self.account_length = self.get_next_bytes(1)
 
         if self.account_length == b'\xff':
-            self.account_id = self.get_next_bytes(32).hex()
+            self.account_id = self.intern(self.get_next_output(32, hex_prefix=''))
             self.account_length = self.account_length.hex()
 
             return self.account_id
@@ -626,16 +826,62 @@ class Enum(ScaleType):
 
         super().__init__(data, **kwargs)
 
+    @classmethod
+    def get_fixed_size(cls, type_mapping=None, spec_version_id='default', **kwargs):
+        if cls.process is not Enum.process:
+            return cls.fixed_size
+
+        type_mapping = type_mapping or cls.type_mapping
+
+        if not type_mapping:
+            # Index only
+            return 1
+
+        # Fixed when all variants have the same fixed size
+        variant_sizes = set(Struct.get_field_sizes(type_mapping, spec_version_id))
+
+        if len(variant_sizes) == 1 and None not in variant_sizes:
+            return 1 + variant_sizes.pop()
+
+    @classmethod
+    def get_variant_decoders(cls, type_mapping, spec_version_id='default'):
+        # Variant name and decoder plan per index, built once per type mapping and spec version
+        runtime_config = RuntimeConfiguration()
+
+        cache_key = (str(spec_version_id), id(type_mapping))
+        variant_decoders = runtime_config.variant_decoders.get(cache_key)
+
+        if variant_decoders is None or variant_decoders[0] is not type_mapping:
+            decoders = []
+
+            for name, data_type in type_mapping:
+                try:
+                    decoders.append((name, cls.get_decoder_plan(data_type, spec_version_id=spec_version_id)))
+                except NotImplementedError:
+                    # Unknown types fail when the variant is decoded
+                    decoders.append((name, DecoderPlan(data_type, None)))
+
+            variant_decoders = (type_mapping, decoders)
+            runtime_config.variant_decoders[cache_key] = variant_decoders
+
+        return variant_decoders[1]
+
     def process(self):
-        self.index = int(self.get_next_bytes(1).hex())
+        index_byte = self.get_next_bytes(1)
+
+        if not index_byte:
+            raise ValueError('No data left for Enum index')
+
+        self.index = index_byte[0]
 
         if self.type_mapping:
-            try:
-                enum_type_mapping = self.type_mapping[self.index]
-                return self.process_type('Struct', type_mapping=[enum_type_mapping]).value
+            variant_decoders = self.get_variant_decoders(self.type_mapping, self.data.context.spec_version_id)
 
-            except IndexError:
+            if self.index >= len(variant_decoders):
                 raise ValueError("Index '{}' not present in Enum type mapping".format(self.index))
+
+            name, variant_plan = variant_decoders[self.index]
+            return {name: variant_plan.decode(self.data, metadata=self.metadata).value}
         else:
             try:
                 return self.value_list[self.index]
@@ -706,6 +952,7 @@ class VoteThreshold(Enum):
 
 
 class Null(ScaleType):
+    fixed_size = 0
 
     def process(self):
         return None
@@ -873,15 +1120,6 @@ class SessionKeysSubstrate(Struct):
     )
 
 
-class SessionKeysPolkadot(Struct):
-    type_mapping = (
-        ('grandpa', 'AccountId'),
-        ('babe', 'AccountId'),
-        ('im_online', 'AccountId'),
-        ('parachains', 'AccountId'),
-    )
-
-
 class LegacyKeys(Struct):
     type_mapping = (
         ('grandpa', 'AccountId'),
@@ -889,12 +1127,6 @@ class LegacyKeys(Struct):
     )
 
 
-class EdgewareKeys(Struct):
-    type_mapping = (
-        ('grandpa', 'AccountId'),
-    )
-
-
 class QueuedKeys(Struct):
     type_string = '(ValidatorId, Keys)'
 
@@ -913,24 +1145,17 @@ class LegacyQueuedKeys(Struct):
     )
 
 
-class EdgewareQueuedKeys(Struct):
-    type_string = '(ValidatorId, EdgewareKeys)'
-
-    type_mapping = (
-        ('validator', 'ValidatorId'),
-        ('keys', 'EdgewareKeys'),
-    )
-
-
 class VecQueuedKeys(Vec):
     type_string = 'Vec<(ValidatorId, Keys)>'
 
     def process(self):
         element_count = self.process_type('Compact<u32>').value
+        self.data.check_elements(element_count, 1)
         result = []
         for _ in range(0, element_count):
             element = self.process_type('QueuedKeys')
-            self.elements.append(element)
+            if self.retains_elements():
+                self.elements.append(element)
             result.append(element.value)
 
         return result
@@ -939,15 +1164,13 @@ class VecQueuedKeys(Vec):
 class EthereumAddress(ScaleType):
 
     def process(self):
-        value = self.get_next_bytes(20)
-        return value.hex()
+        return self.get_next_output(20, hex_prefix='')
 
 
 class EcdsaSignature(ScaleType):
 
     def process(self):
-        value = self.get_next_bytes(65)
-        return value.hex()
+        return self.get_next_output(65, hex_prefix='')
 
 
 class BalanceLock(Struct):
@@ -965,51 +1188,6 @@ class WithdrawReasons(Enum):
     value_list = ['TransactionPayment', 'Transfer', 'Reserve', 'Fee']
 
 
-class Bidder(Enum):
-    type_string = 'Bidder<AccountId, ParaIdOf>'
-
-    value_list = ['NewBidder', 'ParaId']
-
-
-class BlockAttestations(Struct):
-    type_mapping = (
-        ('receipt', 'CandidateReceipt'),
-        ('valid', 'Vec<AccountId>'),
-        ('invalid', 'Vec<AccountId>'),
-    )
-
-
-class IncludedBlocks(Struct):
-    type_mapping = (
-        ('actualNumber', 'BlockNumber'),
-        ('session', 'SessionIndex'),
-        ('randomSeed', 'H256'),
-        ('activeParachains', 'Vec<ParaId>'),
-        ('paraBlocks', 'Vec<Hash>'),
-    )
-
-
-class CandidateReceipt(Struct):
-    type_mapping = (
-        ('parachainIndex', 'ParaId'),
-        ('collator', 'AccountId'),
-        ('signature', 'CollatorSignature'),
-        ('headData', 'HeadData'),
-        ('balanceUploads', 'Vec<BalanceUpload>'),
-        ('egressQueueRoots', 'Vec<EgressQueueRoot>'),
-        ('fees', 'u64'),
-        ('blockDataHash', 'Hash'),
-    )
-
-
-class CollatorSignature(Signature):
-    pass
-
-
-class HeadData(Bytes):
-    pass
-
-
 class Conviction(Enum):
     CONVICTION_MASK = 0b01111111
     DEFAULT_CONVICTION = 0b00000000
@@ -1032,17 +1210,6 @@ class SlashJournalEntry(Struct):
     )
 
 
-class UpwardMessage(Struct):
-    type_mapping = (
-        ('origin', 'ParachainDispatchOrigin'),
-        ('data', 'Bytes'),
-    )
-
-
-class ParachainDispatchOrigin(Enum):
-    value_list = ['Signed', 'Parachain']
-
-
 class StoredState(Enum):
     value_list = ['Live', 'PendingPause', 'Paused', 'PendingResume']
 
@@ -1058,406 +1225,3 @@ class Votes(Struct):
         ('ayes', 'Vec<AccountId>'),
         ('nays', 'Vec<AccountId>'),
     )
-
-
-class WinningDataEntry(Struct):
-    type_mapping = (
-        ('AccountId', 'AccountId'),
-        ('ParaIdOf', 'ParaIdOf'),
-        ('BalanceOf', 'BalanceOf'),
-    )
-
-
-# Edgeware types
-# TODO move to RuntimeConfiguration per network
-
-
-class IdentityType(Bytes):
-    pass
-
-
-class VoteType(Enum):
-    type_string = 'voting::VoteType'
-
-    value_list = ['Binary', 'MultiOption']
-
-
-class VoteOutcome(ScaleType):
-
-    def process(self):
-        return list(self.get_next_bytes(32))
-
-
-class Identity(Bytes):
-    pass
-
-
-class ProposalTitle(Bytes):
-    pass
-
-
-class ProposalContents(Bytes):
-    pass
-
-
-class ProposalStage(Enum):
-    value_list = ['PreVoting', 'Voting', 'Completed']
-
-
-class ProposalCategory(Enum):
-    value_list = ['Signaling']
-
-
-class VoteStage(Enum):
-    value_list = ['PreVoting', 'Commit', 'Voting', 'Completed']
-
-
-class TallyType(Enum):
-    type_string = 'voting::TallyType'
-
-    value_list = ['OnePerson', 'OneCoin']
-
-
-class Attestation(Bytes):
-    pass
-
-
-# Joystream types
-# TODO move to RuntimeConfiguration per network
-
-class ContentId(H256):
-    pass
-
-
-class MemberId(U64):
-    pass
-
-
-class PaidTermId(U64):
-    pass
-
-
-class SubscriptionId(U64):
-    pass
-
-
-class SchemaId(U64):
-    pass
-
-
-class DownloadSessionId(U64):
-    pass
-
-
-class UserInfo(Struct):
-    type_mapping = (
-        ('handle', 'Option<Vec<u8>>'),
-        ('avatar_uri', 'Option<Vec<u8>>'),
-        ('about', 'Option<Vec<u8>>')
-    )
-
-
-class Role(Enum):
-    value_list = ['Storage']
-
-
-class ContentVisibility(Enum):
-    value_list = ['Draft', 'Public']
-
-
-class ContentMetadata(Struct):
-    type_mapping = (
-        ('owner', 'AccountId'),
-        ('added_at', 'BlockAndTime'),
-        ('children_ids', 'Vec<ContentId>'),
-        ('visibility', 'ContentVisibility'),
-        ('schema', 'SchemaId'),
-        ('json', 'Vec<u8>'),
-
-    )
-
-
-class ContentMetadataUpdate(Struct):
-    type_mapping = (
-        ('children_ids', 'Option<Vec<ContentId>>'),
-        ('visibility', 'Option<ContentVisibility>'),
-        ('schema', 'Option<SchemaId>'),
-        ('json', 'Option<Vec<u8>>')
-    )
-
-
-class LiaisonJudgement(Enum):
-    value_list = ['Pending', 'Accepted', 'Rejected']
-
-
-class BlockAndTime(Struct):
-    type_mapping = (
-        ('block', 'BlockNumber'),
-        ('time', 'Moment')
-    )
-
-
-class DataObjectTypeId(U64):
-    type_string = "<T as DOTRTrait>::DataObjectTypeId"
-
-
-class DataObject(Struct):
-    type_mapping = (
-        ('owner', 'AccountId'),
-        ('added_at', 'BlockAndTime'),
-        ('type_id', 'DataObjectTypeId'),
-        ('size', 'u64'),
-        ('liaison', 'AccountId'),
-        ('liaison_judgement', 'LiaisonJudgement'),
-        ('ipfs_content_id', 'Bytes'),
-    )
-
-
-class DataObjectStorageRelationshipId(U64):
-    pass
-
-
-class IPNSIdentity(Bytes):
-    pass
-
-
-class AccountInfo(Struct):
-    type_string = 'AccountInfo<BlockNumber>'
-
-    type_mapping = (
-        ('identity', 'IPNSIdentity'),
-        ('expires_at', 'BlockNumber'),
-    )
-
-
-class DownloadState(Enum):
-    value_list = ['Started', 'Ended']
-
-
-class DownloadSession(Struct):
-    type_mapping = (
-        ('content_id', 'ContentId'),
-        ('consumer', 'AccountId'),
-        ('distributor', 'AccountId'),
-        ('initiated_at_block', 'BlockNumber'),
-        ('initiated_at_time', 'BlockNumber'),
-        ('state', 'DownloadState'),
-        ('transmitted_bytes', 'u64'),
-    )
-
-
-class Url(Bytes):
-    pass
-
-
-class EntryMethod(Enum):
-    value_list = ['Paid', 'Screening']
-
-
-class Profile(Struct):
-    type_mapping = (
-        ('id', 'MemberId'),
-        ('handle', 'Bytes'),
-        ('avatar_uri', 'Bytes'),
-        ('about', 'Bytes'),
-        ('registered_at_block', 'BlockNumber'),
-        ('registered_at_time', 'Moment'),
-        ('entry', 'EntryMethod'),
-        ('suspended', 'bool'),
-        ('subscription', 'Option<SubscriptionId>'),
-    )
-
-
-class PaidMembershipTerms(Struct):
-    type_mapping = (
-        ('id', 'PaidTermId'),
-        ('fee', 'BalanceOf'),
-        ('text', 'Bytes'),
-    )
-
-
-class ThreadId(U64):
-    pass
-
-
-class InputValidationLengthConstraint(Struct):
-    type_mapping = (
-        ('min', 'u16'),
-        ('max_min_diff', 'u16'),
-    )
-
-
-class BlockchainTimestamp(Struct):
-    type_string = 'BlockchainTimestamp<BlockNumber, Moment>'
-
-    type_mapping = (
-        ('block', 'BlockNumber'),
-        ('time', 'Moment'),
-    )
-
-
-class ModerationAction(Struct):
-    type_mapping = (
-        ('moderated_at', 'BlockchainTimestamp<BlockNumber, Moment>'),
-        ('moderator_id', 'AccountId'),
-        ('rationale', 'Vec<u8>'),
-    )
-
-
-class PostId(U64):
-    pass
-
-
-class PostTextChange(Struct):
-    type_string = 'PostTextChange<BlockNumber, Moment>'
-
-    type_mapping = (
-        ('expired_at', 'BlockchainTimestamp<BlockNumber, Moment>'),
-        ('text', 'Vec<u8>'),
-    )
-
-
-class Post(Struct):
-    type_string = 'Post<BlockNumber, Moment, AccountId>'
-
-    type_mapping = (
-        ('id', 'PostId'),
-        ('thread_id', 'ThreadId'),
-        ('nr_in_thread', 'u32'),
-        ('current_text', 'Vec<u8>'),
-        ('moderation', 'Option<ModerationAction<BlockNumber, Moment, AccountId>>'),
-        ('text_change_history', 'Vec<PostTextChange<BlockNumber, Moment>>'),
-        ('created_at', 'BlockchainTimestamp<BlockNumber, Moment>'),
-        ('author_id', 'AccountId'),
-
-    )
-
-
-class Thread(Struct):
-    type_string = 'Thread<BlockNumber, Moment, AccountId>'
-
-    type_mapping = (
-        ('id', 'ThreadId'),
-        ('title', 'Vec<u8>'),
-        ('category_id', 'CategoryId'),
-        ('nr_in_category', 'u32'),
-        ('moderation', 'Option<ModerationAction<BlockNumber, Moment, AccountId>>'),
-        ('num_unmoderated_posts', 'u32'),
-        ('num_moderated_posts', 'u32'),
-        ('author_id', 'AccountId'),
-        ('created_at', 'BlockchainTimestamp<BlockNumber, Moment>'),
-        ('author_id', 'AccountId'),
-    )
-
-
-class CategoryId(U64):
-    pass
-
-
-class ChildPositionInParentCategory(Struct):
-    type_mapping = (
-        ('parent_id', 'CategoryId'),
-        ('child_nr_in_parent_category', 'u32'),
-    )
-
-
-class Category(Struct):
-    type_string = 'Category<BlockNumber, Moment, AccountId>'
-
-    type_mapping = (
-        ('id', 'CategoryId'),
-        ('title', 'Vec<u8>'),
-        ('description', 'Vec<u8>'),
-        ('created_at', 'BlockchainTimestamp<BlockNumber, Moment>'),
-        ('deleted', 'bool'),
-        ('archived', 'bool'),
-        ('num_direct_subcategories', 'u32'),
-        ('num_direct_unmoderated_threads', 'u32'),
-        ('num_direct_moderated_threads', 'u32'),
-        ('position_in_parent_category', 'Option<ChildPositionInParentCategory>'),
-        ('moderator_id', 'AccountId'),
-    )
-
-
-class ProposalStatus(Enum):
-    value_list = ['Active', 'Cancelled', 'Expired', 'Approved', 'Rejected', 'Slashed']
-
-
-class VoteKind(Enum):
-    value_list = ['Abstain', 'Approve', 'Reject', 'Slash']
-
-
-class RuntimeUpgradeProposal(Struct):
-    type_string = 'RuntimeUpgradeProposal<AccountId, Balance, BlockNumber, Hash>'
-
-    type_mapping = (
-        ('id', 'u32'),
-        ('proposer', 'AccountId'),
-        ('stake', 'Balance'),
-        ('name', 'Vec<u8>'),
-        ('description', 'Vec<u8>'),
-        ('wasm_hash', 'Hash'),
-        ('proposed_at', 'BlockNumber'),
-        ('status', 'ProposalStatus'),
-    )
-
-
-class TallyResult(Struct):
-    type_string = 'TallyResult<BlockNumber>'
-
-    type_mapping = (
-        ('proposal_id', 'u32'),
-        ('abstentions', 'u32'),
-        ('approvals', 'u32'),
-        ('rejections', 'u32'),
-        ('slashes', 'u32'),
-        ('status', 'ProposalStatus'),
-        ('finalized_at', 'BlockNumber'),
-    )
-
-
-# Robonomics types
-# TODO move to RuntimeConfiguration per network
-
-class Order(Struct):
-    type_string = 'Order<Balance, AccountId>'
-
-    type_mapping = (
-        ('models', 'Vec<u8>'),
-        ('objective', 'Vec<u8>'),
-        ('cost', 'Balance'),
-        ('custodian', 'AccountId'),
-    )
-
-
-class Offer(Struct):
-    type_string = 'Offer<Balance, AccountId>'
-
-    type_mapping = (
-        ('order', 'Order<Balance, AccountId>'),
-        # ('sender', 'AccountId'),
-    )
-
-
-class Demand(Struct):
-    type_string = 'Demand<Balance, AccountId>'
-
-    type_mapping = (
-        ('order', 'Order<Balance, AccountId>'),
-        # ('sender', 'AccountId'), TODO not present in current blocks but referenced in https://github.com/airalab/substrate-node-robonomics/blob/master/res/custom_types.json
-    )
-
-
-class Liability(Struct):
-    type_string = 'Liability<Balance, AccountId>'
-
-    type_mapping = (
-        ('order', 'Order<Balance, AccountId>'),
-        ('promisee', 'AccountId'),
-        # ('promisor', 'AccountId'), TODO not present in current blocks but referenced in https://github.com/airalab/substrate-node-robonomics/blob/master/res/custom_types.json
-        ('result', 'Option<Vec<u8>>'),
-    )
-
-
-class LiabilityIndex(U64):
-    pass
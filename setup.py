@@ -129,7 +129,7 @@ setup(
     #   py_modules=["my_module"],
     #
     #packages=find_packages(exclude=['contrib', 'docs', 'tests', 'test']),  # Required
-    packages=['scalecodec'],  # Required
+    packages=['scalecodec', 'scalecodec.type_packs'],  # Required
 
     # Specify which Python versions you support. In contrast to the
     # 'Programming Language' classifiers above, 'pip install' will check this
@@ -159,6 +159,8 @@ setup(
     extras_require={  # Optional
         #'dev': ['check-manifest'],
         'test': ['coverage', 'pytest'],
+        # Native twox storage hashing, a pure Python fallback is used otherwise
+        'xxhash': ['xxhash'],
     },
 
     # If there are data files included in your packages that need to be
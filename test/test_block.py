@@ -0,0 +1,160 @@
+# Python SCALE Codec Library
+#
+# Copyright 2018-2019 openAware BV (NL).
+# This file is part of Polkascan.
+#
+# Polkascan is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Polkascan is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Polkascan. If not, see <http://www.gnu.org/licenses/>.
+import unittest
+
+from scalecodec.base import ScaleBytes, DecodeContext
+from scalecodec.block import Header, LogDigest, EventsDecoder, EventRecord, ExtrinsicsDecoder
+from scalecodec.metadata import MetadataDecoder
+
+from test.fixtures import header_hex, metadata_v4_hex, events_hex, extrinsic_hex
+
+
+class TestHeader(unittest.TestCase):
+
+    def test_decode_header(self):
+        header = Header(ScaleBytes(header_hex))
+        header.decode()
+
+        self.assertEqual(header.value['parent_hash'], '0x' + '11' * 32)
+        self.assertEqual(header.value['number'], 59)
+        self.assertEqual(header.value['state_root'], '0x' + '22' * 32)
+        self.assertEqual(header.value['extrinsics_root'], '0x' + '33' * 32)
+        self.assertEqual(header.data.offset, header.data.length)
+
+    def test_header_hashes_are_views(self):
+        header = Header(ScaleBytes(header_hex, context=DecodeContext(byte_output='memoryview')))
+        header.decode()
+
+        self.assertIsInstance(header.parent_hash, memoryview)
+        self.assertEqual(header.parent_hash.obj, header.data.data)
+        self.assertIs(header.value['parent_hash'], header.parent_hash)
+
+    def test_header_kwargs(self):
+        metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v4_hex))
+        metadata_decoder.decode()
+
+        header = Header(ScaleBytes(header_hex), metadata=metadata_decoder)
+        header.decode()
+
+        self.assertIs(header.metadata, metadata_decoder)
+        self.assertEqual(header.value['number'], 59)
+
+    def test_header_byte_output(self):
+        header = Header(ScaleBytes(header_hex, context=DecodeContext(byte_output='bytes')))
+        header.decode()
+
+        self.assertEqual(header.value['parent_hash'], b'\x11' * 32)
+        self.assertEqual(header.value['state_root'], b'\x22' * 32)
+        self.assertEqual(header.value['extrinsics_root'], b'\x33' * 32)
+
+    def test_header_digest_logs(self):
+        header = Header(ScaleBytes(header_hex))
+        header.decode()
+
+        logs = header.value['digest']['logs']
+
+        self.assertEqual(len(logs), 4)
+        self.assertEqual(logs[0], {'type': 'ShardInfo<ShardNum>', 'value': {'num': 3, 'count': 4}})
+        self.assertEqual(logs[1]['type'], 'Crfg')
+        self.assertEqual(len(logs[1]['value']), 6)
+        self.assertEqual(logs[2], {'type': 'Finalitytracker', 'value': 31057})
+        self.assertEqual(logs[3]['value']['engine'], 'Yee!')
+
+    def test_decode_batch(self):
+        headers = Header.decode_batch(
+            [header_hex, header_hex[2:], bytes.fromhex(header_hex[2:]), ScaleBytes(header_hex)]
+        )
+
+        self.assertEqual(len(headers), 4)
+        self.assertEqual(headers[0], headers[1])
+        self.assertEqual(headers[0], headers[2])
+        self.assertEqual(headers[0], headers[3])
+
+    def test_log_digest_other_unknown(self):
+        log_digest = LogDigest(ScaleBytes('0x0008ffff'))
+        log_digest.decode()
+
+        self.assertEqual(log_digest.value, {'type': 'Other', 'value': '0xffff'})
+        self.assertEqual(log_digest.data.offset, 4)
+
+
+class TestEventsDecoder(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v4_hex))
+        cls.metadata_decoder.decode()
+
+    def test_iter_events(self):
+        events_decoder = EventsDecoder(ScaleBytes(events_hex), metadata=self.metadata_decoder)
+        events = list(events_decoder.iter_events())
+
+        decoded_events = EventsDecoder(ScaleBytes(events_hex), metadata=self.metadata_decoder).decode()
+
+        self.assertEqual(events, decoded_events)
+        self.assertEqual(events_decoder.elements, [])
+        self.assertEqual(events_decoder.data.offset, events_decoder.data.length)
+
+    def test_iter_events_stop_early(self):
+        events_decoder = EventsDecoder(ScaleBytes(events_hex), metadata=self.metadata_decoder)
+
+        for event in events_decoder.iter_events():
+            if event['extrinsic_idx'] == 5:
+                break
+
+        self.assertEqual(event['event_id'], 'Transferred')
+        self.assertEqual(event['event_idx'], 5)
+        self.assertLess(events_decoder.data.offset, events_decoder.data.length)
+
+    def test_values_only(self):
+        events_decoder = EventsDecoder(
+            ScaleBytes(events_hex, context=DecodeContext(values_only=True)), metadata=self.metadata_decoder
+        )
+
+        self.assertEqual(
+            events_decoder.decode(), EventsDecoder(ScaleBytes(events_hex), metadata=self.metadata_decoder).decode()
+        )
+        self.assertEqual(events_decoder.elements, [])
+
+    def test_event_idx(self):
+        events = EventsDecoder(ScaleBytes(events_hex), metadata=self.metadata_decoder).decode()
+        self.assertEqual([event['event_idx'] for event in events], list(range(len(events))))
+
+        # Only set by EventsDecoder, a single event record is decoded as before
+        event_record = EventRecord(ScaleBytes('0x' + events_hex[4:]), metadata=self.metadata_decoder)
+        self.assertNotIn('event_idx', event_record.decode(check_remaining=False))
+
+
+class TestExtrinsicsDecoder(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v4_hex))
+        cls.metadata_decoder.decode()
+
+    def test_call_index(self):
+        extrinsic = ExtrinsicsDecoder(ScaleBytes(extrinsic_hex), metadata=self.metadata_decoder)
+        extrinsic.decode()
+
+        self.assertEqual(extrinsic.value['call_code'], '0801')
+        self.assertEqual(extrinsic.value['valueRaw'], '810801')
+        self.assertIs(extrinsic.call, self.metadata_decoder.call_index['0801'][1])
+
+    def test_unknown_call_index(self):
+        extrinsic = ExtrinsicsDecoder(ScaleBytes('0x011f00'), metadata=self.metadata_decoder)
+        self.assertRaises(ValueError, extrinsic.decode)
@@ -0,0 +1,117 @@
+# Python SCALE Codec Library
+#
+# Copyright 2018-2019 openAware BV (NL).
+# This file is part of Polkascan.
+#
+# Polkascan is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Polkascan is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Polkascan. If not, see <http://www.gnu.org/licenses/>.
+import os
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from scalecodec.base import ScaleBytes
+from scalecodec.block import ExtrinsicsDecoder, EventsDecoder
+from scalecodec.cache import MetadataCache
+from scalecodec.metadata import MetadataDecoder
+
+from test.fixtures import metadata_v4_hex, extrinsic_hex, events_hex
+from test import test_metadata
+
+
+class TestMetadataCache(unittest.TestCase):
+
+    legacy_metadata = test_metadata.TestMetadata
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = MetadataCache(self.directory)
+        self.metadata_hash = MetadataCache.get_metadata_hash(metadata_v4_hex)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_metadata_hash(self):
+        self.assertEqual(self.metadata_hash, MetadataCache.get_metadata_hash(bytes.fromhex(metadata_v4_hex[2:])))
+        self.assertNotEqual(self.metadata_hash, MetadataCache.get_metadata_hash(self.legacy_metadata.metadata_v3_hex))
+
+    def test_cache_miss_stores_entry(self):
+        self.assertIsNone(self.cache.load(self.metadata_hash))
+
+        metadata_decoder = self.cache.get(metadata_v4_hex)
+
+        self.assertEqual(metadata_decoder.version.value, 'MetadataV4Decoder')
+        self.assertTrue(os.path.exists(self.cache.get_path(self.metadata_hash)))
+
+    def test_cached_runtime_equals_decoded(self):
+        metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v4_hex))
+        metadata_decoder.decode()
+
+        self.cache.store(self.metadata_hash, metadata_decoder)
+        cached_metadata = self.cache.load(self.metadata_hash)
+
+        self.assertEqual(cached_metadata.version.index, 4)
+        self.assertEqual(cached_metadata.get_normalized(), metadata_decoder.get_normalized())
+
+        for lookup, (module, call) in metadata_decoder.call_index.items():
+            cached_module, cached_call = cached_metadata.call_index[lookup]
+            self.assertEqual(cached_module.get_identifier(), module.get_identifier())
+            self.assertEqual(cached_call.lookup, lookup)
+            self.assertEqual(cached_call.value['args'], call.value['args'])
+
+    def test_decode_with_cached_runtime(self):
+        self.cache.get(metadata_v4_hex)
+        cached_metadata = self.cache.get(metadata_v4_hex)
+
+        extrinsic = ExtrinsicsDecoder(ScaleBytes(extrinsic_hex), metadata=cached_metadata).decode()
+        self.assertEqual(extrinsic['call_module'], 'assets')
+        self.assertEqual(extrinsic['params'][3]['value'], 1000)
+
+        events = EventsDecoder(ScaleBytes(events_hex), metadata=cached_metadata).decode()
+        self.assertEqual(events[5]['event_id'], 'Transferred')
+
+    def test_spec_version(self):
+        self.assertEqual(self.cache.get(metadata_v4_hex, spec_version_id=5).spec_version_id, '5')
+        self.assertEqual(self.cache.get(metadata_v4_hex, spec_version_id=6).spec_version_id, '6')
+        self.assertEqual(self.cache.get(metadata_v4_hex).spec_version_id, 'default')
+
+    def test_older_metadata_versions(self):
+        for metadata_hex in (
+                self.legacy_metadata.metadata_v1_hex,
+                self.legacy_metadata.metadata_v2_hex,
+                self.legacy_metadata.metadata_v3_hex):
+            metadata_decoder = self.cache.get(metadata_hex)
+            cached_metadata = self.cache.get(metadata_hex)
+            self.assertEqual(cached_metadata.get_normalized(), metadata_decoder.get_normalized())
+
+    def test_corrupt_entry_is_ignored(self):
+        with open(self.cache.get_path(self.metadata_hash), 'w') as cache_file:
+            cache_file.write('{"format_version": 1, "meta')
+
+        self.assertIsNone(self.cache.load(self.metadata_hash))
+        self.assertEqual(self.cache.get(metadata_v4_hex).version.index, 4)
+        self.assertIsNotNone(self.cache.load(self.metadata_hash))
+
+    def test_concurrent_writers(self):
+        metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v4_hex))
+        metadata_decoder.decode()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for future in [
+                executor.submit(self.cache.store, self.metadata_hash, metadata_decoder) for _ in range(0, 16)
+            ]:
+                future.result()
+
+        self.assertEqual(os.listdir(self.directory), ['{}.json'.format(self.metadata_hash)])
+        self.assertIsNotNone(self.cache.load(self.metadata_hash))
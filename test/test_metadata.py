@@ -16,10 +16,13 @@
 # You should have received a copy of the GNU General Public License
 # along with Polkascan. If not, see <http://www.gnu.org/licenses/>.
 
+import json
 import unittest
 
-from scalecodec.base import ScaleBytes, RuntimeConfiguration, ScaleDecoder
-from scalecodec.metadata import MetadataDecoder
+from scalecodec.base import ScaleBytes, RuntimeConfiguration, ScaleDecoder, DecodeContext
+from scalecodec.block import EventRecord
+from scalecodec.metadata import MetadataDecoder, Module, Call, Event, StorageEntry, Constant
+from test.fixtures import metadata_v4_hex, metadata_v5_hex, metadata_v7_hex
 
 
 class TestMetadata(unittest.TestCase):
@@ -85,3 +88,366 @@ class TestMetadata(unittest.TestCase):
                         self.assertIsNotNone(decoder_class, msg='{} is not supported by metadata'.format(arg.type))
 
 
+
+
+class TestMetadataIndexTables(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.metadata_decoder = MetadataDecoder(ScaleBytes(TestMetadata.metadata_v3_hex))
+        cls.metadata_decoder.decode()
+
+    def test_call_index_table(self):
+        for lookup, call in self.metadata_decoder.call_index.items():
+            self.assertIs(self.metadata_decoder.call_index_table[int(lookup[0:2], 16)][int(lookup[2:4], 16)], call)
+            self.assertIs(self.metadata_decoder.get_call(int(lookup[0:2], 16), int(lookup[2:4], 16)), call)
+
+    def test_event_index_table(self):
+        for lookup, event in self.metadata_decoder.event_index.items():
+            self.assertIs(self.metadata_decoder.get_event(int(lookup[0:2], 16), int(lookup[2:4], 16)), event)
+
+    def test_unknown_index(self):
+        self.assertRaises(ValueError, self.metadata_decoder.get_call, 0xff, 0)
+        self.assertRaises(ValueError, self.metadata_decoder.get_event, 0, 0xff)
+
+    def test_interned_names(self):
+        other_decoder = MetadataDecoder(ScaleBytes(TestMetadata.metadata_v3_hex))
+        other_decoder.decode()
+
+        for lookup, (module, call) in self.metadata_decoder.call_index.items():
+            other_module, other_call = other_decoder.call_index[lookup]
+            self.assertIs(module.name, other_module.name)
+            self.assertIs(call.name, other_call.name)
+            self.assertIs(call.args[0].type if call.args else None, other_call.args[0].type if call.args else None)
+
+        for lookup, (module, event) in self.metadata_decoder.event_index.items():
+            self.assertIs(event.name, other_decoder.event_index[lookup][1].name)
+
+
+class TestMetadataDecoderPlans(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.metadata_decoder = MetadataDecoder(ScaleBytes(TestMetadata.metadata_v3_hex))
+        cls.metadata_decoder.decode()
+
+    def test_call_arg_plans(self):
+        for module, call in self.metadata_decoder.call_index.values():
+            self.assertEqual(len(call.arg_plans), len(call.args))
+
+            for arg, arg_plan in zip(call.args, call.arg_plans):
+                self.assertEqual(arg_plan.type_string, ScaleDecoder.convert_type(arg.type))
+
+    def test_event_arg_plans(self):
+        for module, event in self.metadata_decoder.event_index.values():
+            self.assertEqual(len(event.arg_plans), len(event.args))
+
+    def test_unsupported_type_plan(self):
+        decoder_plan = MetadataDecoder.get_arg_decoder_plan('UnknownType123')
+        self.assertRaises(NotImplementedError, decoder_plan.decode, ScaleBytes('0x00'))
+
+
+class TestMetadataSpecVersion(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        RuntimeConfiguration().add_type_registry_range(1, 10, {'Balance': 'U64'})
+
+        cls.metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v4_hex))
+        cls.metadata_decoder.decode()
+
+    @classmethod
+    def tearDownClass(cls):
+        RuntimeConfiguration().clear_type_registry_ranges()
+
+    def decode_transfer_event(self, balance_hex, spec_version_id):
+        # balances.Transfer(AccountId, AccountId, Balance, Balance)
+        data = '0x00' + '01000000' + '0302' + '11' * 32 + '22' * 32 + balance_hex * 2
+        event_record = EventRecord(
+            ScaleBytes(data, context=DecodeContext(spec_version_id=spec_version_id)), metadata=self.metadata_decoder
+        )
+        event_record.decode()
+        return [param['value'] for param in event_record.value['params']][2:]
+
+    def test_event_args(self):
+        self.assertEqual(self.decode_transfer_event('0500000000000000', 5), [5, 5])
+        self.assertEqual(self.decode_transfer_event('05000000000000000000000000000000', 'default'), [5, 5])
+        self.assertEqual(self.decode_transfer_event('05000000000000000000000000000000', 11), [5, 5])
+
+    def test_compact_sub_type(self):
+        # Compact<Balance> resolves Balance with the spec version of the decode context
+        obj = ScaleDecoder.get_decoder_plan('Compact<Balance>', spec_version_id=5).decode(
+            ScaleBytes('0x14', context=DecodeContext(spec_version_id=5))
+        )
+        self.assertEqual(obj.value, 5)
+
+    def test_metadata_spec_version(self):
+        metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v4_hex), spec_version_id=5)
+        metadata_decoder.decode()
+
+        module, event = metadata_decoder.event_index['0302']
+        self.assertEqual(event.arg_plans[2].decoder_class.__name__, 'U64')
+        self.assertIs(metadata_decoder.get_arg_plans(event, 5), event.arg_plans)
+
+    def test_registry_update(self):
+        # Plans of an already decoded runtime are compiled again after the type registry changed
+        runtime_config = RuntimeConfiguration()
+        balance = runtime_config.type_registry['default']['balance']
+
+        try:
+            runtime_config.update_type_registry({'default': {'Balance': 'u64'}})
+            self.assertEqual(self.decode_transfer_event('0500000000000000', 'default'), [5, 5])
+        finally:
+            runtime_config.override_type_registry('Balance', balance)
+
+        self.assertEqual(self.decode_transfer_event('05000000000000000000000000000000', 'default'), [5, 5])
+
+    def test_compile_on_first_use(self):
+        metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v4_hex), compile_plans=False)
+        metadata_decoder.decode()
+
+        self.assertIsNone(metadata_decoder.decoder_plans_key)
+
+        event_record = EventRecord(
+            ScaleBytes('0x00' + '01000000' + '0300' + '11' * 32 + '05' + '00' * 15), metadata=metadata_decoder
+        )
+        event_record.decode()
+        self.assertEqual(event_record.value['params'][1]['value'], 5)
+
+
+class TestMetadataModel(unittest.TestCase):
+
+    def test_model_v3(self):
+        metadata_decoder = MetadataDecoder(ScaleBytes(TestMetadata.metadata_v3_hex))
+        metadata_decoder.decode()
+
+        for module in metadata_decoder.metadata.modules:
+            self.assertIsInstance(module, Module)
+            self.assertFalse(hasattr(module, '__dict__'))
+
+            for call in module.calls or []:
+                self.assertIsInstance(call, Call)
+
+            for event in module.events or []:
+                self.assertIsInstance(event, Event)
+
+            for entry in module.storage or []:
+                self.assertIsInstance(entry, StorageEntry)
+
+        module_values = metadata_decoder.value['metadata']['MetadataV3']['modules']
+        self.assertEqual(module_values[0]['name'], metadata_decoder.metadata.modules[0].name)
+        self.assertEqual(module_values[0]['storage'][0]['name'], 'AccountNonce')
+
+    def test_value_cached(self):
+        metadata_decoder = MetadataDecoder(ScaleBytes(TestMetadata.metadata_v3_hex))
+        metadata_decoder.decode()
+
+        self.assertIs(metadata_decoder.value, metadata_decoder.value)
+
+    def test_byte_output_context(self):
+        # Metadata is decoded with hex output and UTF-8 text whatever the byte output of the context
+        expected = MetadataDecoder(ScaleBytes(metadata_v5_hex))
+        expected.decode()
+
+        for context in (DecodeContext(byte_output='memoryview', decode_utf8=False), DecodeContext(byte_output='bytes')):
+            data = ScaleBytes(metadata_v5_hex, context=context)
+            metadata_decoder = MetadataDecoder(data)
+            metadata_decoder.decode()
+
+            # The context of the caller's data is restored after decoding
+            self.assertIs(data.context, context)
+
+            self.assertEqual(metadata_decoder.call_index['0100'][1].name, expected.call_index['0100'][1].name)
+            self.assertEqual(metadata_decoder.get_normalized(), expected.get_normalized())
+            self.assertEqual(json.dumps(metadata_decoder.value), json.dumps(expected.value))
+
+        # The context of the caller is not changed
+        self.assertEqual(context.byte_output, 'bytes')
+
+    def test_model_v5(self):
+        metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v5_hex))
+        metadata_decoder.decode()
+
+        self.assertEqual(metadata_decoder.data.offset, metadata_decoder.data.length)
+
+        balances = metadata_decoder.metadata.modules[1]
+        self.assertEqual(balances.storage[2].type['DoubleMapType']['key2Hasher'], 'Twox256')
+        self.assertEqual(metadata_decoder.call_index['0100'][1].args[0].type, 'Address')
+
+    def test_model_v7(self):
+        metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v7_hex))
+        metadata_decoder.decode()
+
+        balances = metadata_decoder.metadata.modules[1]
+        self.assertEqual(balances.prefix, 'BalancesPrefix')
+        self.assertEqual(balances.storage[1].type['MapType']['hasher'], 'Twox128')
+        self.assertIsInstance(balances.constants[0], Constant)
+        self.assertEqual(balances.constants[0].constant_value, '0x0102' + '00' * 14)
+        self.assertEqual(metadata_decoder.event_index['0000'][1].name, 'Transfer')
+
+        module_value = metadata_decoder.value['metadata']['MetadataV7']['modules'][1]
+        self.assertEqual(module_value['storage']['prefix'], 'BalancesPrefix')
+        self.assertEqual(
+            [item['name'] for item in module_value['storage']['items']], ['Total', 'Free', 'Dbl']
+        )
+        self.assertEqual(module_value['constants'][0]['value'], '0x0102' + '00' * 14)
+
+
+class TestMetadataSkipDocs(unittest.TestCase):
+
+    def test_skip_docs_v3(self):
+        metadata_decoder = MetadataDecoder(ScaleBytes(TestMetadata.metadata_v3_hex))
+        metadata_decoder.decode()
+
+        docs_free_decoder = MetadataDecoder(
+            ScaleBytes(TestMetadata.metadata_v3_hex, context=DecodeContext(skip_docs=True))
+        )
+        docs_free_decoder.decode()
+
+        self.assertEqual(docs_free_decoder.data.offset, docs_free_decoder.data.length)
+        self.assertEqual(docs_free_decoder.get_normalized(), metadata_decoder.get_normalized())
+
+        for module, call in docs_free_decoder.call_index.values():
+            self.assertEqual(call.docs, [])
+
+        self.assertTrue(any(call.docs for module, call in metadata_decoder.call_index.values()))
+
+    def test_skip_docs_v7(self):
+        metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v7_hex, context=DecodeContext(skip_docs=True)))
+        metadata_decoder.decode()
+
+        balances = metadata_decoder.metadata.modules[1]
+        self.assertEqual(balances.constants[0].docs, [])
+        self.assertEqual(balances.constants[0].constant_value, '0x0102' + '00' * 14)
+        self.assertEqual(balances.storage[2].docs, [])
+        self.assertEqual(balances.storage[2].fallback, '0xabcd')
+
+
+class TestMetadataConstants(unittest.TestCase):
+
+    def setUp(self):
+        self.metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v7_hex))
+        self.metadata_decoder.decode()
+
+    def test_get_constant(self):
+        self.assertEqual(self.metadata_decoder.constant_values, {})
+        self.assertEqual(self.metadata_decoder.get_constant('Balances', 'ExistentialDeposit'), 513)
+        self.assertEqual(self.metadata_decoder.constant_values, {('Balances', 'ExistentialDeposit'): 513})
+
+    def test_constant_cached(self):
+        self.metadata_decoder.get_constant('Balances', 'ExistentialDeposit')
+        self.metadata_decoder.metadata.modules[1].constants[0].constant_value = '0x0000'
+
+        self.assertEqual(self.metadata_decoder.get_constant('Balances', 'ExistentialDeposit'), 513)
+
+    def test_spec_version_constant(self):
+        runtime_config = RuntimeConfiguration()
+        runtime_config.add_type_registry_range(1, 10, {'Balance': 'U8'})
+
+        try:
+            metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v7_hex), spec_version_id=5)
+            metadata_decoder.decode()
+            self.assertEqual(metadata_decoder.get_constant('Balances', 'ExistentialDeposit'), 1)
+        finally:
+            runtime_config.clear_type_registry_ranges()
+
+    def test_unknown_constant(self):
+        self.assertRaises(ValueError, self.metadata_decoder.get_constant, 'Balances', 'Unknown')
+        self.assertRaises(ValueError, self.metadata_decoder.get_constant, 'Timestamp', 'ExistentialDeposit')
+
+
+class TestMetadataDiff(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.metadata_v2 = MetadataDecoder(ScaleBytes(TestMetadata.metadata_v2_hex))
+        cls.metadata_v2.decode()
+        cls.metadata_v3 = MetadataDecoder(ScaleBytes(TestMetadata.metadata_v3_hex))
+        cls.metadata_v3.decode()
+
+    def test_diff(self):
+        metadata_diff = self.metadata_v3.diff(self.metadata_v2)
+
+        self.assertTrue(metadata_diff.has_changes())
+        self.assertIn(('democracy', 'set_proxy'), metadata_diff.added['calls'])
+        self.assertEqual(metadata_diff.removed['events'], [('council', 'TallyFinalised')])
+        self.assertEqual(metadata_diff.changed['storage'], [('timestamp', 'BlockPeriod')])
+        self.assertIn(('balances', 'transfer'), metadata_diff.unchanged['calls'])
+        self.assertEqual(metadata_diff.changed_modules, ['timestamp', 'democracy', 'council'])
+        self.assertTrue(metadata_diff.call_index_changed)
+
+    def test_diff_identical(self):
+        metadata_decoder = MetadataDecoder(ScaleBytes(TestMetadata.metadata_v3_hex))
+        metadata_decoder.decode()
+
+        metadata_diff = metadata_decoder.diff(self.metadata_v3)
+
+        self.assertFalse(metadata_diff.has_changes())
+        self.assertEqual(len(metadata_diff.unchanged['calls']), len(metadata_decoder.call_index))
+
+    def test_reuse_decoder_plans(self):
+        previous = MetadataDecoder(ScaleBytes(TestMetadata.metadata_v2_hex))
+        previous.decode()
+
+        metadata_decoder = MetadataDecoder(ScaleBytes(TestMetadata.metadata_v3_hex), compile_plans=False)
+        metadata_decoder.decode()
+        metadata_decoder.compile_decoder_plans(previous=previous)
+
+        previous_calls = {(module.name, call.name): call for module, call in previous.call_index.values()}
+
+        for module, call in metadata_decoder.call_index.values():
+            previous_call = previous_calls.get((module.name, call.name))
+
+            if previous_call:
+                self.assertIs(call.arg_plans, previous_call.arg_plans)
+            else:
+                self.assertEqual(len(call.arg_plans), len(call.args))
+
+    def test_reuse_storage_decoders(self):
+        previous = MetadataDecoder(ScaleBytes(TestMetadata.metadata_v2_hex))
+        previous.decode()
+        value_decoder = previous.get_storage_value_decoder('balances', 'FreeBalance')
+        key_builder = previous.get_storage_key_builder('timestamp', 'BlockPeriod')
+
+        metadata_decoder = MetadataDecoder(ScaleBytes(TestMetadata.metadata_v3_hex), compile_plans=False)
+        metadata_decoder.decode()
+        metadata_decoder.compile_decoder_plans(previous=previous)
+
+        self.assertIs(metadata_decoder.get_storage_value_decoder('balances', 'FreeBalance'), value_decoder)
+        # Changed between the runtimes (MetadataDiff.changed)
+        self.assertIsNot(metadata_decoder.get_storage_key_builder('timestamp', 'BlockPeriod'), key_builder)
+
+    def test_reuse_across_spec_versions(self):
+        previous = MetadataDecoder(ScaleBytes(TestMetadata.metadata_v3_hex), spec_version_id=2)
+        previous.decode()
+
+        runtime_config = RuntimeConfiguration()
+        runtime_config.add_type_registry_range(4, None, {'Balance': 'U64'})
+
+        try:
+            # Spec versions 2 and 3 resolve to the same types, spec version 4 does not
+            for spec_version_id, shared in ((3, True), (4, False)):
+                metadata_decoder = MetadataDecoder(ScaleBytes(TestMetadata.metadata_v3_hex), compile_plans=False)
+                metadata_decoder.decode()
+                previous.compile_decoder_plans()
+                metadata_decoder.compile_decoder_plans(spec_version_id, previous=previous)
+
+                self.assertEqual(
+                    metadata_decoder.call_index['0300'][1].arg_plans is previous.call_index['0300'][1].arg_plans,
+                    shared
+                )
+        finally:
+            runtime_config.clear_type_registry_ranges()
+
+    def test_no_reuse_after_registry_change(self):
+        metadata_decoder = MetadataDecoder(ScaleBytes(TestMetadata.metadata_v3_hex), compile_plans=False)
+        metadata_decoder.decode()
+
+        previous = MetadataDecoder(ScaleBytes(TestMetadata.metadata_v3_hex))
+        previous.decode()
+
+        RuntimeConfiguration().clear_decoder_plans()
+        metadata_decoder.compile_decoder_plans(previous=previous)
+
+        module, call = metadata_decoder.call_index['0300']
+        self.assertIsNot(call.arg_plans, previous.call_index['0300'][1].arg_plans)
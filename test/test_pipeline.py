@@ -0,0 +1,158 @@
+# Python SCALE Codec Library
+#
+# Copyright 2018-2019 openAware BV (NL).
+# This file is part of Polkascan.
+#
+# Polkascan is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Polkascan is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Polkascan. If not, see <http://www.gnu.org/licenses/>.
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from scalecodec.base import ScaleBytes
+from scalecodec.block import Block, ExtrinsicsDecoder
+from scalecodec.metadata import MetadataDecoder
+from scalecodec.pipeline import BlockPipeline, LocalBlockSource, RawBlock, get_decode_contexts
+from scalecodec.types import CompactU32
+
+from test.fixtures import metadata_v4_hex, header_hex, extrinsic_hex, events_hex
+
+
+def encode_block(extrinsics):
+    block_data = header_hex + str(CompactU32(ScaleBytes(bytearray())).encode(len(extrinsics)))[2:]
+
+    for extrinsic in extrinsics:
+        block_data += str(CompactU32(ScaleBytes(bytearray())).encode(int(len(extrinsic[2:]) / 2)))[2:] + extrinsic[2:]
+
+    return block_data
+
+
+class TestBlockPipeline(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v4_hex))
+        cls.metadata_decoder.decode()
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def collect(self, pipeline, source, consumed=None):
+        async def run():
+            result = []
+            async for block in pipeline.process(source):
+                if consumed is not None:
+                    consumed.append(source.blocks_read)
+                result.append(block)
+            return result
+
+        return self.loop.run_until_complete(run())
+
+    def test_decode_blocks_in_order(self):
+        blocks = [encode_block([extrinsic_hex] * n) for n in range(0, 6)]
+
+        pipeline = BlockPipeline(metadata=self.metadata_decoder, concurrency=3)
+        result = self.collect(pipeline, LocalBlockSource(blocks))
+
+        self.assertEqual([len(block['extrinsics']) for block in result], list(range(0, 6)))
+        self.assertEqual(result[1]['header']['number'], 59)
+        self.assertEqual(result[1]['extrinsics'][0]['call_module_function'], 'transfer')
+        self.assertEqual(
+            result[1]['extrinsics'][0]['extrinsic_hash'],
+            '4ca1c2dac262c73710eaa42c286a9c574b67934ae14000f8df2ae6bac2fed2da'
+        )
+
+    def test_block_decodes_extrinsics_in_place(self):
+        block = Block(ScaleBytes(encode_block([extrinsic_hex] * 2)), metadata=self.metadata_decoder)
+        block.decode()
+
+        extrinsic = ExtrinsicsDecoder(ScaleBytes(extrinsic_hex), metadata=self.metadata_decoder)
+        extrinsic.decode()
+
+        for block_extrinsic in block.extrinsics:
+            self.assertIs(block_extrinsic.data, block.data)
+            self.assertEqual(block_extrinsic.value['params'], extrinsic.value['params'])
+            self.assertEqual(block_extrinsic.extrinsic_hash, extrinsic.extrinsic_hash)
+
+        self.assertEqual(block.data.offset, block.data.length)
+
+    def test_block_iter_extrinsics(self):
+        block_data = encode_block([extrinsic_hex] * 2)
+
+        block = Block(ScaleBytes(block_data), metadata=self.metadata_decoder)
+        extrinsics = list(block.iter_extrinsics())
+
+        self.assertEqual(block.header.value['number'], 59)
+        self.assertEqual(
+            extrinsics, Block(ScaleBytes(block_data), metadata=self.metadata_decoder).decode()['extrinsics']
+        )
+        self.assertEqual(block.extrinsics, [])
+
+    def test_backpressure(self):
+        blocks = [encode_block([]) for _ in range(0, 10)]
+        consumed = []
+
+        pipeline = BlockPipeline(metadata=self.metadata_decoder, concurrency=2)
+        self.collect(pipeline, LocalBlockSource(blocks), consumed=consumed)
+
+        for blocks_yielded, blocks_read in enumerate(consumed, start=1):
+            self.assertLessEqual(blocks_read, blocks_yielded + 2)
+
+    def test_runtime_upgrade(self):
+        requested = []
+
+        def metadata_provider(spec_version):
+            requested.append(spec_version)
+            return metadata_v4_hex
+
+        blocks = [
+            RawBlock(encode_block([extrinsic_hex]), spec_version=1),
+            RawBlock(encode_block([]), spec_version=1),
+            RawBlock(encode_block([]), spec_version=2, events=events_hex),
+        ]
+
+        pipeline = BlockPipeline(metadata_provider=metadata_provider)
+        result = self.collect(pipeline, LocalBlockSource(blocks))
+
+        self.assertEqual(requested, [1, 2])
+        self.assertEqual([block['spec_version'] for block in result], [1, 1, 2])
+        self.assertEqual(len(result[2]['events']), 9)
+
+    def test_spec_version_context(self):
+        block_context, events_context = get_decode_contexts(RawBlock(encode_block([]), spec_version=7))
+
+        self.assertEqual(block_context.spec_version_id, 7)
+        self.assertEqual(events_context.spec_version_id, 7)
+        self.assertTrue(events_context.values_only)
+        self.assertEqual(get_decode_contexts(RawBlock(encode_block([])))[0].spec_version_id, 'default')
+
+    def test_executor(self):
+        blocks = [encode_block([]) for _ in range(0, 3)]
+
+        # The thread pool created for a run is not kept on the pipeline
+        pipeline = BlockPipeline(metadata=self.metadata_decoder)
+        self.assertEqual(len(self.collect(pipeline, LocalBlockSource(blocks))), 3)
+        self.assertIsNone(pipeline.executor)
+
+        # An executor of the caller is left running
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pipeline = BlockPipeline(metadata=self.metadata_decoder, executor=executor)
+            self.assertEqual(len(self.collect(pipeline, LocalBlockSource(blocks))), 3)
+            self.assertEqual(executor.submit(len, blocks).result(), 3)
+
+    def test_no_metadata(self):
+        pipeline = BlockPipeline()
+        self.assertRaises(ValueError, self.collect, pipeline, LocalBlockSource([encode_block([])]))
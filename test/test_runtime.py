@@ -0,0 +1,145 @@
+# Python SCALE Codec Library
+#
+# Copyright 2018-2019 openAware BV (NL).
+# This file is part of Polkascan.
+#
+# Polkascan is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Polkascan is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Polkascan. If not, see <http://www.gnu.org/licenses/>.
+import shutil
+import tempfile
+import unittest
+
+from scalecodec.base import ScaleBytes
+from scalecodec.cache import MetadataCache
+from scalecodec.metadata import MetadataDecoder
+from scalecodec.runtime import RuntimeManager, estimate_size
+
+from test import test_metadata
+from test.fixtures import metadata_v4_hex
+
+
+class TestRuntimeManager(unittest.TestCase):
+
+    metadata = {
+        1: test_metadata.TestMetadata.metadata_v1_hex,
+        2: test_metadata.TestMetadata.metadata_v2_hex,
+        3: test_metadata.TestMetadata.metadata_v3_hex,
+        4: metadata_v4_hex,
+    }
+
+    def setUp(self):
+        self.requested = []
+
+    def metadata_provider(self, spec_version):
+        self.requested.append(spec_version)
+        return self.metadata[spec_version]
+
+    def test_hits_and_misses(self):
+        manager = RuntimeManager(self.metadata_provider)
+
+        runtime = manager.get_runtime(spec_version=4)
+        self.assertEqual(runtime.metadata.version.value, 'MetadataV4Decoder')
+        self.assertIs(manager.get_runtime(spec_version=4), runtime)
+        self.assertIs(manager.get_runtime(metadata_hash=runtime.metadata_hash), runtime)
+
+        self.assertEqual(self.requested, [4])
+        self.assertEqual(runtime.metadata.spec_version_id, '4')
+        self.assertEqual(manager.get_stats()['hits'], 2)
+        self.assertEqual(manager.get_stats()['misses'], 1)
+
+    def test_evict_least_recently_used(self):
+        manager = RuntimeManager(self.metadata_provider, max_runtimes=2)
+
+        manager.get_runtime(spec_version=1)
+        manager.get_runtime(spec_version=2)
+        manager.get_runtime(spec_version=1)
+        manager.get_runtime(spec_version=3)
+
+        self.assertEqual(manager.get_stats()['evictions'], 1)
+        self.assertEqual(manager.get_stats()['runtimes'], 2)
+
+        manager.get_runtime(spec_version=1)
+        manager.get_runtime(spec_version=2)
+
+        self.assertEqual(self.requested, [1, 2, 3, 2])
+
+    def test_evict_by_bytes(self):
+        manager = RuntimeManager(self.metadata_provider, max_runtimes=None)
+        runtime_size = manager.get_runtime(spec_version=4).size
+        self.assertGreater(runtime_size, 0)
+
+        manager = RuntimeManager(self.metadata_provider, max_runtimes=None, max_bytes=int(runtime_size * 1.5))
+        manager.get_runtime(spec_version=4)
+        manager.get_runtime(spec_version=3)
+
+        self.assertEqual(manager.get_stats()['runtimes'], 1)
+        self.assertLessEqual(manager.get_stats()['bytes'], manager.get_runtime(spec_version=3).size)
+
+    def test_shared_runtime_for_spec_versions(self):
+        manager = RuntimeManager()
+
+        metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v4_hex))
+        metadata_decoder.decode()
+
+        runtime = manager.add_runtime(metadata_decoder, spec_version=10)
+
+        self.assertIs(manager.add_runtime(metadata_v4_hex, spec_version=11), runtime)
+        self.assertIs(manager.get_metadata(11), metadata_decoder)
+        self.assertEqual(manager.get_stats()['runtimes'], 1)
+
+    def test_unknown_runtime(self):
+        manager = RuntimeManager()
+        self.assertIsNone(manager.get_runtime(spec_version=1))
+        self.assertEqual(manager.get_stats()['misses'], 1)
+
+    def test_decoder_plans_reused_on_upgrade(self):
+        manager = RuntimeManager(self.metadata_provider)
+
+        metadata_v2 = manager.get_metadata(2)
+        metadata_v3 = manager.get_metadata(3)
+
+        self.assertIs(metadata_v3.call_index['0300'][1].arg_plans, metadata_v2.call_index['0300'][1].arg_plans)
+        self.assertEqual(metadata_v3.call_index['0300'][1].name, 'transfer')
+
+    def test_decoder_plans_reused_from_cache(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        manager = RuntimeManager(self.metadata_provider, metadata_cache=MetadataCache(directory))
+
+        metadata_v2 = manager.get_metadata(2)
+        metadata_v3 = manager.get_metadata(3)
+
+        self.assertEqual(metadata_v3.spec_version_id, '3')
+        self.assertIs(metadata_v3.call_index['0300'][1].arg_plans, metadata_v2.call_index['0300'][1].arg_plans)
+
+    def test_decoder_plans_reused_for_metadata_decoder(self):
+        manager = RuntimeManager(self.metadata_provider)
+        metadata_v2 = manager.get_metadata(2)
+
+        metadata_v3 = MetadataDecoder(
+            ScaleBytes(test_metadata.TestMetadata.metadata_v3_hex), compile_plans=False, spec_version_id=3
+        )
+        metadata_v3.decode()
+        manager.add_runtime(metadata_v3, spec_version=3)
+
+        self.assertIs(metadata_v3.call_index['0300'][1].arg_plans, metadata_v2.call_index['0300'][1].arg_plans)
+
+    def test_shared_decoder_plans_counted_once(self):
+        manager = RuntimeManager(self.metadata_provider, max_runtimes=None)
+
+        runtime_v2 = manager.get_runtime(spec_version=2)
+        runtime_v3 = manager.get_runtime(spec_version=3)
+
+        self.assertLess(manager.get_stats()['bytes'], estimate_size(runtime_v2) + estimate_size(runtime_v3))
+        self.assertEqual(manager.get_stats()['bytes'], runtime_v2.size + runtime_v3.size)
@@ -20,9 +20,10 @@ import datetime
 import unittest
 from _blake2 import blake2b
 
-from scalecodec import CompactU32, U16
+from scalecodec import CompactU32, U16, Enum
 from scalecodec.base import ScaleDecoder, ScaleBytes, RemainingScaleBytesNotEmptyException, \
-    InvalidScaleTypeValueException
+    InvalidScaleTypeValueException, RuntimeConfiguration, DecodeContext, InternTable
+from scalecodec.exceptions import DecodeLimitExceededException
 from scalecodec.block import ExtrinsicsDecoder, MetadataDecoder, EventsDecoder, LogDigest
 
 
@@ -189,7 +190,8 @@ class TestScaleTypes(unittest.TestCase):
 
         print(input[len:len + 2])
 
-        workProofType = ScaleDecoder.get_decoder_class('U16', ScaleBytes('0x' + str(input[len:len + 2])))
+        # The work proof type is a single byte, padded to the size of U16 (reads past the data raise)
+        workProofType = ScaleDecoder.get_decoder_class('U16', ScaleBytes('0x' + str(input[len:len + 2]) + '00'))
         workProofType.decode()
         print(workProofType.value)
 
@@ -275,3 +277,320 @@ class TestScaleTypes(unittest.TestCase):
         log_digest.decode()
         print(log_digest.value)
 
+
+    def test_decoder_plan_cache(self):
+        decoder_plan = ScaleDecoder.get_decoder_plan('Vec<(SessionKey, u64)>')
+
+        self.assertIs(ScaleDecoder.get_decoder_plan('Vec<(SessionKey, u64)>'), decoder_plan)
+        self.assertEqual(decoder_plan.kwargs, {'sub_type': '(SessionKey, u64)'})
+
+        RuntimeConfiguration().update_type_registry({'default': {}})
+        self.assertIsNot(ScaleDecoder.get_decoder_plan('Vec<(SessionKey, u64)>'), decoder_plan)
+
+    def test_decoder_plan_tuple(self):
+        obj = ScaleDecoder.get_decoder_plan('(u32, u8)').decode(ScaleBytes('0x0100000002'))
+        self.assertEqual(obj.value, {'col1': 1, 'col2': 2})
+
+    def test_fixed_length_array_bytes(self):
+        obj = ScaleDecoder.get_decoder_plan('[u8; 20]').decode(ScaleBytes('0x' + '01' * 20 + 'ff'))
+        self.assertEqual(obj.value, '0x' + '01' * 20)
+        self.assertEqual(obj.data.offset, 20)
+
+    def test_fixed_length_array_numbers(self):
+        obj = ScaleDecoder.get_decoder_plan('[u32; 3]').decode(ScaleBytes('0x010000000200000003000000'))
+        self.assertEqual(obj.value, [1, 2, 3])
+
+        obj = ScaleDecoder.get_decoder_plan('[BlockNumber; 2]').decode(ScaleBytes('0x' + '01' + '00' * 7 + 'ff' * 8))
+        self.assertEqual(obj.value, [1, 2 ** 64 - 1])
+
+        obj = ScaleDecoder.get_decoder_plan('[u128; 2]').decode(ScaleBytes('0x' + '02' + '00' * 15 + '03' + '00' * 15))
+        self.assertEqual(obj.value, [2, 3])
+
+        self.assertRaises(ValueError, ScaleDecoder.get_decoder_plan('[u32; 3]').decode, ScaleBytes('0x01000000'))
+
+    def test_fixed_length_array_composite(self):
+        obj = ScaleDecoder.get_decoder_plan('[(u8, Compact<u32>); 2]').decode(ScaleBytes('0x01040208'))
+        self.assertEqual(obj.value, [{'col1': 1, 'col2': 1}, {'col1': 2, 'col2': 2}])
+
+    def test_fixed_length_array_skip(self):
+        self.assertEqual(ScaleDecoder.get_decoder_plan('[[u16; 4]; 3]').get_fixed_size(), 24)
+        self.assertEqual(ScaleDecoder.get_decoder_plan('[H256; 2]').get_fixed_size(), 64)
+        self.assertIsNone(ScaleDecoder.get_decoder_plan('[Compact<u32>; 2]').get_fixed_size())
+
+        data = ScaleBytes('0x' + '00' * 24 + '0408')
+        ScaleDecoder.get_decoder_plan('[[u16; 4]; 3]').skip(data)
+        ScaleDecoder.get_decoder_plan('[Compact<u32>; 1]').skip(data)
+        self.assertEqual(data.offset, 25)
+
+    def test_struct_value_decoder(self):
+        decoder_plan = ScaleDecoder.get_decoder_plan('(u32, Compact<Balance>, Vec<u8>, bool, H256, (u8, Compact<u8>))')
+        value_decoder = decoder_plan.get_value_decoder()
+
+        data = '0x01000000' + '0b00407a10f35a' + '0c616263' + '01' + '11' * 32 + '05' + '0101' + 'ff'
+
+        obj = decoder_plan.decode(ScaleBytes(data))
+        scale_bytes = ScaleBytes(data)
+
+        self.assertEqual(value_decoder(scale_bytes), obj.value)
+        self.assertEqual(scale_bytes.offset, obj.data.offset)
+        # Like Compact<u8>, only the first byte of the two byte compact is decoded
+        self.assertEqual(obj.value['col6'], {'col1': 5, 'col2': 0})
+        self.assertIs(decoder_plan.get_value_decoder(), value_decoder)
+
+    def test_struct_value_decoder_fallback(self):
+        decoder_plan = ScaleDecoder.get_decoder_plan('(Option<u8>, Vec<u16>)')
+
+        self.assertIn('p0.decode', decoder_plan.get_value_decoder().source)
+        self.assertEqual(decoder_plan.decode_param(ScaleBytes('0x0107040100')), ({'col1': 7, 'col2': [1]}, ''))
+        self.assertIsNone(ScaleDecoder.get_decoder_plan('Vec<u16>').get_value_decoder())
+
+    def test_fixed_size_analysis(self):
+        self.assertEqual(ScaleDecoder.get_decoder_plan('U64').get_fixed_size(), 8)
+        self.assertEqual(ScaleDecoder.get_decoder_plan('H256').get_fixed_size(), 32)
+        self.assertEqual(ScaleDecoder.get_decoder_plan('(u32, H256, Null)').get_fixed_size(), 36)
+        self.assertEqual(ScaleDecoder.get_decoder_plan('VestingSchedule').get_fixed_size(), 40)
+        self.assertEqual(ScaleDecoder.get_decoder_plan('RewardDestination').get_fixed_size(), 1)
+        self.assertIsNone(ScaleDecoder.get_decoder_plan('IndividualExposure').get_fixed_size())
+        self.assertIsNone(ScaleDecoder.get_decoder_plan('Option<u32>').get_fixed_size())
+        self.assertIsNone(ScaleDecoder.get_decoder_plan('(u32, UnknownType123)').get_fixed_size())
+
+        type_sizes = RuntimeConfiguration().get_type_sizes()
+        self.assertEqual(type_sizes['accountid'], 32)
+        self.assertIsNone(type_sizes['individualexposure'])
+
+    def test_fixed_size_enum(self):
+        self.assertEqual(Enum.get_fixed_size(type_mapping=(('A', 'u32'), ('B', 'ProposalIndex'))), 5)
+        self.assertIsNone(Enum.get_fixed_size(type_mapping=(('A', 'u32'), ('B', 'Null'))))
+
+    def test_enum_variant_decoders(self):
+        type_mapping = [['Variant{}'.format(n), 'u8'] for n in range(16)] + [['Unknown', 'UnknownType123']]
+
+        runtime_config = RuntimeConfiguration()
+        runtime_config.update_type_registry({'default': {'TestEnum16': {'type': 'enum', 'type_mapping': type_mapping}}})
+
+        try:
+            decoder_plan = ScaleDecoder.get_decoder_plan('TestEnum16')
+
+            # Index is the raw byte, not its hex digits
+            self.assertEqual(decoder_plan.decode(ScaleBytes('0x0a07')).value, {'Variant10': 7})
+            self.assertEqual(decoder_plan.decode(ScaleBytes('0x0f08')).value, {'Variant15': 8})
+
+            # Unknown variant types only fail when decoded
+            self.assertRaises(NotImplementedError, decoder_plan.decode, ScaleBytes('0x1001'))
+            self.assertRaises(ValueError, decoder_plan.decode, ScaleBytes('0x11'))
+            self.assertRaises(ValueError, decoder_plan.decode, ScaleBytes('0x'))
+
+            decoder_class = decoder_plan.decoder_class
+            self.assertIs(
+                decoder_class.get_variant_decoders(decoder_class.type_mapping),
+                decoder_class.get_variant_decoders(decoder_class.type_mapping)
+            )
+        finally:
+            runtime_config.type_registry['default'].pop('testenum16')
+            runtime_config.clear_decoder_plans()
+
+    def test_enum_value_list_index(self):
+        obj = ScaleDecoder.get_decoder_plan('StorageHasher').decode(ScaleBytes('0x04'))
+        self.assertEqual(obj.value, 'Twox128Concat')
+        self.assertTrue(obj.is_twox128_concat())
+
+        self.assertRaises(ValueError, ScaleDecoder.get_decoder_plan('StorageHasher').decode, ScaleBytes('0x10'))
+
+    def test_decode_limits_remaining_data(self):
+        # Element count that cannot fit in the remaining data fails before decoding any element
+        def decode(type_string, data):
+            return ScaleDecoder.get_decoder_plan(type_string).decode(ScaleBytes(data)).value
+
+        self.assertRaises(DecodeLimitExceededException, decode, 'Vec<H256>', '0xfdff' + '00' * 64)
+        self.assertRaises(DecodeLimitExceededException, decode, 'Bytes', '0x0c6162')
+        self.assertRaises(DecodeLimitExceededException, decode, 'HexBytes', '0x08ff')
+        self.assertRaises(
+            DecodeLimitExceededException, ScaleDecoder.get_decoder_plan('(u8, Bytes)').get_value_decoder(),
+            ScaleBytes('0x010c6162')
+        )
+
+        # Variable sized elements take at least one byte each, zero sized ones are not limited by the data
+        self.assertRaises(DecodeLimitExceededException, decode, 'Vec<Option<u32>>', '0x0a000100')
+        self.assertRaises(DecodeLimitExceededException, decode, 'Vec<Bytes>', '0x0a000100')
+        self.assertEqual(decode('Vec<Null>', '0x0c'), [None, None, None])
+
+        # Reads past the end of the data raise
+        self.assertRaises(ValueError, decode, 'Vec<Option<u32>>', '0x04010500')
+        self.assertRaises(ValueError, decode, 'H256', '0x' + '00' * 31)
+
+    def test_decode_limits_context(self):
+        context = DecodeContext(max_elements=2, max_bytes=3, max_depth=3)
+
+        def decode(type_string, data):
+            return ScaleDecoder.get_decoder_plan(type_string).decode(ScaleBytes(data, context=context)).value
+
+        self.assertEqual(decode('Vec<Compact<u32>>', '0x080408'), [1, 2])
+        self.assertRaises(DecodeLimitExceededException, decode, 'Vec<Compact<u32>>', '0x0c040808')
+
+        self.assertEqual(decode('String', '0x0c616263'), 'abc')
+        self.assertRaises(DecodeLimitExceededException, decode, 'String', '0x1061626364')
+
+        # Vec, Bytes and its Compact<u32> length
+        self.assertEqual(decode('Vec<Vec<u8>>', '0x040441'), ['A'])
+        self.assertRaises(DecodeLimitExceededException, decode, 'Vec<Vec<Vec<u8>>>', '0x04040400')
+
+    def test_values_only(self):
+        data = '0x08' + '01000000' + '0c616263' + '02000000' + '00'
+
+        obj = ScaleDecoder.get_decoder_plan('Vec<(u32, Bytes)>').decode(
+            ScaleBytes(data, context=DecodeContext(values_only=True))
+        )
+        self.assertEqual(obj.value, [{'col1': 1, 'col2': 'abc'}, {'col1': 2, 'col2': ''}])
+        self.assertEqual(obj.elements, [])
+
+        obj = ScaleDecoder.get_decoder_plan('Vec<Option<u8>>').decode(
+            ScaleBytes('0x08010500', context=DecodeContext(values_only=True))
+        )
+        self.assertEqual(obj.value, [5, None])
+        self.assertEqual(obj.elements, [])
+
+        obj = ScaleDecoder.get_decoder_plan('Vec<(u32, Bytes)>').decode(
+            ScaleBytes(data, context=DecodeContext(values_only=True)), retain_elements=True
+        )
+        self.assertEqual(len(obj.elements), 2)
+        self.assertEqual(obj.value, ScaleDecoder.get_decoder_plan('Vec<(u32, Bytes)>').decode(ScaleBytes(data)).value)
+
+    def test_intern_table(self):
+        intern_table = InternTable(max_size=2)
+        context = DecodeContext(intern_table=intern_table)
+
+        data = '0x' + '11' * 32
+        first = ScaleDecoder.get_decoder_plan('AccountId').decode(ScaleBytes(data, context=context)).value
+        second = ScaleDecoder.get_decoder_plan('AccountId').decode(ScaleBytes(data, context=context)).value
+
+        self.assertEqual(first, data)
+        self.assertIs(first, second)
+
+        # Hashes are mostly unique, they are not interned
+        self.assertIsNot(
+            ScaleDecoder.get_decoder_plan('Hash').decode(ScaleBytes(data, context=context)).value,
+            ScaleDecoder.get_decoder_plan('Hash').decode(ScaleBytes(data, context=context)).value
+        )
+        self.assertIsNot(
+            ScaleDecoder.get_decoder_plan('Hash').decode_param(ScaleBytes(data, context=context))[1],
+            ScaleDecoder.get_decoder_plan('Hash').decode_param(ScaleBytes(data, context=context))[1]
+        )
+        self.assertIsNot(
+            ScaleDecoder.get_decoder_plan('AccountId').decode(ScaleBytes(data)).value,
+            ScaleDecoder.get_decoder_plan('AccountId').decode(ScaleBytes(data)).value
+        )
+
+        # Generated struct decoders use the same table
+        value = ScaleDecoder.get_decoder_plan('(u8, AccountId)').get_value_decoder()(
+            ScaleBytes('0x01' + '11' * 32, context=context)
+        )
+        self.assertIs(value['col2'], first)
+
+        # Raw values of event and call arguments
+        decoder_plan = ScaleDecoder.get_decoder_plan('AccountId')
+        self.assertIs(
+            decoder_plan.decode_param(ScaleBytes(data, context=context))[1],
+            decoder_plan.decode_param(ScaleBytes(data, context=context))[1]
+        )
+
+        # A full table is cleared
+        self.assertEqual(len(intern_table), 2)
+        intern_table.intern('a')
+        self.assertEqual(len(intern_table), 1)
+
+    def test_byte_output(self):
+        data = '0x' + '11' * 32
+
+        for byte_output, value in (('bytes', b'\x11' * 32), ('memoryview', memoryview(b'\x11' * 32))):
+            context = DecodeContext(byte_output=byte_output)
+
+            obj = ScaleDecoder.get_decoder_plan('AccountId').decode(ScaleBytes(data, context=context))
+            self.assertEqual(obj.value, value)
+            self.assertIs(type(obj.value), type(value))
+            self.assertEqual(obj.raw_value, '')
+
+            self.assertEqual(
+                ScaleDecoder.get_decoder_plan('Signature').decode(
+                    ScaleBytes('0x' + '22' * 64, context=context)
+                ).value, b'\x22' * 64
+            )
+            self.assertEqual(
+                ScaleDecoder.get_decoder_plan('Address').decode(ScaleBytes('0xff' + '11' * 32, context=context)).value,
+                value
+            )
+
+            # Generated struct decoders
+            self.assertEqual(
+                ScaleDecoder.get_decoder_plan('(u8, Hash, H512)').get_value_decoder()(
+                    ScaleBytes('0x01' + '11' * 32 + '33' * 64, context=context)
+                ), {'col1': 1, 'col2': value, 'col3': b'\x33' * 64}
+            )
+
+        # Bytes values are interned, memoryviews are not hashable
+        context = DecodeContext(byte_output='bytes', intern_table=InternTable())
+        self.assertIs(
+            ScaleDecoder.get_decoder_plan('AccountId').decode(ScaleBytes(data, context=context)).value,
+            ScaleDecoder.get_decoder_plan('AccountId').decode(ScaleBytes(data, context=context)).value
+        )
+
+        self.assertRaises(ValueError, DecodeContext, byte_output='base64')
+
+    def test_bytes_utf8(self):
+        context = DecodeContext(byte_output='bytes')
+        self.assertEqual(
+            ScaleDecoder.get_decoder_plan('Bytes').decode(ScaleBytes('0x0c616263', context=context)).value, 'abc'
+        )
+        self.assertEqual(
+            ScaleDecoder.get_decoder_plan('Bytes').decode(ScaleBytes('0x08ff00', context=context)).value, b'\xff\x00'
+        )
+
+        # Without UTF-8 decoding all values have the byte output
+        context = DecodeContext(decode_utf8=False)
+        self.assertEqual(
+            ScaleDecoder.get_decoder_plan('Bytes').decode(ScaleBytes('0x0c616263', context=context)).value, '616263'
+        )
+        self.assertEqual(
+            ScaleDecoder.get_decoder_plan('(u8, Bytes)').get_value_decoder()(
+                ScaleBytes('0x010c616263', context=DecodeContext(byte_output='bytes', decode_utf8=False))
+            ), {'col1': 1, 'col2': b'abc'}
+        )
+
+    def test_text_past_end(self):
+        for byte_output in ('hex', 'bytes', 'memoryview'):
+            data = ScaleBytes(b'abc', context=DecodeContext(byte_output=byte_output))
+            self.assertRaises(ValueError, ScaleDecoder.get_decoder_plan('VecU8Length16').decode, data)
+            self.assertEqual(data.offset, 0)
+
+    def test_skip_fixed_struct(self):
+        data = ScaleBytes('0x' + '00' * 40 + '04')
+        ScaleDecoder.get_decoder_plan('VestingSchedule').skip(data)
+        self.assertEqual(data.offset, 40)
+
+        data = ScaleBytes('0x' + '00' * 39)
+        self.assertRaises(ValueError, ScaleDecoder.get_decoder_plan('VestingSchedule').skip, data)
+        self.assertEqual(data.offset, 0)
+
+    def test_vec_integers(self):
+        obj = ScaleDecoder.get_decoder_plan('Vec<u32>').decode(ScaleBytes('0x0c010000000200000003000000'))
+        self.assertEqual(obj.value, [1, 2, 3])
+        self.assertEqual(obj.data.offset, 13)
+        self.assertEqual([element.value for element in obj.elements], [1, 2, 3])
+
+        obj = ScaleDecoder.get_decoder_plan('Vec<u32>').decode(
+            ScaleBytes('0x0c010000000200000003000000', context=DecodeContext(values_only=True))
+        )
+        self.assertEqual(obj.value, [1, 2, 3])
+        self.assertEqual(obj.elements, [])
+
+        self.assertRaises(
+            DecodeLimitExceededException, ScaleDecoder.get_decoder_plan('Vec<u32>').decode, ScaleBytes('0x0c0100000002')
+        )
+
+    def test_struct_encode(self):
+        obj = ScaleDecoder.get_decoder_class('(u32, H256)', ScaleBytes(bytearray()))
+        self.assertEqual(obj.encode((1, '0x' + '11' * 32)).data, bytearray.fromhex('01000000' + '11' * 32))
+
+        obj = ScaleDecoder.get_decoder_class('(u16, Vec<u8>)', ScaleBytes(bytearray()))
+        self.assertEqual(obj.encode({'col1': 2, 'col2': 'ab'}).data, bytearray.fromhex('0200086162'))
+
+        self.assertRaises(ValueError, obj.encode, (1,))
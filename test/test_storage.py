@@ -0,0 +1,194 @@
+# Python SCALE Codec Library
+#
+# Copyright 2018-2019 openAware BV (NL).
+# This file is part of Polkascan.
+#
+# Polkascan is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Polkascan is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Polkascan. If not, see <http://www.gnu.org/licenses/>.
+import unittest
+
+from scalecodec.base import ScaleBytes, RuntimeConfiguration
+from scalecodec.hashing import XXH64, blake2_256, twox_128, twox_256, get_hasher
+from scalecodec.metadata import MetadataDecoder
+
+from test.fixtures import metadata_v4_hex, metadata_v7_hex
+
+
+class TestHashing(unittest.TestCase):
+
+    def test_xxh64(self):
+        self.assertEqual(XXH64(b'').intdigest(), 0xef46db3751d8e999)
+        self.assertEqual(XXH64(b'abc').intdigest(), 0x44bc2cf5ad770999)
+
+    def test_xxh64_copy(self):
+        state = XXH64(b'Balances FreeBalance', seed=1)
+        copied_state = state.copy()
+        copied_state.update(b'\x01' * 40)
+
+        self.assertEqual(copied_state.intdigest(), XXH64(b'Balances FreeBalance' + b'\x01' * 40, seed=1).intdigest())
+        self.assertEqual(state.intdigest(), XXH64(b'Balances FreeBalance', seed=1).intdigest())
+
+    def test_twox(self):
+        self.assertEqual(twox_128(b'System').hex(), '26aa394eea5630e07c48ae0c9558cef7')
+        self.assertEqual(twox_128(b'Balances').hex(), 'c2261276cc9d1f8598ea4b6a74b15c2f')
+        self.assertEqual(twox_256(b'System')[0:16], twox_128(b'System'))
+
+    def test_blake2(self):
+        self.assertEqual(
+            blake2_256(b'').hex(), '0e5751c026e543b2e8ab2eb06099daa1d1e5df47778f7787faab45cdf12fe3a8'
+        )
+
+    def test_prefixed_hasher(self):
+        for name in ('Blake2_128', 'Blake2_256', 'Twox128', 'Twox256', 'Twox128Concat'):
+            self.assertEqual(get_hasher(name, b'prefix').hash(b'key'), get_hasher(name).hash(b'prefixkey'))
+
+        self.assertEqual(get_hasher('blake2_256').hash(b''), blake2_256(b''))
+        self.assertEqual(get_hasher('Twox128Concat').hash(b'key')[16:], b'key')
+        self.assertRaises(ValueError, get_hasher, 'Unknown')
+
+
+class TestStorageKeys(unittest.TestCase):
+
+    account_id = '0x' + '11' * 32
+
+    @classmethod
+    def setUpClass(cls):
+        cls.metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v4_hex))
+        cls.metadata_decoder.decode()
+
+    def test_plain_key(self):
+        self.assertEqual(
+            self.metadata_decoder.get_storage_key('Balances', 'TotalIssuance'),
+            '0x{}'.format(twox_128(b'Balances TotalIssuance').hex())
+        )
+
+    def test_map_key(self):
+        self.assertEqual(
+            self.metadata_decoder.get_storage_key('balances', 'FreeBalance', self.account_id),
+            '0x{}'.format(blake2_256(b'Balances FreeBalance' + b'\x11' * 32).hex())
+        )
+        self.assertEqual(
+            self.metadata_decoder.get_storage_key('System', 'BlockHash', 1),
+            '0x{}'.format(blake2_256(b'System BlockHash' + b'\x01\x00\x00\x00\x00\x00\x00\x00').hex())
+        )
+
+    def test_batch_keys(self):
+        account_ids = ['0x{:064x}'.format(n) for n in range(10)]
+
+        self.assertEqual(
+            self.metadata_decoder.get_storage_keys('Balances', 'FreeBalance', account_ids),
+            [self.metadata_decoder.get_storage_key('Balances', 'FreeBalance', a) for a in account_ids]
+        )
+
+    def test_key_builder_cache(self):
+        self.assertIs(
+            self.metadata_decoder.get_storage_key_builder('Balances', 'FreeBalance'),
+            self.metadata_decoder.get_storage_key_builder('Balances', 'FreeBalance')
+        )
+
+    def test_spec_version_key(self):
+        runtime_config = RuntimeConfiguration()
+        runtime_config.add_type_registry_range(1, 10, {'BlockNumber': 'U32'})
+
+        try:
+            self.assertEqual(
+                self.metadata_decoder.get_storage_key('System', 'BlockHash', 1, spec_version_id=5),
+                '0x{}'.format(blake2_256(b'System BlockHash' + b'\x01\x00\x00\x00').hex())
+            )
+        finally:
+            runtime_config.clear_type_registry_ranges()
+
+        # The builder cached before the type registry changed is not used anymore
+        self.assertEqual(
+            self.metadata_decoder.get_storage_key('System', 'BlockHash', 1, spec_version_id=5),
+            self.metadata_decoder.get_storage_key('System', 'BlockHash', 1)
+        )
+
+    def test_invalid_params(self):
+        self.assertRaises(ValueError, self.metadata_decoder.get_storage_key, 'Balances', 'FreeBalance')
+        self.assertRaises(ValueError, self.metadata_decoder.get_storage_key, 'Balances', 'Unknown')
+
+    def test_double_map_key(self):
+        metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v7_hex))
+        metadata_decoder.decode()
+
+        # Dbl: Blake2_128(key1: u32), Twox256(key2: u64)
+        self.assertEqual(
+            metadata_decoder.get_storage_key('Balances', 'Dbl', 1, 2),
+            '0x{}{}'.format(
+                get_hasher('Blake2_128').hash(b'BalancesPrefix Dbl\x01\x00\x00\x00').hex(),
+                twox_256(b'\x02\x00\x00\x00\x00\x00\x00\x00').hex()
+            )
+        )
+
+
+class TestStorageValues(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v4_hex))
+        cls.metadata_decoder.decode()
+
+    def test_decode_value(self):
+        self.assertEqual(
+            self.metadata_decoder.decode_storage('Balances', 'FreeBalance', '0xe8030000000000000000000000000000'), 1000
+        )
+        self.assertEqual(self.metadata_decoder.decode_storage('Timestamp', 'DidUpdate', bytes([1])), True)
+
+    def test_default_value(self):
+        self.assertEqual(self.metadata_decoder.decode_storage('Balances', 'FreeBalance', None), 0)
+        self.assertEqual(self.metadata_decoder.decode_storage('Timestamp', 'MinimumPeriod', None), 3)
+        self.assertIsNone(self.metadata_decoder.decode_storage('Timestamp', 'BlockPeriod', None))
+
+    def test_default_value_not_shared(self):
+        locks = self.metadata_decoder.decode_storage('Balances', 'Locks', None)
+        locks.append('modified')
+
+        self.assertEqual(self.metadata_decoder.decode_storage('Balances', 'Locks', None), [])
+
+    def test_decode_batch(self):
+        self.assertEqual(
+            self.metadata_decoder.decode_storage_batch(
+                'Balances', 'FreeBalance', ['0x01000000000000000000000000000000', None, bytes(16)]
+            ),
+            [1, 0, 0]
+        )
+
+    def test_value_decoder_cache(self):
+        self.assertIs(
+            self.metadata_decoder.get_storage_value_decoder('System', 'Number'),
+            self.metadata_decoder.get_storage_value_decoder('System', 'Number')
+        )
+
+    def test_spec_version_value(self):
+        runtime_config = RuntimeConfiguration()
+        runtime_config.add_type_registry_range(1, 10, {'Balance': 'U64'})
+
+        try:
+            value = self.metadata_decoder.decode_storage(
+                'Balances', 'FreeBalance', '0x0100000000000000', spec_version_id=5
+            )
+            self.assertEqual(value, 1)
+
+            metadata_decoder = MetadataDecoder(ScaleBytes(metadata_v4_hex), spec_version_id=5)
+            metadata_decoder.decode()
+            self.assertEqual(metadata_decoder.decode_storage('Balances', 'FreeBalance', '0x0100000000000000'), 1)
+        finally:
+            runtime_config.clear_type_registry_ranges()
+
+        self.assertEqual(
+            self.metadata_decoder.decode_storage('Balances', 'FreeBalance', '0x01000000000000000000000000000000'), 1
+        )
+
+    def test_unsupported_value_type(self):
+        self.assertRaises(NotImplementedError, self.metadata_decoder.decode_storage, 'Pow', 'GenesisPowTarget', None)
@@ -0,0 +1,260 @@
+# Python SCALE Codec Library
+#
+# Copyright 2018-2019 openAware BV (NL).
+# This file is part of Polkascan.
+#
+# Polkascan is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Polkascan is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Polkascan. If not, see <http://www.gnu.org/licenses/>.
+
+import inspect
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from importlib import import_module
+
+from scalecodec.base import ScaleDecoder, ScaleBytes, RuntimeConfiguration, DecodeContext, DecoderPlan
+from scalecodec.type_packs import type_packs
+
+type_registry = {
+    'types': {
+        'RegistryBalance': 'u64',
+        'RegistryTransfer': {
+            'type': 'struct',
+            'type_mapping': [
+                ['amount', 'RegistryBalance'],
+                ['memo', 'Option<Vec<u8>>'],
+                ['legs', 'Vec<RegistryLeg>'],
+            ]
+        },
+        'RegistryLeg': '(u8, Vec<(u16, u16)>)',
+        'RegistryQuad': '[u16; 4]',
+        'RegistryStatus': {'type': 'enum', 'value_list': ['Active', 'Retired']},
+        'RegistryCall': {
+            'type': 'enum',
+            'type_mapping': [['Noop', 'Null'], ['Pay', 'RegistryBalance'], ['Batch', 'Vec<RegistryStatus>']]
+        },
+        # Refers to an alias defined further on
+        'RegistryAmount': 'RegistryAlias',
+        'RegistryAlias': 'Compact<RegistryBalance>',
+    },
+    'versioning': [
+        {'spec_version': 9001, 'types': {'RegistryBalance': 'u8'}}
+    ]
+}
+
+
+class TestTypeRegistry(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        RuntimeConfiguration().load_type_registry(type_registry)
+
+    @classmethod
+    def tearDownClass(cls):
+        runtime_config = RuntimeConfiguration()
+        runtime_config.type_registry.pop('9001', None)
+        for type_string in type_registry['types']:
+            runtime_config.type_registry['default'].pop(type_string.lower(), None)
+        runtime_config.clear_decoder_plans()
+
+    def decode(self, type_string, data, **kwargs):
+        return ScaleDecoder.get_decoder_plan(type_string, **kwargs).decode(ScaleBytes(data)).value
+
+    def test_struct(self):
+        self.assertEqual(
+            self.decode('RegistryTransfer', '0x0a00000000000000010c6162630401080100020003000400'),
+            {'amount': 10, 'memo': 'abc', 'legs': [{'col1': 1, 'col2': [{'col1': 1, 'col2': 2}, {'col1': 3, 'col2': 4}]}]}
+        )
+
+    def test_fixed_array(self):
+        self.assertEqual(self.decode('RegistryQuad', '0x0100020003000400'), [1, 2, 3, 4])
+
+    def test_enum_value_list(self):
+        self.assertEqual(self.decode('RegistryStatus', '0x01'), 'Retired')
+
+    def test_enum_type_mapping(self):
+        self.assertEqual(self.decode('RegistryCall', '0x010500000000000000'), {'Pay': 5})
+        self.assertEqual(self.decode('RegistryCall', '0x02080100'), {'Batch': ['Retired', 'Active']})
+
+    def test_alias(self):
+        self.assertEqual(self.decode('RegistryAmount', '0x18'), 6)
+
+    def test_compiled_plans(self):
+        decoder_plan = RuntimeConfiguration().type_registry['default']['registrytransfer']
+
+        self.assertIsInstance(decoder_plan, DecoderPlan)
+        self.assertIs(ScaleDecoder.get_decoder_plan('RegistryTransfer'), decoder_plan)
+        self.assertEqual(ScaleDecoder.get_decoder_plan('Vec<RegistryTransfer>').decoder_class.__name__, 'Vec')
+
+    def test_spec_version_override(self):
+        self.assertEqual(self.decode('RegistryBalance', '0x0a', spec_version_id=9001), 10)
+        self.assertEqual(self.decode('RegistryBalance', '0x0a00000000000000'), 10)
+
+        # Nested types are resolved with the spec version of the decode context
+        obj = ScaleDecoder.get_decoder_plan('RegistryTransfer', spec_version_id=9001).decode(
+            ScaleBytes('0x0a0000', context=DecodeContext(spec_version_id=9001))
+        )
+        self.assertEqual(obj.value, {'amount': 10, 'memo': None, 'legs': []})
+
+    def test_unresolved_alias(self):
+        self.assertRaises(
+            NotImplementedError, RuntimeConfiguration().load_type_registry,
+            {'versioning': [{'spec_version': 9001, 'types': {'RegistryUnknown': 'UnknownType123'}}]}
+        )
+
+    def test_load_file(self):
+        registry_file = tempfile.NamedTemporaryFile('w', suffix='.json', delete=False)
+        json.dump({'versioning': [{'spec_version': 9001, 'types': {'RegistryStatus': 'u8'}}]}, registry_file)
+        registry_file.close()
+
+        try:
+            RuntimeConfiguration().load_type_registry_file(registry_file.name)
+        finally:
+            os.unlink(registry_file.name)
+
+        self.assertEqual(self.decode('RegistryStatus', '0x01', spec_version_id=9001), 1)
+        self.assertEqual(self.decode('RegistryStatus', '0x01'), 'Retired')
+
+
+class TestTypeRegistryRanges(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        RuntimeConfiguration().load_type_registry({
+            'types': {'RangeBalance': 'u64'},
+            'versioning': [
+                {'spec_version_range': [10, 19], 'types': {'RangeBalance': 'u8', 'RangeAmount': 'RangeBalance'}},
+                {'spec_version_range': [15, None], 'types': {'RangeBalance': 'u16'}},
+                {'spec_version': 30, 'types': {'RangeBalance': 'u32'}},
+            ]
+        })
+
+    @classmethod
+    def tearDownClass(cls):
+        runtime_config = RuntimeConfiguration()
+        runtime_config.type_registry.pop('30', None)
+        runtime_config.type_registry['default'].pop('rangebalance', None)
+        runtime_config.clear_type_registry_ranges()
+
+    def get_decoder_class_name(self, spec_version_id):
+        return RuntimeConfiguration().get_decoder_class('RangeBalance', spec_version_id).decoder_class.__name__
+
+    def test_range_lookup(self):
+        self.assertEqual(self.get_decoder_class_name(9), 'U64')
+        self.assertEqual(self.get_decoder_class_name(10), 'U8')
+        self.assertEqual(self.get_decoder_class_name('14'), 'U8')
+        # Overlapping range listed last takes precedence
+        self.assertEqual(self.get_decoder_class_name(15), 'U16')
+        self.assertEqual(self.get_decoder_class_name(20), 'U16')
+        self.assertEqual(self.get_decoder_class_name(1000), 'U16')
+        # Exact spec version takes precedence over ranges
+        self.assertEqual(self.get_decoder_class_name(30), 'U32')
+        self.assertEqual(self.get_decoder_class_name('default'), 'U64')
+
+    def test_range_alias(self):
+        obj = ScaleDecoder.get_decoder_plan('RangeAmount', spec_version_id=12).decode(ScaleBytes('0x05'))
+        self.assertEqual(obj.value, 5)
+        self.assertRaises(NotImplementedError, ScaleDecoder.get_decoder_plan, 'RangeAmount', spec_version_id=20)
+
+    def test_view_memoized(self):
+        runtime_config = RuntimeConfiguration()
+
+        view = runtime_config.get_spec_version_view(16)
+        self.assertIs(runtime_config.get_spec_version_view('16'), view)
+
+        runtime_config.clear_decoder_plans()
+        self.assertIsNot(runtime_config.get_spec_version_view(16), view)
+
+    def test_invalid_range(self):
+        self.assertRaises(ValueError, RuntimeConfiguration().add_type_registry_range, 20, 10, {})
+
+    def test_range_type_strings(self):
+        runtime_config = RuntimeConfiguration()
+        runtime_config.add_type_registry_range(40, 49, {'RangeBalance': 'u8'})
+
+        try:
+            obj = ScaleDecoder.get_decoder_plan('RangeBalance', spec_version_id=45).decode(ScaleBytes('0x05'))
+            self.assertEqual(obj.value, 5)
+        finally:
+            runtime_config.type_registry_ranges.pop()
+            runtime_config.build_type_registry_ranges()
+
+
+class TestTypePacks(unittest.TestCase):
+
+    def test_index_complete(self):
+        for pack_name, type_strings in type_packs.items():
+            module = import_module('scalecodec.type_packs.{}'.format(pack_name))
+
+            provided = set()
+            for cls in vars(module).values():
+                if inspect.isclass(cls) and cls.__module__ == module.__name__:
+                    provided.add(cls.__name__)
+                    if vars(cls).get('type_string'):
+                        provided.add(cls.type_string)
+
+            self.assertEqual(set(type_strings), provided, pack_name)
+
+    def test_loaded_on_lookup(self):
+        code = '\n'.join([
+            'import sys',
+            'from scalecodec.base import RuntimeConfiguration, ScaleDecoder',
+            'RuntimeConfiguration()',
+            'print(sorted(m for m in sys.modules if m.startswith("scalecodec.type_packs.")))',
+            'ScaleDecoder.get_decoder_plan("Order<Balance, AccountId>")',
+            'print(sorted(m for m in sys.modules if m.startswith("scalecodec.type_packs.")))',
+        ])
+        output = subprocess.run(
+            [sys.executable, '-c', code], cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            stdout=subprocess.PIPE, check=True
+        ).stdout.decode().split('\n')
+
+        self.assertEqual(output[0], '[]')
+        self.assertEqual(output[1], "['scalecodec.type_packs.robonomics']")
+
+    def test_imported_pack_not_registered_up_front(self):
+        code = '\n'.join([
+            'import scalecodec.type_packs.robonomics',
+            'from scalecodec.base import RuntimeConfiguration, ScaleDecoder',
+            'print("order" in RuntimeConfiguration().type_registry["default"])',
+            'ScaleDecoder.get_decoder_plan("Order<Balance, AccountId>")',
+            'print("order" in RuntimeConfiguration().type_registry["default"])',
+        ])
+        output = subprocess.run(
+            [sys.executable, '-c', code], cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            stdout=subprocess.PIPE, check=True
+        ).stdout.decode().split('\n')
+
+        self.assertEqual(output[0:2], ['False', 'True'])
+
+    def test_decode(self):
+        obj = ScaleDecoder.get_decoder_plan('Liability<Balance, AccountId>').decode(
+            ScaleBytes('0x04010402' + '00' * 15 + '01' + '00' * 32 + '00' * 32 + '00')
+        )
+        self.assertEqual(obj.value['result'], None)
+        self.assertEqual(obj.value['order']['cost'], 2 ** 120)
+
+    def test_module_attribute(self):
+        from scalecodec import Order, CompactU32
+        from scalecodec.type_packs.robonomics import Order as PackOrder
+
+        self.assertIs(Order, PackOrder)
+        self.assertEqual(CompactU32.type_string, 'Compact<u32>')
+        self.assertRaises(ImportError, exec, 'from scalecodec import UnknownType123')
+
+
+if __name__ == '__main__':
+    unittest.main()